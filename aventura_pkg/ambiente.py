@@ -0,0 +1,349 @@
+# ambiente
+"""
+Módulo com ambientes de aprendizado por reforço no estilo Gym.
+
+`AmbienteLabirinto` expõe uma única partida com `reset()` e `step(acao)`,
+usando as mesmas regras e pontuação de `Partida`. `AmbienteVetorizado`
+mantém K labirintos independentes empilhados num único `bytearray` e
+avança todos de uma vez; observações, recompensas e indicadores de fim
+voltam como vetores compactos (`bytearray`/`array`), que podem ser lidos
+sem cópia com `numpy.frombuffer` por quem usa NumPy.
+
+A observação pode ser a janela (2 * raio + 1)² ao redor do jogador
+('janela') ou o labirinto inteiro ('grade'), com os códigos de célula de
+`aventura_pkg.grade`. Na janela o jogador está sempre no centro; na grade,
+a célula dele é marcada com `JOGADOR`.
+
+A recompensa de cada passo é a variação da pontuação (-CUSTO_MOVIMENTO por
+movimento); ao chegar à saída, o agente recebe também a pontuação inicial
+da dificuldade, de modo que o retorno de um episódio vencido é exatamente
+a pontuação final do jogo.
+"""
+import random
+from array import array
+
+from .grade import MazeGrid, PAREDE, SAIDA
+from .labirinto import criar_labirinto
+from .partida import CUSTO_MOVIMENTO, Partida, pontuacao_inicial
+from .simulacao import ACOES, CODIGOS_ACOES
+
+OBSERVACOES = ("janela", "grade")
+
+# Código da posição do jogador nas observações (os de `grade` vão de 0 a 4)
+JOGADOR = 5
+
+
+def _codigo_acao(acao):
+    """Aceita o código (0 a 3) ou o nome da ação e devolve o código."""
+    if isinstance(acao, str):
+        try:
+            return CODIGOS_ACOES[acao]
+        except KeyError:
+            raise ValueError("Ação inválida.") from None
+    if not 0 <= acao < len(ACOES):
+        raise ValueError("Ação inválida.")
+    return acao
+
+
+def _acolchoar(labirinto, borda):
+    """
+    Copia o labirinto cercado por `borda` células de parede.
+
+    Com a moldura, as janelas perto das bordas são simples fatias e
+    nenhum movimento sai do tabuleiro.
+
+    Returns:
+        bytearray: Células do labirinto acolchoado, linha após linha.
+    """
+    colunas = labirinto.colunas + 2 * borda
+    tabuleiro = bytearray(colunas * borda)  # PAREDE == 0
+    lateral = bytes(borda)
+    for i in range(labirinto.linhas):
+        tabuleiro += lateral + labirinto.linha_bytes(i) + lateral
+    tabuleiro += bytes(colunas * borda)
+    return tabuleiro
+
+
+def _janela(tabuleiro, inicio, largura_tabuleiro, raio):
+    """Recorta a janela (2 * raio + 1)² centrada na célula `inicio` do tabuleiro acolchoado."""
+    lado = 2 * raio + 1
+    canto = inicio - raio * largura_tabuleiro - raio
+    return b"".join(
+        tabuleiro[canto + d * largura_tabuleiro:canto + d * largura_tabuleiro + lado]
+        for d in range(lado)
+    )
+
+
+def _validar(observacao, raio):
+    """Confere o tipo de observação e o raio da janela."""
+    if observacao not in OBSERVACOES:
+        raise ValueError("Tipo de observação inválido.")
+    if raio < 1:
+        raise ValueError("O raio da janela deve ser pelo menos 1.")
+
+
+class AmbienteLabirinto:
+    """
+    Ambiente de uma única partida, com a interface `reset()`/`step()` do Gym.
+
+    Args:
+        dificuldade (str): Nível de dificuldade, usado no tamanho e na pontuação.
+        algoritmo (str): Algoritmo de geração do labirinto.
+        observacao (str): 'janela' ou 'grade'.
+        raio (int): Raio da janela observada.
+        max_passos (int, opcional): Passos até o episódio ser truncado; por
+            padrão, quatro vezes o número de células do labirinto.
+        semente (int, opcional): Semente da sequência de labirintos gerados.
+        usar_cache (bool): Se True, os labirintos gerados passam pelo cache em
+            disco; desligado por padrão, já que cada episódio usa um labirinto novo.
+    """
+
+    def __init__(self, dificuldade="facil", algoritmo="escavacao", observacao="janela", raio=2, max_passos=None,
+                 semente=None, usar_cache=False):
+        _validar(observacao, raio)
+        self._aleatorio = random.Random(semente)
+        self.usar_cache = usar_cache
+        self.dificuldade = dificuldade
+        self.algoritmo = algoritmo
+        self.observacao = observacao
+        self.raio = raio
+        self.max_passos = max_passos
+        self.partida = None
+        self.passos = 0
+
+    def reset(self, labirinto=None):
+        """
+        Começa um novo episódio.
+
+        Args:
+            labirinto (MazeGrid | list[list[str]], opcional): Labirinto a usar;
+                por padrão, um novo é gerado.
+
+        Returns:
+            tuple: (observação, info).
+        """
+        if labirinto is None:
+            labirinto = self._novo_labirinto()
+        elif not isinstance(labirinto, MazeGrid):
+            labirinto = MazeGrid.from_lists(labirinto)
+        self.partida = Partida(labirinto, self.dificuldade)
+        self.passos = 0
+        self._tabuleiro = _acolchoar(labirinto, self.raio)
+        self._limite = self.max_passos or 4 * labirinto.linhas * labirinto.colunas
+        return self._observar(), {"pontuacao": self.partida.pontuacao}
+
+    def _novo_labirinto(self):
+        """Gera o próximo labirinto da sequência determinada pela semente do ambiente."""
+        return criar_labirinto(self.dificuldade, self.algoritmo, self._aleatorio.getrandbits(32), self.usar_cache)
+
+    def step(self, acao):
+        """
+        Aplica uma ação.
+
+        Args:
+            acao (int | str): Código (0=up, 1=down, 2=left, 3=right) ou nome da ação.
+
+        Returns:
+            tuple: (observação, recompensa, terminado, truncado, info).
+        """
+        if self.partida is None or self.partida.fim_jogo:
+            raise ValueError("Chame reset() antes de step().")
+        partida = self.partida
+        antes = partida.pontuacao
+        partida.mover(ACOES[_codigo_acao(acao)])
+        self.passos += 1
+
+        recompensa = partida.pontuacao - antes
+        terminado = partida.fim_jogo
+        if terminado:
+            recompensa += pontuacao_inicial(self.dificuldade)
+        truncado = not terminado and self.passos >= self._limite
+        if truncado:
+            partida.encerrar()
+        return self._observar(), recompensa, terminado, truncado, {"pontuacao": partida.pontuacao}
+
+    def _observar(self):
+        """Monta a observação do estado atual."""
+        lab = self.partida.labirinto
+        i, j = self.partida.posicao
+        if self.observacao == "janela":
+            largura = lab.colunas + 2 * self.raio
+            return _janela(self._tabuleiro, (i + self.raio) * largura + j + self.raio, largura, self.raio)
+        grade = bytearray(lab.dados)
+        grade[i * lab.colunas + j] = JOGADOR
+        return bytes(grade)
+
+
+class AmbienteVetorizado:
+    """
+    K ambientes independentes avançados em lote.
+
+    Os K labirintos, acolchoados com paredes, ficam num único `bytearray`;
+    as posições são índices nesse vetor, então um passo é um único laço
+    sobre as sessões, sem objetos por ambiente. Episódios terminados ou
+    truncados recomeçam sozinhos num labirinto novo, e a observação
+    devolvida já é a do novo episódio.
+
+    Args:
+        num_ambientes (int): Quantidade K de labirintos simultâneos.
+        dificuldade (str): Nível de dificuldade de todos os labirintos.
+        algoritmo (str): Algoritmo de geração dos labirintos.
+        observacao (str): 'janela' ou 'grade'.
+        raio (int): Raio da janela observada.
+        max_passos (int, opcional): Passos até um episódio ser truncado.
+        semente (int, opcional): Semente da sequência de labirintos gerados.
+        usar_cache (bool): Se True, os labirintos gerados passam pelo cache em
+            disco; desligado por padrão, já que cada episódio usa um labirinto novo.
+    """
+
+    def __init__(self, num_ambientes, dificuldade="facil", algoritmo="escavacao", observacao="janela", raio=2,
+                 max_passos=None, semente=None, usar_cache=False):
+        _validar(observacao, raio)
+        self._aleatorio = random.Random(semente)
+        self.usar_cache = usar_cache
+        if num_ambientes < 1:
+            raise ValueError("É preciso pelo menos um ambiente.")
+        self.num_ambientes = num_ambientes
+        self.dificuldade = dificuldade
+        self.algoritmo = algoritmo
+        self.observacao = observacao
+        self.raio = raio
+        self.max_passos = max_passos
+        self.tabuleiros = None
+
+    @property
+    def tamanho_observacao(self):
+        """int: Bytes da observação de cada ambiente."""
+        if self.observacao == "janela":
+            return (2 * self.raio + 1) ** 2
+        return self.linhas * self.colunas
+
+    def reset(self, labirintos=None):
+        """
+        Começa novos episódios em todos os ambientes.
+
+        Args:
+            labirintos (list, opcional): K labirintos do mesmo tamanho a usar;
+                por padrão, novos labirintos são gerados.
+
+        Returns:
+            tuple: (observações concatenadas em um `bytearray`, info).
+        """
+        if labirintos is None:
+            labirintos = [self._novo_labirinto() for _ in range(self.num_ambientes)]
+        elif len(labirintos) != self.num_ambientes:
+            raise ValueError("É preciso um labirinto por ambiente.")
+        labirintos = [lab if isinstance(lab, MazeGrid) else MazeGrid.from_lists(lab) for lab in labirintos]
+
+        self.linhas, self.colunas = labirintos[0].linhas, labirintos[0].colunas
+        if any((lab.linhas, lab.colunas) != (self.linhas, self.colunas) for lab in labirintos):
+            raise ValueError("Todos os labirintos devem ter o mesmo tamanho.")
+        self.largura = self.colunas + 2 * self.raio
+        self.tamanho_tabuleiro = (self.linhas + 2 * self.raio) * self.largura
+        self._limite = self.max_passos or 4 * self.linhas * self.colunas
+
+        self.tabuleiros = bytearray().join(_acolchoar(lab, self.raio) for lab in labirintos)
+        self.posicoes = array("q", [0]) * self.num_ambientes
+        self.pontuacoes = array("q", [0]) * self.num_ambientes
+        self.passos = array("q", [0]) * self.num_ambientes
+        for k in range(self.num_ambientes):
+            self._reiniciar(k)
+        return self._observar(), {"pontuacoes": array("q", self.pontuacoes)}
+
+    def _novo_labirinto(self):
+        """Gera o próximo labirinto da sequência determinada pela semente do ambiente."""
+        return criar_labirinto(self.dificuldade, self.algoritmo, self._aleatorio.getrandbits(32), self.usar_cache)
+
+    def _reiniciar(self, k, labirinto=None):
+        """Recoloca o ambiente `k` no início, opcionalmente trocando o labirinto."""
+        inicio = k * self.tamanho_tabuleiro
+        if labirinto is not None:
+            self.tabuleiros[inicio:inicio + self.tamanho_tabuleiro] = _acolchoar(labirinto, self.raio)
+        self.posicoes[k] = inicio + (1 + self.raio) * self.largura + 1 + self.raio
+        self.pontuacoes[k] = pontuacao_inicial(self.dificuldade)
+        self.passos[k] = 0
+
+    def step(self, acoes):
+        """
+        Aplica uma ação a cada ambiente.
+
+        Args:
+            acoes (Sequence[int]): Um código por ambiente (0=up, 1=down,
+                2=left, 3=right), por exemplo um `bytes` ou `array`.
+
+        Returns:
+            tuple: (observações, recompensas, terminados, truncados, info).
+            As observações vêm concatenadas num `bytearray` de K *
+            `tamanho_observacao` bytes; recompensas num `array('q')`;
+            terminados e truncados em `bytearray` com 0 ou 1. `info` traz
+            as pontuações ao fim do passo, antes dos reinícios automáticos.
+        """
+        if self.tabuleiros is None:
+            raise ValueError("Chame reset() antes de step().")
+        if len(acoes) != self.num_ambientes:
+            raise ValueError("É preciso uma ação por ambiente.")
+        if min(acoes) < 0 or max(acoes) >= len(ACOES):
+            raise ValueError("Ação inválida.")
+
+        tabuleiros = self.tabuleiros
+        deslocamentos = (-self.largura, self.largura, -1, 1)
+        posicoes = self.posicoes
+        pontuacoes = self.pontuacoes
+        passos = self.passos
+        limite = self._limite
+        premio = pontuacao_inicial(self.dificuldade)
+        recompensas = array("q", [0]) * self.num_ambientes
+        terminados = bytearray(self.num_ambientes)
+        truncados = bytearray(self.num_ambientes)
+
+        for k, acao in enumerate(acoes):
+            passos[k] += 1
+            # A moldura de paredes impede que o movimento saia do tabuleiro
+            q = posicoes[k] + deslocamentos[acao]
+            celula = tabuleiros[q]
+            if celula != PAREDE:
+                posicoes[k] = q
+                pontuacoes[k] -= CUSTO_MOVIMENTO
+                recompensas[k] = -CUSTO_MOVIMENTO
+                if celula == SAIDA:
+                    recompensas[k] += premio
+                    terminados[k] = 1
+                    continue
+            if passos[k] >= limite:
+                truncados[k] = 1
+
+        info = {"pontuacoes": array("q", pontuacoes)}
+        for k in range(self.num_ambientes):
+            if terminados[k] or truncados[k]:
+                self._reiniciar(k, self._novo_labirinto())
+        return self._observar(), recompensas, terminados, truncados, info
+
+    def _observar(self):
+        """Monta as observações de todos os ambientes num único `bytearray`."""
+        raio = self.raio
+        largura = self.largura
+        if self.observacao == "janela":
+            tabuleiros = self.tabuleiros
+            lado = 2 * raio + 1
+            recuo = raio * largura + raio
+            linhas = range(0, lado * largura, largura)
+            # Uma única junção de fatias para todas as janelas
+            return bytearray().join(
+                tabuleiros[canto + d:canto + d + lado]
+                for canto in [p - recuo for p in self.posicoes]
+                for d in linhas
+            )
+
+        # Labirinto inteiro, sem a moldura, com o jogador marcado
+        tabuleiros = self.tabuleiros
+        colunas = self.colunas
+        tamanho = self.linhas * colunas
+        observacoes = bytearray().join(
+            tabuleiros[base + (i + raio) * largura + raio:base + (i + raio) * largura + raio + colunas]
+            for base in range(0, len(tabuleiros), self.tamanho_tabuleiro)
+            for i in range(self.linhas)
+        )
+        for k, p in enumerate(self.posicoes):
+            i, j = divmod(p - k * self.tamanho_tabuleiro, largura)
+            observacoes[k * tamanho + (i - raio) * colunas + j - raio] = JOGADOR
+        return observacoes
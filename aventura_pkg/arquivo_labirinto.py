@@ -0,0 +1,271 @@
+# arquivo_labirinto
+"""
+Módulo com o formato binário de arquivos de labirinto.
+
+O arquivo começa com um cabeçalho de tamanho fixo (dimensões, início,
+saída e semente) seguido de um bit por célula (1 = passagem, 0 = parede).
+Cada linha começa num byte novo, então a linha `i` fica numa posição
+conhecida do arquivo. Um labirinto de 10.000x10.000 ocupa cerca de 12 MB.
+
+`carregar_labirinto` abre o arquivo com `mmap` sem ler o corpo: o custo
+não depende do tamanho do labirinto, e o sistema só traz para a memória
+as páginas das linhas efetivamente consultadas, como as da janela ao
+redor do jogador.
+"""
+import mmap
+import os
+import struct
+
+from .grade import SIMBOLOS, MazeGrid, SAIDA, desempacotar_bits, empacotar_bits
+
+ASSINATURA = b"AVLF"
+VERSAO_FORMATO = 1
+
+# Assinatura, versão, indicadores, linhas, colunas, início (i, j), saída (i, j) e semente
+_CABECALHO = struct.Struct("<4sHHIIIIIIQ")
+_TEM_SEMENTE = 1
+
+# Maior semente que cabe no cabeçalho; sementes fora de 0..MAIOR_SEMENTE ficam sem registro
+MAIOR_SEMENTE = 2 ** 64 - 1
+
+
+def bytes_por_linha(colunas):
+    """Retorna quantos bytes cada linha ocupa no corpo do arquivo."""
+    return (colunas + 7) // 8
+
+
+class EscritorBinario:
+    """
+    Grava um arquivo de labirinto linha a linha, sem guardar o labirinto inteiro.
+
+    O arquivo é escrito com outro nome e só substitui o destino em `fechar()`,
+    para que nenhum leitor veja um labirinto pela metade. Se uma linha
+    escrita contiver a saída ('F'), a posição dela vai para o cabeçalho.
+
+    Args:
+        caminho (str): Arquivo de destino.
+        linhas (int): Número de linhas do labirinto.
+        colunas (int): Número de colunas do labirinto.
+        inicio (tuple): Posição inicial do jogador.
+        fim (tuple, opcional): Posição da saída; por padrão, a encontrada nas
+            linhas escritas, ou (linhas - 2, colunas - 2).
+        semente (int, opcional): Semente com que o labirinto foi gerado; fora
+            de 0..MAIOR_SEMENTE, o arquivo fica sem semente.
+    """
+
+    def __init__(self, caminho, linhas, colunas, inicio=(1, 1), fim=None, semente=None):
+        if semente is not None and not 0 <= semente <= MAIOR_SEMENTE:
+            semente = None
+        self.caminho = caminho
+        self.linhas = linhas
+        self.colunas = colunas
+        self.inicio = tuple(inicio)
+        self.fim = fim
+        self.semente = semente
+        self.escritas = 0
+        try:
+            cabecalho = self._cabecalho()  # valida os campos antes de criar o arquivo
+        except struct.error:
+            raise ValueError("Dimensões ou posições fora do formato do arquivo.") from None
+        self._temporario = f"{caminho}.{os.getpid()}.tmp"
+        self._arquivo = open(self._temporario, "wb")
+        try:
+            self._arquivo.write(cabecalho)
+        except BaseException:
+            self._descartar()
+            raise
+
+    def _cabecalho(self):
+        """Monta o cabeçalho com os dados conhecidos até agora."""
+        fim = self.fim or (self.linhas - 2, self.colunas - 2)
+        return _CABECALHO.pack(
+            ASSINATURA, VERSAO_FORMATO, _TEM_SEMENTE if self.semente is not None else 0,
+            self.linhas, self.colunas, *self.inicio, *fim, self.semente or 0,
+        )
+
+    def escrever_linha(self, codigos):
+        """
+        Acrescenta a próxima linha do labirinto.
+
+        Args:
+            codigos (bytes | bytearray): Códigos das `colunas` células da linha.
+        """
+        if len(codigos) != self.colunas:
+            raise ValueError("Tamanho da linha não corresponde às colunas do labirinto.")
+        if self.escritas >= self.linhas:
+            raise ValueError("Todas as linhas do labirinto já foram escritas.")
+        if self.fim is None:
+            j = codigos.find(SAIDA)
+            if j != -1:
+                self.fim = (self.escritas, j)
+        self._arquivo.write(empacotar_bits(codigos))
+        self.escritas += 1
+
+    def fechar(self):
+        """Conclui o arquivo, que passa a existir com o nome de destino."""
+        if self.escritas != self.linhas:
+            self._descartar()
+            raise ValueError("O labirinto foi fechado antes de todas as linhas serem escritas.")
+        self._arquivo.seek(0)
+        self._arquivo.write(self._cabecalho())
+        self._arquivo.close()
+        os.replace(self._temporario, self.caminho)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, rastro):
+        if tipo is None:
+            self.fechar()
+        else:
+            self._descartar()
+
+    def _descartar(self):
+        """Fecha e apaga o arquivo temporário, sem tocar no destino."""
+        self._arquivo.close()
+        os.remove(self._temporario)
+
+
+class _LinhaMapeada:
+    """Visão de uma linha do `LabirintoMapeado`; cada célula consultada lê um único byte do arquivo."""
+
+    __slots__ = ('_labirinto', '_i')
+
+    def __init__(self, labirinto, i):
+        self._labirinto = labirinto
+        self._i = i
+
+    def __len__(self):
+        return self._labirinto.colunas
+
+    def __getitem__(self, j):
+        colunas = self._labirinto.colunas
+        if j < 0:
+            j += colunas
+        if not 0 <= j < colunas:
+            raise IndexError("Coluna fora do labirinto.")
+        return SIMBOLOS[self._labirinto.celula(self._i, j)]
+
+    def __iter__(self):
+        return (SIMBOLOS[codigo] for codigo in self._labirinto.linha_bytes(self._i))
+
+
+class LabirintoMapeado:
+    """
+    Labirinto lido sob demanda de um arquivo mapeado em memória.
+
+    Aceita `lab[i][j]`, `len()` e iteração por linhas, como o `MazeGrid`,
+    mas cada linha só é decodificada quando consultada. Para alterar o
+    labirinto ou resolvê-lo de uma vez, use `copy()`, que devolve um
+    `MazeGrid` completo em memória.
+
+    Args:
+        caminho (str): Arquivo no formato binário do jogo.
+    """
+
+    def __init__(self, caminho):
+        with open(caminho, "rb") as f:
+            self._mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            assinatura, versao, indicadores, linhas, colunas, ii, ij, fi, fj, semente = (
+                _CABECALHO.unpack_from(self._mapa)
+            )
+        except struct.error:
+            self._mapa.close()
+            raise ValueError("Arquivo de labirinto inválido.") from None
+        if assinatura != ASSINATURA or versao != VERSAO_FORMATO:
+            self._mapa.close()
+            raise ValueError("Arquivo de labirinto inválido ou de outra versão.")
+        if len(self._mapa) != _CABECALHO.size + linhas * bytes_por_linha(colunas):
+            self._mapa.close()
+            raise ValueError("Arquivo de labirinto incompleto.")
+
+        self.linhas = linhas
+        self.colunas = colunas
+        self.inicio = (ii, ij)
+        self.fim = (fi, fj)
+        self.semente = semente if indicadores & _TEM_SEMENTE else None
+        self._bytes_linha = bytes_por_linha(colunas)
+
+    def linha_bytes(self, i):
+        """Retorna os códigos da linha `i` como `bytes`, com a saída marcada."""
+        inicio = _CABECALHO.size + i * self._bytes_linha
+        codigos = desempacotar_bits(self._mapa[inicio:inicio + self._bytes_linha], self.colunas)
+        if i == self.fim[0]:
+            codigos[self.fim[1]] = SAIDA
+        return bytes(codigos)
+
+    def celula(self, i, j):
+        """Retorna o código numérico da célula (i, j), lendo um único byte do arquivo."""
+        if (i, j) == self.fim:
+            return SAIDA
+        byte = self._mapa[_CABECALHO.size + i * self._bytes_linha + j // 8]
+        return (byte >> (7 - j % 8)) & 1  # PAREDE == 0, LIVRE == 1
+
+    def copy(self):
+        """Lê o labirinto inteiro e devolve um `MazeGrid` independente do arquivo."""
+        dados = bytearray().join(self.linha_bytes(i) for i in range(self.linhas))
+        return MazeGrid(self.linhas, self.colunas, dados)
+
+    def fechar(self):
+        """Libera o mapeamento do arquivo."""
+        self._mapa.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, rastro):
+        self.fechar()
+
+    def __len__(self):
+        return self.linhas
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.linhas
+        if not 0 <= i < self.linhas:
+            raise IndexError("Linha fora do labirinto.")
+        return _LinhaMapeada(self, i)
+
+    def __iter__(self):
+        for i in range(self.linhas):
+            yield self[i]
+
+
+def salvar_labirinto(labirinto, caminho, inicio=(1, 1), semente=None):
+    """
+    Grava um labirinto no formato binário do jogo.
+
+    Args:
+        labirinto (MazeGrid | list[list[str]]): Estrutura do labirinto, com a saída 'F'.
+        caminho (str): Arquivo de destino.
+        inicio (tuple): Posição inicial do jogador.
+        semente (int, opcional): Semente com que o labirinto foi gerado.
+    """
+    if not isinstance(labirinto, MazeGrid):
+        labirinto = MazeGrid.from_lists(labirinto)
+    fim = labirinto.encontrar('F')
+    if fim is None:
+        raise ValueError("O labirinto não tem saída.")
+    with EscritorBinario(caminho, labirinto.linhas, labirinto.colunas, inicio, fim, semente) as escritor:
+        for i in range(labirinto.linhas):
+            escritor.escrever_linha(labirinto.linha_bytes(i))
+
+
+def eh_arquivo_binario(caminho):
+    """Indica se o arquivo começa com a assinatura do formato binário."""
+    with open(caminho, "rb") as f:
+        return f.read(len(ASSINATURA)) == ASSINATURA
+
+
+def carregar_labirinto(caminho):
+    """
+    Abre um arquivo de labirinto sem ler o corpo.
+
+    Args:
+        caminho (str): Arquivo no formato binário do jogo.
+
+    Returns:
+        LabirintoMapeado: Labirinto lido sob demanda do arquivo.
+    """
+    return LabirintoMapeado(caminho)
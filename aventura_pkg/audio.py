@@ -0,0 +1,202 @@
+# audio
+"""
+Módulo responsável pelos efeitos sonoros do jogo.
+
+O pygame só é importado e o mixer só é inicializado no primeiro som
+efetivamente tocado; cada arquivo é decodificado na primeira vez em que
+é usado e o PCM resultante fica guardado em disco, para que as próximas
+execuções não precisem decodificar o MP3 de novo. Com o som desativado,
+`SemSom` não faz nada e nunca toca no pygame.
+
+Os pedidos de som são apenas enfileirados por quem chama `tocar`; uma
+thread própria carrega e toca os sons em canais reservados para cada
+efeito, e passos muito próximos uns dos outros são agrupados em um só.
+"""
+import hashlib
+import os
+import queue
+import threading
+import time
+
+from .cache_disco import gravar_atomico, pasta_cache
+
+PASTA_SONS = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "sons"))
+
+# Nome do efeito -> arquivo dentro de PASTA_SONS
+ARQUIVOS_SONS = {
+    "passo": "passo.mp3",
+    "vitoria": "vitoria.mp3",
+    "saida": "saida.mp3",
+}
+
+# Canais do mixer reservados para cada efeito
+CANAIS_SONS = {
+    "passo": 2,
+    "vitoria": 1,
+    "saida": 1,
+}
+
+# Intervalo mínimo, em segundos, entre dois sons do mesmo efeito
+INTERVALO_MINIMO = {
+    "passo": 0.08,
+}
+
+
+class SemSom:
+    """Substituto do gerenciador de áudio quando o som está desativado."""
+
+    ativo = False
+
+    def tocar(self, nome):
+        """Não faz nada."""
+
+    def encerrar(self):
+        """Não faz nada."""
+
+
+class GerenciadorAudio:
+    """
+    Toca os efeitos sonoros, inicializando o mixer do pygame sob demanda.
+
+    Se não houver dispositivo de áudio, o gerenciador se desativa sozinho
+    em vez de interromper o jogo.
+
+    Args:
+        pasta (str): Pasta com os arquivos de som.
+        pasta_pcm (str, opcional): Pasta do cache de PCM decodificado; por
+            padrão, uma subpasta do cache do usuário.
+    """
+
+    ativo = True
+
+    def __init__(self, pasta=PASTA_SONS, pasta_pcm=None):
+        self.pasta = pasta
+        self.pasta_pcm = pasta_pcm
+        self._mixer = None
+        self._sons = {}
+        self._canais = {}  # efeito -> lista de canais reservados
+        self._proximo_canal = {}
+        self._ultimo_pedido = {}
+        self._fila = queue.SimpleQueue()
+        self._thread = None
+        self._trava = threading.Lock()
+
+    def _iniciar_mixer(self):
+        """Importa o pygame, inicializa apenas o mixer e reserva os canais de cada efeito."""
+        if self._mixer is None:
+            import pygame.mixer
+            pygame.mixer.init()
+            total = sum(CANAIS_SONS.values())
+            pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), total))
+            pygame.mixer.set_reserved(total)
+            indice = 0
+            for nome, quantidade in CANAIS_SONS.items():
+                self._canais[nome] = [pygame.mixer.Channel(indice + k) for k in range(quantidade)]
+                self._proximo_canal[nome] = 0
+                indice += quantidade
+            self._mixer = pygame.mixer
+        return self._mixer
+
+    def _arquivo_pcm(self, caminho):
+        """
+        Calcula o caminho do PCM em cache para um arquivo de som.
+
+        A chave inclui o tamanho e a data do arquivo original e o formato do
+        mixer, já que o PCM decodificado depende de ambos.
+        """
+        info = os.stat(caminho)
+        chave = f"{os.path.abspath(caminho)}|{info.st_size}|{info.st_mtime_ns}|{self._mixer.get_init()}"
+        nome = hashlib.sha256(chave.encode("utf-8")).hexdigest()[:32]
+        pasta = self.pasta_pcm or pasta_cache("pcm")
+        return os.path.join(pasta, f"{nome}.pcm")
+
+    def carregar(self, nome):
+        """
+        Retorna o som pedido, lendo o PCM do cache ou decodificando o arquivo.
+
+        Args:
+            nome (str): Nome do efeito ('passo', 'vitoria' ou 'saida').
+
+        Returns:
+            pygame.mixer.Sound: Som pronto para tocar.
+        """
+        som = self._sons.get(nome)
+        if som is None:
+            mixer = self._iniciar_mixer()
+            caminho = os.path.join(self.pasta, ARQUIVOS_SONS[nome])
+            arquivo_pcm = None
+            try:
+                arquivo_pcm = self._arquivo_pcm(caminho)  # cria a pasta do cache, o que também pode falhar
+                with open(arquivo_pcm, "rb") as f:
+                    som = mixer.Sound(buffer=f.read())
+            except OSError:
+                som = mixer.Sound(caminho)
+                if arquivo_pcm is not None:
+                    try:
+                        gravar_atomico(arquivo_pcm, som.get_raw())
+                    except OSError:
+                        pass  # Sem cache em disco, o som é decodificado a cada execução
+            self._sons[nome] = som
+        return som
+
+    def _reproduzir(self, nome):
+        """Toca o efeito no próximo canal reservado para ele (executado na thread de áudio)."""
+        som = self.carregar(nome)
+        canais = self._canais[nome]
+        indice = self._proximo_canal[nome]
+        self._proximo_canal[nome] = (indice + 1) % len(canais)
+        canais[indice].play(som)
+
+    def _executar(self):
+        """Laço da thread de áudio: toca os efeitos na ordem em que foram pedidos."""
+        while True:
+            nome = self._fila.get()
+            if nome is None:
+                break
+            try:
+                self._reproduzir(nome)
+            except Exception:
+                self.ativo = False  # Sem dispositivo de áudio ou arquivo: segue o jogo em silêncio
+
+    def tocar(self, nome):
+        """
+        Pede para tocar um efeito sonoro, sem bloquear quem chamou.
+
+        Pedidos do mesmo efeito mais próximos que `INTERVALO_MINIMO` são descartados.
+
+        Args:
+            nome (str): Nome do efeito ('passo', 'vitoria' ou 'saida').
+        """
+        if not self.ativo:
+            return
+        agora = time.monotonic()
+        intervalo = INTERVALO_MINIMO.get(nome, 0)
+        with self._trava:
+            if agora - self._ultimo_pedido.get(nome, float("-inf")) < intervalo:
+                return  # agrupa passos muito próximos num único som
+            self._ultimo_pedido[nome] = agora
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._executar, name="audio", daemon=True)
+                self._thread.start()
+        self._fila.put(nome)
+
+    def encerrar(self):
+        """Termina a thread de áudio depois de tocar os pedidos pendentes."""
+        with self._trava:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._fila.put(None)
+            thread.join()
+
+
+def criar_audio(ativo):
+    """
+    Cria o gerenciador de áudio adequado à configuração do jogador.
+
+    Args:
+        ativo (bool): Se o som está ativado.
+
+    Returns:
+        GerenciadorAudio | SemSom: Objeto com o método `tocar(nome)`.
+    """
+    return GerenciadorAudio() if ativo else SemSom()
@@ -0,0 +1,75 @@
+# cache_disco
+"""
+Módulo com utilitários para os caches persistentes do jogo.
+
+Os arquivos ficam na pasta de cache do usuário (XDG_CACHE_HOME ou
+~/.cache no Linux, LOCALAPPDATA no Windows), numa subpasta própria do jogo.
+Dados que não podem ser refeitos, como o ranking, ficam na pasta de dados
+do usuário (`pasta_dados`), que não é apagada junto com os caches.
+"""
+import os
+
+NOME_APLICACAO = "aventura-no-labirinto"
+
+
+def pasta_cache(*subpastas):
+    """
+    Retorna (e cria, se preciso) uma pasta dentro do cache do usuário.
+
+    A variável de ambiente AVENTURA_CACHE, se definida, substitui a pasta padrão.
+
+    Args:
+        *subpastas (str): Subpastas dentro da pasta de cache do jogo.
+
+    Returns:
+        str: Caminho absoluto da pasta.
+    """
+    base = os.environ.get("AVENTURA_CACHE")
+    if not base:
+        if os.name == "nt":
+            raiz = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+        else:
+            raiz = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        base = os.path.join(raiz, NOME_APLICACAO)
+    caminho = os.path.join(base, *subpastas)
+    os.makedirs(caminho, exist_ok=True)
+    return caminho
+
+
+def pasta_dados(*subpastas):
+    """
+    Retorna (e cria, se preciso) uma pasta dentro dos dados do usuário.
+
+    A variável de ambiente AVENTURA_DADOS, se definida, substitui a pasta padrão
+    (XDG_DATA_HOME ou ~/.local/share no Linux, APPDATA no Windows).
+
+    Args:
+        *subpastas (str): Subpastas dentro da pasta de dados do jogo.
+
+    Returns:
+        str: Caminho absoluto da pasta.
+    """
+    base = os.environ.get("AVENTURA_DADOS")
+    if not base:
+        if os.name == "nt":
+            raiz = os.environ.get("APPDATA") or os.path.expanduser("~")
+        else:
+            raiz = os.environ.get("XDG_DATA_HOME") or os.path.join(os.path.expanduser("~"), ".local", "share")
+        base = os.path.join(raiz, NOME_APLICACAO)
+    caminho = os.path.join(base, *subpastas)
+    os.makedirs(caminho, exist_ok=True)
+    return caminho
+
+
+def gravar_atomico(caminho, dados):
+    """
+    Grava bytes num arquivo de uma só vez, para que leitores nunca vejam um arquivo pela metade.
+
+    Args:
+        caminho (str): Caminho do arquivo de destino.
+        dados (bytes): Conteúdo a gravar.
+    """
+    temporario = f"{caminho}.{os.getpid()}.tmp"
+    with open(temporario, "wb") as f:
+        f.write(dados)
+    os.replace(temporario, caminho)
@@ -0,0 +1,245 @@
+# cache_labirintos
+"""
+Módulo com o cache em disco de labirintos gerados e de suas soluções.
+
+Labirintos gerados com semente são guardados com um bit por célula, numa
+entrada cujo nome é o hash dos parâmetros do gerador (algoritmo, tamanho,
+semente e `VERSAO`). Soluções são endereçadas pelo conteúdo: o nome é o
+hash das células do labirinto, do início e do algoritmo de solução, então
+qualquer labirinto igual reaproveita o mesmo caminho.
+
+Só labirintos com pelo menos `CELULAS_MINIMAS` células entram no cache:
+abaixo disso, gerar ou resolver de novo custa menos que abrir um arquivo,
+e cada entrada pequena ocuparia um bloco inteiro do disco.
+
+O cache tem um limite de espaço em disco: ao ultrapassá-lo, as entradas
+usadas há mais tempo são apagadas primeiro (cada leitura atualiza a data da
+entrada). Qualquer falha de disco apenas faz o jogo gerar ou resolver de novo.
+"""
+import hashlib
+import os
+import struct
+from array import array
+
+from .cache_disco import gravar_atomico, pasta_cache
+from .grade import MazeGrid
+
+# Mude quando os geradores ou o formato mudarem, para invalidar as entradas antigas
+VERSAO = 2
+
+LIMITE_PADRAO = 64 * 1024 * 1024  # bytes ocupados no disco
+# Labirintos menores que isto (cerca de 317x317) são gerados e resolvidos sem cache
+CELULAS_MINIMAS = 100_000
+# Ao podar, o cache desce até esta fração do limite, para não podar a cada gravação
+FRACAO_APOS_PODA = 0.75
+
+# Assinatura, versão, linhas, colunas e número de células especiais
+_CABECALHO_LABIRINTO = struct.Struct("<4sIIII")
+_CELULA_ESPECIAL = struct.Struct("<QB")
+# Assinatura, versão e número de passos (SEM_SOLUCAO se o labirinto não tem saída alcançável)
+_CABECALHO_SOLUCAO = struct.Struct("<4sIQ")
+SEM_SOLUCAO = 2 ** 64 - 1
+
+
+def _ocupado(info):
+    """Espaço que um arquivo ocupa no disco, em blocos inteiros, e não só o seu tamanho."""
+    blocos = getattr(info, "st_blocks", None)  # ausente no Windows
+    return info.st_size if blocos is None else blocos * 512
+
+
+class CacheLabirintos:
+    """
+    Cache persistente de labirintos e soluções, com descarte dos menos usados.
+
+    Args:
+        pasta (str, opcional): Pasta das entradas; por padrão, uma subpasta do
+            cache do usuário.
+        limite_bytes (int): Espaço máximo ocupado no disco pelas entradas.
+        celulas_minimas (int): Células que um labirinto precisa ter para
+            entrar no cache.
+    """
+
+    def __init__(self, pasta=None, limite_bytes=LIMITE_PADRAO, celulas_minimas=CELULAS_MINIMAS):
+        self.pasta = pasta
+        self.limite_bytes = limite_bytes
+        self.celulas_minimas = celulas_minimas
+        self.ativo = True
+        self._total = None  # tamanho estimado das entradas; medido na primeira gravação
+
+    def _caminho(self, nome):
+        """Retorna o caminho da entrada `nome`, criando a pasta se preciso."""
+        return os.path.join(self.pasta or pasta_cache("labirintos"), nome)
+
+    def aceita(self, linhas, colunas):
+        """Indica se um labirinto deste tamanho é consultado e guardado no cache."""
+        return self.ativo and linhas * colunas >= self.celulas_minimas
+
+    @staticmethod
+    def chave_labirinto(algoritmo, linhas, colunas, semente):
+        """
+        Calcula o nome da entrada de um labirinto gerado.
+
+        Returns:
+            str: Hash hexadecimal dos parâmetros do gerador.
+        """
+        chave = f"{VERSAO}|{algoritmo}|{linhas}x{colunas}|{semente}"
+        return hashlib.sha256(chave.encode("utf-8")).hexdigest()[:32] + ".lab"
+
+    @staticmethod
+    def chave_solucao(labirinto, inicio, algoritmo):
+        """
+        Calcula o nome da entrada da solução a partir do conteúdo do labirinto.
+
+        Returns:
+            str: Hash hexadecimal das células, do início e do algoritmo.
+        """
+        chave = f"{VERSAO}|{algoritmo}|{inicio}|{labirinto.linhas}x{labirinto.colunas}|"
+        resumo = hashlib.sha256(chave.encode("utf-8"))
+        resumo.update(labirinto.dados)
+        return resumo.hexdigest()[:32] + ".sol"
+
+    def _ler(self, nome):
+        """Lê uma entrada e marca o seu uso; retorna None se ela não existir."""
+        try:
+            caminho = self._caminho(nome)
+            with open(caminho, "rb") as f:
+                dados = f.read()
+            os.utime(caminho)  # a data de modificação marca o último uso
+        except OSError:
+            return None
+        return dados
+
+    def _gravar(self, nome, dados):
+        """Grava uma entrada e descarta as mais antigas se o limite for ultrapassado."""
+        try:
+            caminho = self._caminho(nome)
+            gravar_atomico(caminho, dados)
+            if self._total is None:
+                self._total = sum(tamanho for _, tamanho, _ in self._entradas())
+            else:
+                self._total += _ocupado(os.stat(caminho))
+            if self._total > self.limite_bytes:
+                self.podar()
+        except OSError:
+            pass  # Sem cache em disco, o trabalho é refeito na próxima vez
+
+    def _descartar(self, nome):
+        """Apaga uma entrada corrompida ou de outra versão."""
+        try:
+            os.remove(self._caminho(nome))
+        except OSError:
+            pass
+
+    def _entradas(self):
+        """Lista (data de uso, espaço ocupado, caminho) de cada entrada do cache."""
+        entradas = []
+        with os.scandir(self.pasta or pasta_cache("labirintos")) as itens:
+            for item in itens:
+                if item.name.endswith((".lab", ".sol")):
+                    try:
+                        info = item.stat()
+                    except OSError:
+                        continue  # apagada por outro processo durante a listagem
+                    entradas.append((info.st_mtime_ns, _ocupado(info), item.path))
+        return entradas
+
+    def podar(self):
+        """Apaga as entradas usadas há mais tempo até o cache ficar abaixo do limite."""
+        try:
+            entradas = self._entradas()
+        except OSError:
+            return  # Sem pasta de cache, não há o que podar
+        total = sum(tamanho for _, tamanho, _ in entradas)
+        if total > self.limite_bytes:
+            alvo = self.limite_bytes * FRACAO_APOS_PODA
+            entradas.sort()
+            for _, tamanho, caminho in entradas:
+                try:
+                    os.remove(caminho)
+                except OSError:
+                    continue
+                total -= tamanho
+                if total <= alvo:
+                    break
+        self._total = total
+
+    def obter_labirinto(self, algoritmo, linhas, colunas, semente):
+        """
+        Procura um labirinto gerado com esses parâmetros.
+
+        Returns:
+            MazeGrid: Labirinto em cache, ou None.
+        """
+        if not self.aceita(linhas, colunas):
+            return None
+        nome = self.chave_labirinto(algoritmo, linhas, colunas, semente)
+        dados = self._ler(nome)
+        if dados is None:
+            return None
+        try:
+            assinatura, versao, *dimensoes, n = _CABECALHO_LABIRINTO.unpack_from(dados)
+            if (assinatura, versao, *dimensoes) != (b"AVLB", VERSAO, linhas, colunas):
+                raise ValueError("Entrada de outra versão.")
+            inicio = _CABECALHO_LABIRINTO.size
+            especiais = list(_CELULA_ESPECIAL.iter_unpack(dados[inicio:inicio + n * _CELULA_ESPECIAL.size]))
+            bits = dados[inicio + n * _CELULA_ESPECIAL.size:]
+            return MazeGrid.desempacotar(linhas, colunas, bits, especiais)
+        except (struct.error, ValueError, IndexError):
+            self._descartar(nome)
+            return None
+
+    def guardar_labirinto(self, algoritmo, linhas, colunas, semente, labirinto):
+        """Guarda um labirinto gerado com esses parâmetros."""
+        if not self.aceita(linhas, colunas):
+            return
+        bits, especiais = labirinto.empacotar()
+        partes = [_CABECALHO_LABIRINTO.pack(b"AVLB", VERSAO, linhas, colunas, len(especiais))]
+        partes.extend(_CELULA_ESPECIAL.pack(indice, codigo) for indice, codigo in especiais)
+        partes.append(bits)
+        self._gravar(self.chave_labirinto(algoritmo, linhas, colunas, semente), b"".join(partes))
+
+    def obter_solucao(self, labirinto, inicio, algoritmo):
+        """
+        Procura a solução de um labirinto com este conteúdo.
+
+        Returns:
+            tuple: (encontrada, caminho). `encontrada` é False se não houver
+            entrada; `caminho` é a lista de posições ou None se o labirinto
+            não tem solução.
+        """
+        if not self.aceita(labirinto.linhas, labirinto.colunas):
+            return False, None
+        nome = self.chave_solucao(labirinto, inicio, algoritmo)
+        dados = self._ler(nome)
+        if dados is None:
+            return False, None
+        try:
+            assinatura, versao, passos = _CABECALHO_SOLUCAO.unpack_from(dados)
+            if (assinatura, versao) != (b"AVSL", VERSAO):
+                raise ValueError("Entrada de outra versão.")
+            if passos == SEM_SOLUCAO:
+                return True, None
+            indices = array("Q")
+            indices.frombytes(dados[_CABECALHO_SOLUCAO.size:])
+            if len(indices) != passos:
+                raise ValueError("Entrada incompleta.")
+        except (struct.error, ValueError):
+            self._descartar(nome)
+            return False, None
+        colunas = labirinto.colunas
+        return True, [divmod(indice, colunas) for indice in indices]
+
+    def guardar_solucao(self, labirinto, inicio, algoritmo, caminho):
+        """Guarda a solução (ou a falta dela) de um labirinto com este conteúdo."""
+        if not self.aceita(labirinto.linhas, labirinto.colunas):
+            return
+        if caminho is None:
+            dados = _CABECALHO_SOLUCAO.pack(b"AVSL", VERSAO, SEM_SOLUCAO)
+        else:
+            colunas = labirinto.colunas
+            indices = array("Q", [i * colunas + j for i, j in caminho])
+            dados = _CABECALHO_SOLUCAO.pack(b"AVSL", VERSAO, len(indices)) + indices.tobytes()
+        self._gravar(self.chave_solucao(labirinto, inicio, algoritmo), dados)
+
+
+cache_labirintos = CacheLabirintos()
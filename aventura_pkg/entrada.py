@@ -0,0 +1,338 @@
+# entrada
+"""
+Módulo com as fontes de teclado usadas durante a partida.
+
+Cada fonte entrega listas de comandos ('up', 'down', 'left', 'right' ou
+`SAIR`) pelo mesmo método, `ler_comandos()`, que espera o primeiro
+comando e devolve junto todos os que já chegaram:
+
+- `EntradaPynput` escuta o teclado do sistema com o `pynput`, que exige
+  um servidor gráfico (X) ou acesso ao uinput;
+- `EntradaTerminal` lê as sequências de escape das setas diretamente da
+  entrada padrão, com o terminal em modo cbreak. Funciona por SSH, em
+  contêineres e em qualquer pseudo-terminal, mas só em sistemas Unix.
+
+Cada fonte também tem `ler_comandos_async()`, para o laço de eventos do
+jogo: a do terminal espera a entrada padrão com `add_reader`, sem thread.
+As respostas do menu são lidas por `LeitorLinhas`, também sem bloquear o
+laço. O `pynput` e o `termios` só são importados quando a fonte é criada.
+"""
+import asyncio
+import os
+import queue
+import selectors
+import sys
+
+# Comando gerado pela tecla ESC
+SAIR = "sair"
+
+ESC = 0x1B
+# Byte final das sequências de escape das setas (ESC [ A ou ESC O A)
+SETAS = {ord("A"): "up", ord("B"): "down", ord("C"): "right", ord("D"): "left"}
+# Tempo sem novos bytes para um ESC pendente ser a tecla ESC, e não o início de uma sequência
+ESPERA_ESC = 0.05  # segundos
+
+
+def interpretar_teclas(dados):
+    """
+    Converte os bytes lidos do terminal em comandos.
+
+    Setas com modificadores (Ctrl, Shift) e outras sequências de escape
+    são descartadas inteiras; as demais teclas são ignoradas.
+
+    Args:
+        dados (bytes): Bytes lidos da entrada padrão.
+
+    Returns:
+        tuple: (comandos, resto). `resto` é o começo de uma sequência de
+        escape ainda incompleta, a ser juntado à próxima leitura.
+    """
+    comandos = []
+    n = len(dados)
+    k = 0
+    while k < n:
+        if dados[k] != ESC:
+            k += 1
+            continue
+        if k + 1 == n:
+            return comandos, dados[k:]  # pode ser só o começo de uma sequência
+        if dados[k + 1] not in b"[O":
+            comandos.append(SAIR)  # ESC seguido de outra tecla
+            k += 1
+            continue
+        # A sequência termina no primeiro byte entre '@' e '~'
+        fim = k + 2
+        while fim < n and not 0x40 <= dados[fim] <= 0x7E:
+            fim += 1
+        if fim == n:
+            return comandos, dados[k:]
+        if fim == k + 2 and dados[fim] in SETAS:
+            comandos.append(SETAS[dados[fim]])
+        k = fim + 1
+    return comandos, b""
+
+
+async def _aguardar_leitura(fd, espera=None):
+    """
+    Espera o descritor `fd` ter dados para ler, sem bloquear o laço de eventos.
+
+    Returns:
+        bool: True se há dados; False se `espera` segundos passaram antes.
+    """
+    loop = asyncio.get_running_loop()
+    pronto = loop.create_future()
+    loop.add_reader(fd, lambda: pronto.done() or pronto.set_result(True))
+    try:
+        return await asyncio.wait_for(pronto, espera)
+    except asyncio.TimeoutError:
+        return False
+    finally:
+        loop.remove_reader(fd)
+
+
+class LeitorLinhas:
+    """
+    Lê as respostas do menu linha a linha sem bloquear o laço de eventos.
+
+    Num terminal Unix, a entrada só é lida enquanto alguém espera uma linha,
+    então as setas da partida continuam chegando à `EntradaTerminal`. Nos
+    demais casos (arquivo, pipe, Windows), a leitura roda numa thread; se
+    quem esperava for cancelado, a linha fica para a próxima chamada.
+
+    Args:
+        arquivo (TextIO, opcional): Arquivo de entrada; por padrão, `sys.stdin`.
+    """
+
+    def __init__(self, arquivo=None):
+        self.arquivo = arquivo
+        self._buffer = b""
+        self._leitura = None  # leitura em andamento numa thread
+        self._sem_leitor = False  # o laço não consegue vigiar este arquivo
+
+    async def ler(self, pergunta=""):
+        """
+        Mostra a pergunta e espera a próxima linha, como `input()`.
+
+        Args:
+            pergunta (str): Texto exibido antes da leitura.
+
+        Returns:
+            str: Linha lida, sem a quebra de linha.
+        """
+        if pergunta:
+            sys.stdout.write(pergunta)
+            sys.stdout.flush()
+        arquivo = self.arquivo or sys.stdin
+        fd = arquivo.fileno()
+        if not self._sem_leitor and self._leitura is None and os.isatty(fd):
+            try:
+                return await self._ler_terminal(fd)
+            except NotImplementedError:
+                self._sem_leitor = True  # laço sem add_reader (Windows)
+        if self._leitura is None:
+            self._leitura = asyncio.get_running_loop().run_in_executor(None, arquivo.readline)
+        # A leitura continua mesmo se esta espera for cancelada
+        linha = await asyncio.shield(self._leitura)
+        self._leitura = None
+        if not linha:
+            raise EOFError
+        return linha.rstrip("\r\n")
+
+    async def _ler_terminal(self, fd):
+        """Junta o que o terminal entregar até completar uma linha."""
+        while b"\n" not in self._buffer:
+            await _aguardar_leitura(fd)
+            dados = os.read(fd, 4096)
+            if not dados:
+                if not self._buffer:
+                    raise EOFError
+                break
+            self._buffer += dados
+        linha, _, self._buffer = self._buffer.partition(b"\n")
+        return linha.decode("utf-8", "replace").rstrip("\r")
+
+
+class EntradaPynput:
+    """Fonte de comandos que escuta o teclado do sistema numa thread do `pynput`."""
+
+    def __init__(self):
+        from pynput import keyboard
+
+        self._keyboard = keyboard
+        self._teclas = {
+            keyboard.Key.up: "up",
+            keyboard.Key.down: "down",
+            keyboard.Key.left: "left",
+            keyboard.Key.right: "right",
+            keyboard.Key.esc: SAIR,
+        }
+        self._fila = queue.SimpleQueue()
+        self._listener = None
+        self._laco = None  # laço de eventos avisado a cada tecla, se houver
+        self._aviso = asyncio.Event()
+
+    def _ao_pressionar(self, tecla):
+        """Enfileira o comando da tecla; roda na thread do `pynput`."""
+        comando = self._teclas.get(tecla)
+        if comando is not None:
+            self._fila.put(comando)
+            laco = self._laco
+            if laco is not None:
+                laco.call_soon_threadsafe(self._aviso.set)
+
+    def iniciar(self):
+        """Começa a escutar o teclado."""
+        self._listener = self._keyboard.Listener(on_press=self._ao_pressionar)
+        self._listener.start()
+
+    def ler_comandos(self):
+        """
+        Espera o próximo comando.
+
+        Returns:
+            list[str]: O comando recebido e todos os que chegaram desde então.
+        """
+        comandos = [self._fila.get()]
+        while True:
+            try:
+                comandos.append(self._fila.get_nowait())
+            except queue.Empty:
+                return comandos
+
+    async def ler_comandos_async(self):
+        """Como `ler_comandos`, mas espera sem bloquear o laço de eventos."""
+        self._laco = asyncio.get_running_loop()
+        while self._fila.empty():
+            self._aviso.clear()
+            if self._fila.empty():
+                await self._aviso.wait()
+        return self.ler_comandos()
+
+    def parar(self):
+        """Para de escutar o teclado."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    def __enter__(self):
+        self.iniciar()
+        return self
+
+    def __exit__(self, tipo, valor, rastro):
+        self.parar()
+
+
+class EntradaTerminal:
+    """
+    Fonte de comandos que lê as setas da entrada padrão em modo cbreak.
+
+    O modo cbreak desliga o eco e a espera pelo Enter, mas mantém o Ctrl+C.
+    O modo original do terminal é restaurado em `parar()`, e as teclas
+    que sobraram são descartadas para não aparecerem no menu.
+
+    Args:
+        arquivo (int, opcional): Descritor do terminal; por padrão, o da entrada padrão.
+    """
+
+    def __init__(self, arquivo=None):
+        try:
+            import termios
+            import tty
+        except ImportError:
+            raise ValueError("A entrada pelo terminal só está disponível em sistemas Unix.") from None
+        self._termios = termios
+        self._tty = tty
+        self._fd = sys.stdin.fileno() if arquivo is None else arquivo
+        if not os.isatty(self._fd):
+            raise ValueError("A entrada pelo terminal exige que a entrada padrão seja um terminal.")
+        self._modo_original = None
+        self._seletor = None
+        self._resto = b""
+
+    def iniciar(self):
+        """Coloca o terminal em modo cbreak."""
+        self._modo_original = self._termios.tcgetattr(self._fd)
+        # TCSANOW: as teclas apertadas antes da partida começar não são descartadas
+        self._tty.setcbreak(self._fd, self._termios.TCSANOW)
+        self._seletor = selectors.DefaultSelector()
+        self._seletor.register(self._fd, selectors.EVENT_READ)
+        self._resto = b""
+
+    def _consumir(self, dados):
+        """Interpreta os bytes lidos junto com o resto da leitura anterior."""
+        if not dados:
+            return [SAIR]  # o terminal foi fechado
+        comandos, self._resto = interpretar_teclas(self._resto + dados)
+        return comandos
+
+    def _expirar_esc(self):
+        """Nada chegou depois de um ESC pendente: se ele estava sozinho, foi a tecla ESC."""
+        pendente, self._resto = self._resto, b""
+        return [SAIR] if pendente == bytes((ESC,)) else []
+
+    def ler_comandos(self):
+        """
+        Espera o próximo comando.
+
+        Returns:
+            list[str]: Os comandos de tudo o que foi digitado até agora.
+        """
+        while True:
+            espera = ESPERA_ESC if self._resto else None
+            if self._seletor.select(espera):
+                comandos = self._consumir(os.read(self._fd, 1024))
+            else:
+                comandos = self._expirar_esc()
+            if comandos:
+                return comandos
+
+    async def ler_comandos_async(self):
+        """Como `ler_comandos`, mas espera sem bloquear o laço de eventos."""
+        while True:
+            espera = ESPERA_ESC if self._resto else None
+            if await _aguardar_leitura(self._fd, espera):
+                comandos = self._consumir(os.read(self._fd, 1024))
+            else:
+                comandos = self._expirar_esc()
+            if comandos:
+                return comandos
+
+    def parar(self):
+        """Restaura o modo original do terminal."""
+        if self._seletor is not None:
+            self._seletor.close()
+            self._seletor = None
+        if self._modo_original is not None:
+            self._termios.tcsetattr(self._fd, self._termios.TCSADRAIN, self._modo_original)
+            self._termios.tcflush(self._fd, self._termios.TCIFLUSH)
+            self._modo_original = None
+
+    def __enter__(self):
+        self.iniciar()
+        return self
+
+    def __exit__(self, tipo, valor, rastro):
+        self.parar()
+
+
+ENTRADAS = {
+    "pynput": EntradaPynput,
+    "terminal": EntradaTerminal,
+}
+
+
+def criar_entrada(tipo="pynput"):
+    """
+    Cria a fonte de comandos escolhida.
+
+    Args:
+        tipo (str): 'pynput' (teclado do sistema) ou 'terminal' (entrada padrão).
+
+    Returns:
+        EntradaPynput | EntradaTerminal: Fonte ainda não iniciada; use-a com `with`.
+    """
+    try:
+        classe = ENTRADAS[tipo]
+    except KeyError:
+        raise ValueError(f"Entrada desconhecida: {tipo}.") from None
+    return classe()
@@ -1,65 +1,362 @@
 # exportar docstring
+import hashlib
 import importlib
 import inspect
+import json
 import os
-from deep_translator import GoogleTranslator
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-def traduzir(texto):
+# Cache das traduções já feitas, para não repetir chamadas de rede
+ARQUIVO_CACHE = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".cache_traducoes.json"))
+
+def chave_traducao(texto, destino='pt'):
+    """
+    Calcula a chave do cache de traduções para um texto.
+
+    Args:
+        texto (str): Texto original.
+        destino (str): Idioma de destino.
+
+    Returns:
+        str: Hash SHA-256 do idioma de destino e do texto.
+    """
+    return hashlib.sha256(f"{destino}\0{texto}".encode("utf-8")).hexdigest()
+
+def carregar_cache(caminho=ARQUIVO_CACHE):
+    """
+    Lê o cache de traduções do disco.
+
+    Args:
+        caminho (str): Caminho do arquivo JSON do cache.
+
+    Returns:
+        dict: Traduções indexadas por `chave_traducao`, ou vazio se o arquivo não existir ou estiver corrompido.
+    """
+    try:
+        with open(caminho, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def salvar_cache(cache, caminho=ARQUIVO_CACHE):
+    """
+    Grava o cache de traduções no disco, substituindo o arquivo de uma só vez.
+
+    Args:
+        cache (dict): Traduções indexadas por `chave_traducao`.
+        caminho (str): Caminho do arquivo JSON do cache.
+    """
+    temporario = f"{caminho}.tmp"
+    with open(temporario, "w", encoding="utf-8") as f:
+        json.dump(cache, f, ensure_ascii=False, indent=0, sort_keys=True)
+    os.replace(temporario, caminho)
+
+class TradutorGoogle:
+    """
+    Tradutor que usa o GoogleTranslator (requer acesso à rede).
+
+    Cada thread reaproveita a sua própria instância do GoogleTranslator,
+    em vez de criar uma nova a cada docstring.
+
+    Args:
+        destino (str): Idioma de destino.
+    """
+
+    persistente = True  # as traduções podem ir para o cache em disco
+
+    def __init__(self, destino='pt'):
+        self.destino = destino
+        self._local = threading.local()
+
+    def traduzir(self, texto):
+        """Traduz um texto; pode levantar exceção em caso de erro de rede."""
+        tradutor = getattr(self._local, "tradutor", None)
+        if tradutor is None:
+            from deep_translator import GoogleTranslator
+            tradutor = GoogleTranslator(source='auto', target=self.destino)
+            self._local.tradutor = tradutor
+        return tradutor.translate(texto)
+
+class TradutorLocal:
+    """
+    Tradutor local, sem rede, que devolve o texto original.
+
+    Útil em testes e para gerar a documentação sem conexão. Como não traduz
+    de fato, os seus resultados não vão para o cache em disco; senão, uma
+    exportação com o tradutor de rede os tomaria por traduções prontas.
+
+    Args:
+        destino (str): Idioma de destino (apenas registrado).
+    """
+
+    persistente = False
+
+    def __init__(self, destino='pt'):
+        self.destino = destino
+
+    def traduzir(self, texto):
+        """Retorna o próprio texto."""
+        return texto
+
+TRADUTORES = {
+    'google': TradutorGoogle,
+    'local': TradutorLocal,
+}
+
+def traduzir(texto, cache=None, tradutor=None):
     """
     Traduz um texto para o português usando o GoogleTranslator.
 
     Args:
         texto (str): Texto a ser traduzido.
+        cache (dict, opcional): Cache de traduções; se o texto já estiver nele,
+            nenhuma chamada de rede é feita.
+        tradutor (opcional): Objeto com método `traduzir(texto)`; por padrão, `TradutorGoogle`.
+            Se tiver `persistente = False`, o resultado não é guardado no cache.
 
     Returns:
         str: Texto traduzido ou original se houver erro.
     """
+    chave = chave_traducao(texto)
+    if cache is not None and chave in cache:
+        return cache[chave]
+
     try:
-        return GoogleTranslator(source='auto', target='pt').translate(texto)
+        traduzido = (tradutor or TradutorGoogle()).traduzir(texto)
     except Exception:
-        return texto  # Se der erro na tradução, retorna o texto original
+        return texto  # Se der erro na tradução, retorna o texto original (sem guardar no cache)
+
+    if cache is not None and getattr(tradutor, "persistente", True):
+        cache[chave] = traduzido
+    return traduzido
 
-def exportar_docstrings_html(pacote='aventura_pkg', arquivo_saida='aventura_pkg.html'):
+def traduzir_lote(textos, cache, tradutor=None, max_threads=8):
+    """
+    Traduz vários textos em paralelo, guardando os resultados no cache.
+
+    Textos repetidos ou já presentes no cache são traduzidos uma única vez
+    ou nenhuma. As traduções pendentes são distribuídas num pool limitado
+    de threads, então o tempo total é limitado pelas chamadas mais lentas
+    e não pela soma de todas.
+
+    Args:
+        textos (Iterable[str]): Textos a traduzir.
+        cache (dict): Cache de traduções, atualizado com os novos resultados.
+        tradutor (opcional): Objeto com método `traduzir(texto)`; por padrão, `TradutorGoogle`.
+        max_threads (int): Número máximo de traduções simultâneas.
+
+    Returns:
+        int: Quantidade de textos efetivamente enviados ao tradutor.
+    """
+    tradutor = tradutor or TradutorGoogle()
+    pendentes = {}
+    for texto in textos:
+        chave = chave_traducao(texto)
+        if chave not in cache:
+            pendentes.setdefault(chave, texto)
+
+    if not pendentes:
+        return 0
+
+    def traduzir_um(texto):
+        try:
+            return tradutor.traduzir(texto)
+        except Exception:
+            return None  # Falhas não vão para o cache
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_threads, len(pendentes)))) as executor:
+        resultados = executor.map(traduzir_um, pendentes.values())
+        for chave, traduzido in zip(pendentes, resultados):
+            if traduzido is not None:
+                cache[chave] = traduzido
+
+    return len(pendentes)
+
+def carregar_manifesto(caminho):
+    """
+    Lê o manifesto de uma exportação anterior.
+
+    Args:
+        caminho (str): Caminho do arquivo JSON do manifesto.
+
+    Returns:
+        dict: Para cada módulo, o `mtime` e o hash do código-fonte; vazio se não houver manifesto válido.
+    """
+    return carregar_cache(caminho)
+
+def assinatura_fonte(caminho_arquivo, anterior=None):
+    """
+    Calcula a assinatura (mtime e hash SHA-256) do código-fonte de um módulo.
+
+    Se o `mtime` for igual ao da assinatura anterior, o arquivo não é relido.
+
+    Args:
+        caminho_arquivo (str): Caminho do arquivo `.py`.
+        anterior (dict, opcional): Assinatura registrada no manifesto.
+
+    Returns:
+        dict: Assinatura com as chaves 'mtime' e 'hash'.
+    """
+    mtime = os.stat(caminho_arquivo).st_mtime_ns
+    if anterior and anterior.get("mtime") == mtime:
+        return anterior
+    with open(caminho_arquivo, "rb") as f:
+        return {"mtime": mtime, "hash": hashlib.sha256(f.read()).hexdigest()}
+
+def extrair_secoes(html):
+    """
+    Separa as seções de cada módulo de um HTML gerado por `exportar_docstrings_html`.
+
+    Args:
+        html (str): Conteúdo do arquivo HTML.
+
+    Returns:
+        dict: Texto de cada seção, indexado pelo nome do módulo.
+    """
+    padrao = re.compile(r"<!-- modulo: (?P<nome>\S+) -->\n.*?<!-- fim: (?P=nome) -->", re.DOTALL)
+    return {m.group("nome"): m.group(0) for m in padrao.finditer(html)}
+
+def coletar_docstrings(nome_modulo):
+    """
+    Importa um módulo e coleta as suas docstrings, sem traduzir.
+
+    Só entram as funções e classes definidas no próprio módulo; as importadas
+    de outros módulos ficam na seção de quem as define.
+
+    Args:
+        nome_modulo (str): Nome completo do módulo.
+
+    Returns:
+        list: Pares (título HTML ou None para o módulo, docstring), ou None se o módulo não puder ser importado.
+    """
+    try:
+        modulo = importlib.import_module(nome_modulo)
+    except ModuleNotFoundError:
+        return None
+
+    itens = []
+    doc_modulo = inspect.getdoc(modulo)
+    if doc_modulo:
+        itens.append((None, doc_modulo))
+
+    for nome, objeto in inspect.getmembers(modulo):
+        if (inspect.isfunction(objeto) or inspect.isclass(objeto)) and objeto.__module__ == nome_modulo:
+            doc = inspect.getdoc(objeto)
+            if doc:
+                tipo = "Função" if inspect.isfunction(objeto) else "Classe"
+                itens.append((f"<h3>{tipo}: {nome}</h3>", doc))
+    return itens
+
+def montar_secao(nome_modulo, itens, cache):
+    """
+    Monta a seção HTML de um módulo com as docstrings já traduzidas.
+
+    Args:
+        nome_modulo (str): Nome completo do módulo.
+        itens (list): Pares retornados por `coletar_docstrings`.
+        cache (dict): Cache de traduções; textos ausentes ficam no original.
+
+    Returns:
+        str: Seção HTML delimitada por comentários.
+    """
+    html = [f"<!-- modulo: {nome_modulo} -->"]
+    html.append(f"<h2>Módulo: {nome_modulo}</h2>")
+    for titulo, doc in itens:
+        if titulo:
+            html.append(titulo)
+        html.append(f"<pre>{cache.get(chave_traducao(doc), doc)}</pre>")
+    html.append(f"<!-- fim: {nome_modulo} -->")
+    return "\n".join(html)
+
+def exportar_docstrings_html(pacote='aventura_pkg', arquivo_saida='aventura_pkg.html', arquivo_cache=ARQUIVO_CACHE,
+                             incremental=False, tradutor=None, max_threads=8):
     """
     Exporta as docstrings do pacote especificado para um arquivo HTML, com tradução para português.
 
+    As traduções ficam guardadas em `arquivo_cache`, então docstrings que não
+    mudaram não são traduzidas de novo. No modo incremental, um manifesto
+    (`arquivo_saida` + '.json') registra a assinatura do código de cada módulo;
+    só os módulos alterados são importados e regenerados, e suas seções são
+    encaixadas no HTML existente. Um módulo só entra no manifesto quando
+    todas as suas docstrings estão no cache em disco; se alguma tradução
+    falhou ou veio de um tradutor não persistente, ele é regenerado de novo
+    na próxima exportação.
+
+    Todas as docstrings são coletadas antes de traduzir, e as que faltam no
+    cache são traduzidas em paralelo por `traduzir_lote`.
+
     Args:
         pacote (str): Nome do pacote a ser documentado.
         arquivo_saida (str): Caminho do arquivo HTML de saída.
+        arquivo_cache (str): Caminho do cache de traduções em disco.
+        incremental (bool): Se True, reaproveita as seções de módulos que não mudaram.
+        tradutor (opcional): Objeto com método `traduzir(texto)`; por padrão, `TradutorGoogle`.
+        max_threads (int): Número máximo de traduções simultâneas.
+
+    Returns:
+        list: Nomes dos módulos cujas seções foram regeneradas.
     """
     caminho_pacote = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", pacote))
 
     if not os.path.isdir(caminho_pacote):
         raise FileNotFoundError(f"O diretório do pacote {pacote} não foi encontrado em {caminho_pacote}")
 
-    html = ["<html><head><meta charset='utf-8'><title>Documentação do pacote</title></head><body>"]
-    html.append(f"<h1>Documentação do pacote: {pacote}</h1>")
+    arquivo_manifesto = f"{arquivo_saida}.json"
+    manifesto_anterior = {}
+    secoes_anteriores = {}
+    if incremental:
+        manifesto_anterior = carregar_manifesto(arquivo_manifesto)
+        try:
+            with open(arquivo_saida, encoding="utf-8") as f:
+                secoes_anteriores = extrair_secoes(f.read())
+        except OSError:
+            pass
 
-    for nome_arquivo in os.listdir(caminho_pacote):
+    cache = carregar_cache(arquivo_cache)
+    tamanho_inicial = len(cache)
+    # Traduções desta exportação; as de um tradutor não persistente ficam fora do cache em disco
+    traducoes = cache if getattr(tradutor, "persistente", True) else dict(cache)
+    manifesto = {}
+    secoes = []  # (nome do módulo, seção reaproveitada ou docstrings coletadas, assinatura)
+
+    for nome_arquivo in sorted(os.listdir(caminho_pacote)):
         if nome_arquivo.endswith(".py") and not nome_arquivo.startswith("__"):
             nome_modulo = f"{pacote}.{nome_arquivo[:-3]}"
-            try:
-                modulo = importlib.import_module(nome_modulo)
-            except ModuleNotFoundError:
-                continue
-
-            html.append(f"<h2>Módulo: {nome_modulo}</h2>")
-
-            doc_modulo = inspect.getdoc(modulo)
-            if doc_modulo:
-                doc_traduzida = traduzir(doc_modulo)
-                html.append(f"<pre>{doc_traduzida}</pre>")
-
-            for nome, objeto in inspect.getmembers(modulo):
-                if inspect.isfunction(objeto) or inspect.isclass(objeto):
-                    doc = inspect.getdoc(objeto)
-                    if doc:
-                        tipo = "Função" if inspect.isfunction(objeto) else "Classe"
-                        doc_traduzida = traduzir(doc)
-                        html.append(f"<h3>{tipo}: {nome}</h3>")
-                        html.append(f"<pre>{doc_traduzida}</pre>")
+            anterior = manifesto_anterior.get(nome_modulo)
+            assinatura = assinatura_fonte(os.path.join(caminho_pacote, nome_arquivo), anterior)
+
+            secao = secoes_anteriores.get(nome_modulo)
+            if secao is None or anterior is None or anterior.get("hash") != assinatura["hash"]:
+                secao = coletar_docstrings(nome_modulo)
+                if secao is None:
+                    continue
+
+            secoes.append((nome_modulo, secao, assinatura))
 
+    regenerados = [nome for nome, secao, _ in secoes if not isinstance(secao, str)]
+    traduzir_lote(
+        (doc for _, secao, _ in secoes if not isinstance(secao, str) for _, doc in secao),
+        traducoes, tradutor, max_threads,
+    )
+
+    for nome_modulo, secao, assinatura in secoes:
+        if isinstance(secao, str) or all(chave_traducao(doc) in cache for _, doc in secao):
+            manifesto[nome_modulo] = assinatura
+
+    html = ["<html><head><meta charset='utf-8'><title>Documentação do pacote</title></head><body>"]
+    html.append(f"<h1>Documentação do pacote: {pacote}</h1>")
+    for nome_modulo, secao, _ in secoes:
+        html.append(secao if isinstance(secao, str) else montar_secao(nome_modulo, secao, traducoes))
     html.append("</body></html>")
 
     with open(arquivo_saida, "w", encoding="utf-8") as f:
         f.write("\n".join(html))
+    salvar_cache(manifesto, arquivo_manifesto)
+
+    if len(cache) != tamanho_inicial:
+        salvar_cache(cache, arquivo_cache)
+
+    return regenerados
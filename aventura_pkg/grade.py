@@ -0,0 +1,261 @@
+# grade
+"""
+Módulo com a representação compacta do labirinto.
+
+O `MazeGrid` guarda cada célula como um byte (parede, livre, início,
+saída ou solução) num único `bytearray`, mas continua aceitando
+`grade[i][j]`, `len()` e iteração por linhas, como a antiga lista de
+listas de caracteres.
+"""
+
+PAREDE = 0
+LIVRE = 1
+INICIO = 2
+SAIDA = 3
+SOLUCAO = 4
+
+# Símbolo usado pelo restante do jogo para cada código
+SIMBOLOS = ('#', ' ', 'S', 'F', '*')
+
+CODIGOS = {
+    '#': PAREDE,
+    ' ': LIVRE,
+    '.': LIVRE,
+    'S': INICIO,
+    'F': SAIDA,
+    '*': SOLUCAO,
+}
+
+
+# Tabelas para `bytes.translate`: célula -> dígito '0'/'1' (parede ou passagem) e volta
+_PARA_DIGITO = bytes(ord('0') if codigo == PAREDE else ord('1') for codigo in range(256))
+_DE_DIGITO = bytes(LIVRE if b == ord('1') else PAREDE for b in range(256))
+
+
+def empacotar_bits(codigos):
+    """
+    Compacta códigos de células com um bit cada (1 = passagem, 0 = parede).
+
+    A conversão passa por um único inteiro grande, sem laço Python por célula.
+
+    Args:
+        codigos (bytes | bytearray): Códigos das células.
+
+    Returns:
+        bytes: Bits do mais significativo para o menos, completados com zeros
+        até fechar o último byte.
+    """
+    total = len(codigos)
+    preenchimento = -total % 8
+    digitos = b'0' + codigos.translate(_PARA_DIGITO) + b'0' * preenchimento
+    return int(digitos, 2).to_bytes((total + preenchimento) // 8, 'big')
+
+
+def desempacotar_bits(bits, total):
+    """
+    Desfaz `empacotar_bits`, devolvendo PAREDE ou LIVRE para cada célula.
+
+    Args:
+        bits (bytes): Bits compactados.
+        total (int): Quantidade de células a extrair.
+
+    Returns:
+        bytearray: Códigos das `total` primeiras células.
+    """
+    digitos = format(int.from_bytes(bits, 'big'), f'0{len(bits) * 8}b')
+    return bytearray(digitos.encode('ascii')[:total].translate(_DE_DIGITO))
+
+
+def codificar(simbolo):
+    """
+    Converte um símbolo do labirinto no código numérico correspondente.
+
+    Args:
+        simbolo (str): Um dos símbolos '#', ' ', '.', 'S', 'F' ou '*'.
+
+    Returns:
+        int: Código da célula.
+    """
+    try:
+        return CODIGOS[simbolo]
+    except KeyError:
+        raise ValueError(f"Símbolo de célula inválido: {simbolo!r}") from None
+
+
+class _LinhaGrade:
+    """Visão de uma linha do `MazeGrid`, indexável como uma lista de caracteres."""
+
+    __slots__ = ('_dados', '_inicio', '_colunas')
+
+    def __init__(self, dados, inicio, colunas):
+        self._dados = dados
+        self._inicio = inicio
+        self._colunas = colunas
+
+    def _indice(self, j):
+        if j < 0:
+            j += self._colunas
+        if not 0 <= j < self._colunas:
+            raise IndexError("Coluna fora do labirinto.")
+        return self._inicio + j
+
+    def __len__(self):
+        return self._colunas
+
+    def __getitem__(self, j):
+        return SIMBOLOS[self._dados[self._indice(j)]]
+
+    def __setitem__(self, j, simbolo):
+        self._dados[self._indice(j)] = codificar(simbolo)
+
+    def __iter__(self):
+        fim = self._inicio + self._colunas
+        return (SIMBOLOS[codigo] for codigo in self._dados[self._inicio:fim])
+
+
+class MazeGrid:
+    """
+    Labirinto armazenado em um `bytearray`, com um byte por célula.
+
+    Args:
+        linhas (int): Número de linhas do labirinto.
+        colunas (int): Número de colunas do labirinto.
+        dados (bytearray, opcional): Códigos das células, linha após linha.
+            Se omitido, o labirinto começa todo preenchido com paredes.
+    """
+
+    __slots__ = ('linhas', 'colunas', 'dados')
+
+    def __init__(self, linhas, colunas, dados=None):
+        if dados is None:
+            dados = bytearray(linhas * colunas)  # PAREDE == 0
+        elif len(dados) != linhas * colunas:
+            raise ValueError("Tamanho dos dados não corresponde às dimensões do labirinto.")
+        self.linhas = linhas
+        self.colunas = colunas
+        self.dados = dados
+
+    @classmethod
+    def from_lists(cls, labirinto):
+        """
+        Cria um `MazeGrid` a partir de uma lista de listas de caracteres.
+
+        Args:
+            labirinto (list[list[str]]): Estrutura do labirinto.
+
+        Returns:
+            MazeGrid: Labirinto compacto equivalente.
+        """
+        if isinstance(labirinto, cls):
+            return labirinto.copy()
+        linhas = len(labirinto)
+        colunas = len(labirinto[0]) if linhas else 0
+        dados = bytearray()
+        for linha in labirinto:
+            if len(linha) != colunas:
+                raise ValueError("Todas as linhas do labirinto devem ter o mesmo tamanho.")
+            dados.extend(codificar(celula) for celula in linha)
+        return cls(linhas, colunas, dados)
+
+    def to_lists(self):
+        """
+        Converte o labirinto de volta para uma lista de listas de caracteres.
+
+        Returns:
+            list[list[str]]: Estrutura do labirinto.
+        """
+        return [list(linha) for linha in self]
+
+    def copy(self):
+        """Retorna uma cópia independente do labirinto."""
+        return MazeGrid(self.linhas, self.colunas, bytearray(self.dados))
+
+    def empacotar(self):
+        """
+        Compacta o labirinto com um bit por célula (1 = passagem, 0 = parede).
+
+        Células que não são parede nem caminho livre (início, saída, solução)
+        são devolvidas à parte, como pares (índice, código).
+
+        Returns:
+            tuple: (bits em `bytes`, linha após linha, como em `empacotar_bits`;
+            lista de (índice, código) das células especiais).
+        """
+        bits = empacotar_bits(self.dados)
+        especiais = []
+        for codigo in (INICIO, SAIDA, SOLUCAO):
+            indice = self.dados.find(codigo)
+            while indice != -1:
+                especiais.append((indice, codigo))
+                indice = self.dados.find(codigo, indice + 1)
+        return bits, especiais
+
+    @classmethod
+    def desempacotar(cls, linhas, colunas, bits, especiais=()):
+        """
+        Reconstrói um labirinto compactado por `empacotar`.
+
+        Args:
+            linhas (int): Número de linhas do labirinto.
+            colunas (int): Número de colunas do labirinto.
+            bits (bytes): Um bit por célula, como devolvido por `empacotar`.
+            especiais (Iterable[tuple]): Pares (índice, código) das células especiais.
+
+        Returns:
+            MazeGrid: Labirinto reconstruído.
+        """
+        total = linhas * colunas
+        if len(bits) != (total + 7) // 8:
+            raise ValueError("Tamanho dos bits não corresponde às dimensões do labirinto.")
+        dados = desempacotar_bits(bits, total)
+        for indice, codigo in especiais:
+            dados[indice] = codigo
+        return cls(linhas, colunas, dados)
+
+    def celula(self, i, j):
+        """Retorna o código numérico da célula (i, j)."""
+        return self.dados[i * self.colunas + j]
+
+    def linha_bytes(self, i):
+        """Retorna uma cópia dos códigos da linha `i` como `bytes`."""
+        inicio = i * self.colunas
+        return bytes(self.dados[inicio:inicio + self.colunas])
+
+    def contar(self, simbolo):
+        """Conta quantas células do labirinto têm o símbolo informado."""
+        return self.dados.count(codificar(simbolo))
+
+    def encontrar(self, simbolo):
+        """
+        Procura a primeira célula com o símbolo informado.
+
+        Returns:
+            tuple: Posição (linha, coluna), ou None se o símbolo não existir.
+        """
+        indice = self.dados.find(codificar(simbolo))
+        return None if indice == -1 else divmod(indice, self.colunas)
+
+    def substituir(self, antigo, novo):
+        """Troca, de uma só vez, todas as células `antigo` pelo símbolo `novo`."""
+        tabela = bytearray(range(256))
+        tabela[codificar(antigo)] = codificar(novo)
+        self.dados[:] = self.dados.translate(tabela)
+
+    def __len__(self):
+        return self.linhas
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self.linhas
+        if not 0 <= i < self.linhas:
+            raise IndexError("Linha fora do labirinto.")
+        return _LinhaGrade(self.dados, i * self.colunas, self.colunas)
+
+    def __iter__(self):
+        for i in range(self.linhas):
+            yield _LinhaGrade(self.dados, i * self.colunas, self.colunas)
+
+    def __eq__(self, outro):
+        if not isinstance(outro, MazeGrid):
+            return NotImplemented
+        return (self.linhas, self.colunas, self.dados) == (outro.linhas, outro.colunas, outro.dados)
@@ -3,24 +3,27 @@
 Módulo responsável pelo controle do jogador no labirinto.
 
 Gerencia a movimentação, pontuação, sons e interação com o teclado
-durante o jogo. Também inclui funcionalidades como mostrar a solução
-recursiva do labirinto e retorno ao menu.
+durante o jogo. O estado da partida fica em uma `Partida`; este módulo
+cuida da parte de terminal (tela, sons e teclado).
+
+O teclado apenas entrega comandos (veja `entrada`); um laço de desenho
+aplica todos os movimentos pendentes e desenha no máximo um quadro por
+tique da tela, de modo que segurar uma seta não acumula redesenhos atrasados.
 """
-import os
-from pynput import keyboard
-from . import labirinto
+import asyncio
+import sqlite3
+import time
+
+from .entrada import ENTRADAS, SAIR, criar_entrada
+from .renderizador import RenderizadorDiferencial
 from rich.console import Console
 from rich.panel import Panel
-import pygame
-
-pygame.init()
-pygame.mixer.init()
-
-som_passo = pygame.mixer.Sound("sons/passo.mp3")
-som_vitoria = pygame.mixer.Sound("sons/vitoria.mp3")
-som_saida = pygame.mixer.Sound("sons/saida.mp3")
+from .audio import criar_audio
+from .partida import CUSTO_MOVIMENTO, Evento, Partida, pontuacao_inicial
+from .ranking import ranking
 
 som_ativado = True  # Som ativado por padrão
+audio = criar_audio(som_ativado)  # o mixer só é iniciado no primeiro som tocado
 
 def configurar_som(ativo: bool):
     """
@@ -29,90 +32,207 @@ def configurar_som(ativo: bool):
     Args:
         ativo (bool): Se True, o som será ativado. Caso contrário, desativado.
     """
-    global som_ativado
+    global som_ativado, audio
     som_ativado = ativo
+    audio.encerrar()
+    audio = criar_audio(ativo)
+
+# Quadros desenhados por segundo, no máximo, durante a partida
+QUADROS_POR_SEGUNDO = 30
+quadros_por_segundo = QUADROS_POR_SEGUNDO
+
+# Fonte do teclado: 'pynput' (teclado do sistema) ou 'terminal' (entrada padrão)
+tipo_entrada = "pynput"
+
+def configurar_quadros(fps: int):
+    """
+    Define quantos quadros por segundo, no máximo, são desenhados durante a partida.
+
+    Args:
+        fps (int): Quadros por segundo (maior que zero).
+    """
+    global quadros_por_segundo
+    if fps <= 0:
+        raise ValueError("A taxa de quadros deve ser maior que zero.")
+    quadros_por_segundo = fps
 
+def configurar_entrada(tipo: str):
+    """
+    Escolhe de onde vêm as teclas durante a partida.
+
+    Args:
+        tipo (str): 'pynput', que escuta o teclado do sistema, ou 'terminal',
+                    que lê as setas da entrada padrão (funciona por SSH).
+    """
+    global tipo_entrada
+    if tipo not in ENTRADAS:
+        raise ValueError(f"Entrada desconhecida: {tipo}.")
+    tipo_entrada = tipo
+
+# Espelho do estado da partida em andamento, para o restante da interface
 jogador_pos = [0, 0]
 pontuacao = 0
 movimentos = 0
 fim_jogo = False
+partida = None  # Partida em andamento no terminal
+dificuldade_atual = "facil"
+nome_jogador = None  # Nome usado no ranking; sem nome, as vitórias não são registradas
+partida_ranqueada = True  # Labirintos de arquivo não entram no ranking
 console = Console()
-
-# Referência para função de retorno ao menu (a ser atribuída externamente)
-voltar_menu_callback = None
+renderizador = RenderizadorDiferencial(console)
 
 def limpar_tela():
-    """Limpa o terminal conforme o sistema operacional."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    """Limpa o terminal e leva o cursor ao topo, sem criar um novo processo."""
+    console.clear()
+
 
+def _sincronizar():
+    """Copia o estado da partida em andamento para as variáveis do módulo."""
+    global pontuacao, movimentos, fim_jogo
+    jogador_pos[:] = partida.posicao
+    pontuacao = partida.pontuacao
+    movimentos = partida.movimentos
+    fim_jogo = partida.fim_jogo
 
-def iniciar_jogador(dificuldade: str):
+
+def iniciar_jogador(dificuldade: str, lab=None, semente=None, inicio=(1, 1), nome=None, ranqueada=True):
     """
     Inicializa a posição e pontuação do jogador com base na dificuldade.
 
     Args:
         dificuldade (str): Um dos níveis ('facil', 'medio', 'dificil',
                            'super-dificil', 'max-dificil').
+        lab (MazeGrid | list[list[str]], opcional): Labirinto da nova partida.
+        semente (int, opcional): Semente com que o labirinto foi gerado.
+        inicio (tuple): Posição inicial do jogador.
+        nome (str, opcional): Nome do jogador no ranking; por padrão, mantém o atual.
+        ranqueada (bool): Se False, a vitória não entra no ranking, por exemplo
+            num labirinto de arquivo, cujo tamanho não segue a dificuldade.
     """
-    global jogador_pos, pontuacao
-    jogador_pos = [1, 1]
-    
-    if dificuldade == "facil":
-        pontuacao = 500
-    elif dificuldade == "medio":
-        pontuacao = 1000
-    elif dificuldade == "dificil":
-        pontuacao = 1600
-    elif dificuldade == "super-dificil":
-        pontuacao = 2500
-    elif dificuldade == "max-dificil":
-        pontuacao = 3000
-    else:
-        pontuacao = 500  # Padrão
+    global jogador_pos, pontuacao, movimentos, fim_jogo, partida, dificuldade_atual, nome_jogador
+    global partida_ranqueada
+    dificuldade_atual = dificuldade
+    partida_ranqueada = ranqueada
+    if nome is not None:
+        nome_jogador = nome
+    jogador_pos = list(inicio)
+    movimentos = 0
+    fim_jogo = False
+    pontuacao = pontuacao_inicial(dificuldade)
+    partida = Partida(lab, dificuldade, tuple(inicio), semente) if lab is not None else None
+    renderizador.invalidar()  # nova partida começa com a tela inteira redesenhada
     
 
+def aplicar_movimento(direcao, lab):
+    """
+    Aplica um movimento ao estado da partida, sem redesenhar a tela.
+
+    Args:
+        direcao (str): Direção do movimento ('up', 'down', 'left', 'right').
+        lab (list[list[str]]): Estrutura do labirinto.
+
+    Returns:
+        tuple: Eventos ocorridos, como em `Partida.mover`.
+    """
+    global partida
+
+    if partida is None or partida.labirinto is not lab:
+        # Partida iniciada sem labirinto: continua do estado atual do módulo
+        partida = Partida(lab, dificuldade_atual, tuple(jogador_pos))
+        partida.pontuacao, partida.movimentos = pontuacao, movimentos
+
+    eventos = partida.mover(direcao)
+    _sincronizar()
+    if Evento.MOVEU in eventos:
+        audio.tocar("passo")  #  toca o som de passo
+    return eventos
+
+
+def desenhar_quadro(lab):
+    """
+    Desenha o estado atual da partida.
+
+    Args:
+        lab (list[list[str]]): Estrutura do labirinto.
+    """
+    # Redesenha só as células e linhas do placar que mudaram
+    renderizador.desenhar(lab, jogador_pos, [
+        f"[green]Numero de movimentos:[/green] {movimentos}",
+        f"[yellow]Pontuação:[/yellow] {pontuacao}",
+    ])
+
+
+def registrar_resultado():
+    """
+    Envia a partida vencida ao ranking, sem esperar a gravação.
+
+    Returns:
+        int: Posição da pontuação no ranking da dificuldade, ou None se o
+        jogador não tem nome, a partida não é ranqueada ou o ranking não
+        pôde ser consultado.
+    """
+    if nome_jogador is None or not partida_ranqueada:
+        return None
+    try:
+        posicao = ranking.posicao(dificuldade_atual, pontuacao)
+    except (sqlite3.Error, OSError):
+        posicao = None  # Sem banco, o jogo segue sem ranking
+    semente = partida.semente if partida is not None else None
+    ranking.registrar(nome_jogador, dificuldade_atual, pontuacao, movimentos, semente)
+    return posicao
+
+
+def anunciar_vitoria():
+    """Toca o som de vitória, registra o resultado, mostra a mensagem e encerra a partida."""
+    audio.tocar("vitoria")  # som de vitória
+    posicao = registrar_resultado()
+    mensagem = "[bold green]🎉 Você venceu o labirinto! Parabéns![/bold green]\n"
+    if posicao is not None:
+        mensagem += f"[magenta]🏆 {posicao}º lugar no ranking ({dificuldade_atual})[/magenta]\n"
+    console.print(Panel.fit(
+        mensagem + "[cyan]Voltando ao menu...[/cyan]",
+        title="Fim de jogo",
+        border_style="bold green"
+    ))
+    encerrar_jogo()
+
+
 def mover(direcao, lab):
     """
     Move o jogador no labirinto, se possível, e atualiza o estado do jogo.
 
+    As regras ficam em `Partida.mover`; esta função apenas reage aos
+    eventos com sons, mensagens e o redesenho da tela.
+
     Args:
         direcao (str): Direção do movimento ('up', 'down', 'left', 'right').
         lab (list[list[str]]): Estrutura do labirinto.
     """
-    global jogador_pos, pontuacao, fim_jogo
+    eventos = aplicar_movimento(direcao, lab)
+    desenhar_quadro(lab)
+    if Evento.VENCEU in eventos:
+        anunciar_vitoria()
 
-    i, j = jogador_pos
-    nova_pos = jogador_pos[:]
 
-    if direcao == "up":
-        nova_pos[0] -= 1
-    elif direcao == "down":
-        nova_pos[0] += 1
-    elif direcao == "left":
-        nova_pos[1] -= 1
-    elif direcao == "right":
-        nova_pos[1] += 1
-    
-    if 0 <= nova_pos[0] < len(lab) and 0 <= nova_pos[1] < len(lab[0]):
-        if lab[nova_pos[0]][nova_pos[1]] != "#":
-            jogador_pos[:] = nova_pos
-            pontuar()
-            if som_ativado:
-                som_passo.play()  #  toca o som de passo
-            if lab[nova_pos[0]][nova_pos[1]] == "F":
-                if som_ativado:
-                    som_vitoria.play()  # som de vitória
-                console.print(Panel.fit(
-                    "[bold green]🎉 Você venceu o labirinto! Parabéns![/bold green]\n[cyan]Voltando ao menu...[/cyan]",
-                    title="Fim de jogo",
-                    border_style="bold green"
-                ))
-                encerrar_jogo()
-    limpar_tela()  # limpar tela
-    console.print(f"[green]Numero de movimentos:[/green] {movimentos}")
-    console.print(f"[yellow]Pontuação:[/yellow] {pontuacao}")
-    
-    labirinto.imprimir_labirinto(lab, jogador_pos)
+def processar_comandos(comandos, lab):
+    """
+    Aplica todos os comandos pendentes e desenha um único quadro.
+
+    Args:
+        comandos (list[str]): Direções ou `SAIR`, na ordem em que chegaram.
+        lab (list[list[str]]): Estrutura do labirinto.
+    """
+    venceu = False
+    for comando in comandos:
+        if comando == SAIR:
+            encerrar_jogo()
+            return
+        if Evento.VENCEU in aplicar_movimento(comando, lab):
+            venceu = True
+            break  # as teclas seguintes chegaram depois do fim da partida
+    desenhar_quadro(lab)
+    if venceu:
+        anunciar_vitoria()
     
 
 def pontuar():
@@ -121,97 +241,72 @@ def pontuar():
     """
     global movimentos
     global pontuacao
-    pontuacao -= 10
+    if partida is not None:
+        partida.pontuar()
+        _sincronizar()
+        return
+    pontuacao -= CUSTO_MOVIMENTO
     movimentos += 1
 
 def encerrar_jogo():
     """
-    Encerra o jogo, imprime mensagem de despedida e retorna ao menu, se aplicável.
+    Encerra o jogo e imprime mensagem de despedida.
+
+    A espera por teclas termina em seguida e o laço de `utils.executar_menu`
+    volta ao menu.
     """
     global fim_jogo
     fim_jogo = True
-    if som_ativado:
-        som_saida.play()  # som de saída
+    if partida is not None:
+        partida.encerrar()
+    audio.tocar("saida")  # som de saída
     console.print(Panel.fit(
         "[bold red]👋 Saindo do jogo. Até a próxima, aventureiro(a)![/bold red]",
         title="Saída",
         border_style="red"
     ))
-    if voltar_menu_callback:
-        voltar_menu_callback()  # Retorna ao menu principal
 
 
-def aguardar_movimento(lab):
+async def aguardar_movimento_async(lab, fps=None, entrada=None):
     """
     Aguarda a entrada do jogador via teclado e processa os comandos.
 
+    A fonte do teclado só entrega comandos. Este laço espera o primeiro
+    comando, junta todos os que chegaram enquanto isso, aplica-os e desenha
+    um único quadro; depois espera o fim do tique antes do próximo quadro.
+    As esperas são feitas no laço de eventos, que fica livre para outras
+    tarefas durante a partida.
+
     Args:
         lab (list[list[str]]): Estrutura do labirinto.
+        fps (int, opcional): Quadros por segundo, no máximo; por padrão, `quadros_por_segundo`.
+        entrada (EntradaPynput | EntradaTerminal, opcional): Fonte dos comandos;
+            por padrão, uma nova do tipo `tipo_entrada`.
     """
     console.print("[bold cyan]Use as setas do teclado para se mover. Pressione ESC para sair.[/bold cyan]\n")
 
-    def on_press(tecla):
-        global fim_jogo
-
-        try:
-            match tecla:
-                case keyboard.Key.up:
-                    mover("up", lab)
-                case keyboard.Key.down:
-                    mover("down", lab)
-                case keyboard.Key.left:
-                    mover("left", lab)
-                case keyboard.Key.right:
-                    mover("right", lab)
-                case keyboard.Key.esc:
-                    encerrar_jogo()
-                    return False
-        except Exception as e:
-            console.print(f"[red]Erro ao processar tecla: {e}[/red]")
-
-        if fim_jogo:
-            return False
-
-    with keyboard.Listener(on_press=on_press) as listener:
-        listener.join()
-
-def mostrar_solucao_recursiva(labirinto, inicio=(1, 1), caminho=None, visitados=None):
+    intervalo = 1 / (fps or quadros_por_segundo)
+    with entrada or criar_entrada(tipo_entrada) as fonte:
+        while not fim_jogo:
+            comandos = await fonte.ler_comandos_async()
+            inicio_quadro = time.monotonic()
+            try:
+                processar_comandos(comandos, lab)
+            except Exception as e:
+                console.print(f"[red]Erro ao processar tecla: {e}[/red]")
+            # No máximo um quadro por tique; as teclas desse intervalo vão para o próximo quadro
+            espera = intervalo - (time.monotonic() - inicio_quadro)
+            if espera > 0:
+                await asyncio.sleep(espera)
+
+
+def aguardar_movimento(lab, fps=None, entrada=None):
     """
-    Resolve o labirinto de forma recursiva e retorna o caminho até a saída.
+    Joga a partida num laço de eventos próprio, para quem não está em um.
 
     Args:
-        labirinto (list[list[str]]): Estrutura do labirinto.
-        inicio (tuple): Coordenadas iniciais do jogador.
-        caminho (list): Caminho acumulado durante a recursão.
-        visitados (set): Conjunto de coordenadas já visitadas.
-
-    Returns:
-        list: Lista de tuplas representando o caminho da solução, ou None se não houver solução.
+        lab (list[list[str]]): Estrutura do labirinto.
+        fps (int, opcional): Quadros por segundo, no máximo.
+        entrada (EntradaPynput | EntradaTerminal, opcional): Fonte dos comandos.
     """
-    if caminho is None:
-        caminho = []
-    if visitados is None:
-        visitados = set()
-
-    i, j = inicio
-
-    if not (0 <= i < len(labirinto) and 0 <= j < len(labirinto[0])):
-        return None  # Fora dos limites
-
-    if labirinto[i][j] == '#' or (i, j) in visitados:
-        return None  # Parede ou já visitado
-
-    caminho.append((i, j))
-    visitados.add((i, j))
-
-    if labirinto[i][j] == 'F':
-        return caminho  # Solução encontrada
-
-    # Movimentos possíveis: cima, baixo, esquerda, direita
-    for di, dj in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-        proximo = (i + di, j + dj)
-        resultado = mostrar_solucao_recursiva(labirinto, proximo, caminho[:], visitados.copy())
-        if resultado:
-            return resultado
-
-    return None  # Sem solução a partir desse caminho
+    asyncio.run(aguardar_movimento_async(lab, fps, entrada))
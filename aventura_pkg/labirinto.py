@@ -2,109 +2,409 @@
 """
 Módulo responsável pela criação e impressão do labirinto.
 """
+import asyncio
 import random
 from rich import print
 from rich.console import Console
-from rich.text import Text
-from aventura_pkg.jogador import movimentos ,pontuacao
+from aventura_pkg.cache_labirintos import cache_labirintos
+from aventura_pkg.arquivo_labirinto import EscritorBinario, carregar_labirinto, eh_arquivo_binario
+from aventura_pkg.grade import MazeGrid, PAREDE, LIVRE, SAIDA, SIMBOLOS
+from aventura_pkg.renderizador import Camera, cache_linhas, quadro_janela, tamanho_janela
 import time
-import os
 
-def criar_labirinto(dificuldade):
+def nova_semente():
+    """
+    Sorteia uma semente para um labirinto novo.
+
+    Returns:
+        int: Semente entre 0 e 2**32 - 1, curta o bastante para ser anotada e compartilhada.
+    """
+    return random.SystemRandom().randrange(2 ** 32)
+
+
+def criar_labirinto(dificuldade, algoritmo='escavacao', semente=None, usar_cache=True):
     """
     Cria um labirinto com base no nível de dificuldade selecionado.
 
     Args:
         dificuldade (str): Nível de dificuldade escolhido pelo jogador.
             Pode ser: 'facil', 'medio', 'dificil', 'super-dificil' ou 'max-difícil'.
+        algoritmo (str): Algoritmo de geração ('escavacao' ou 'arvore-binaria').
+        semente (int, opcional): Semente do gerador; a mesma semente, dificuldade
+            e algoritmo produzem sempre o mesmo labirinto.
+        usar_cache (bool): Se False, não consulta nem preenche o cache em disco.
 
     Returns:
-        list: Uma matriz (lista de listas) representando o labirinto gerado.
+        MazeGrid: Labirinto gerado, indexável como uma matriz.
     """
     if dificuldade == 'facil':
-        return gerar_labirinto_aleatorio(11, 11)
+        tamanho = 11
     elif dificuldade == 'medio':
-        return gerar_labirinto_aleatorio(15, 15)
+        tamanho = 15
     elif dificuldade == 'dificil':
-        return gerar_labirinto_aleatorio(19, 19)
+        tamanho = 19
     elif dificuldade == 'super-dificil':
-        return gerar_labirinto_aleatorio(25, 25)
+        tamanho = 25
     elif dificuldade == 'max-dificil':
-        return gerar_labirinto_aleatorio(31,31)
+        tamanho = 31
     else:
         raise ValueError("Dificuldade inválida.")
+    return gerar_labirinto(tamanho, tamanho, algoritmo, semente, usar_cache)
+
+
+def gerar_labirinto(linhas, colunas, algoritmo='escavacao', semente=None, usar_cache=True):
+    """
+    Gera um labirinto de qualquer tamanho, consultando o cache em disco.
+
+    Labirintos com semente são determinísticos, então os grandes o bastante
+    para valer a leitura (`cache_labirintos.aceita`) são guardados em
+    `cache_labirintos`, e as próximas chamadas com os mesmos parâmetros os
+    leem do disco em vez de gerar de novo. Sem semente, nada é guardado.
+
+    Args:
+        linhas (int): Número de linhas do labirinto.
+        colunas (int): Número de colunas do labirinto.
+        algoritmo (str): Algoritmo de geração ('escavacao' ou 'arvore-binaria').
+        semente (int, opcional): Semente do gerador.
+        usar_cache (bool): Se False, não consulta nem preenche o cache em disco.
+
+    Returns:
+        MazeGrid: Labirinto gerado ou lido do cache.
+    """
+    try:
+        gerar = GERADORES[algoritmo]
+    except KeyError:
+        raise ValueError("Algoritmo de geração inválido.") from None
+
+    if semente is None or not usar_cache:
+        return gerar(linhas, colunas, semente)
+    lab = cache_labirintos.obter_labirinto(algoritmo, linhas, colunas, semente)
+    if lab is None:
+        lab = gerar(linhas, colunas, semente)
+        cache_labirintos.guardar_labirinto(algoritmo, linhas, colunas, semente, lab)
+    return lab
 
 
 console = Console()
 
-def imprimir_labirinto(labirinto, pos_jogador=None):
+def imprimir_labirinto(labirinto, pos_jogador=None, janela=False, margem=3):
     """
     Imprime visualmente o labirinto no terminal usando cores e símbolos.
 
+    As linhas já estilizadas ficam em cache; a cada quadro só a linha onde
+    está o jogador é montada de novo.
+
     Args:
-        labirinto (list): Estrutura do labirinto (matriz de caracteres).
+        labirinto (MazeGrid | list): Estrutura do labirinto (matriz de caracteres).
         pos_jogador (tuple, opcional): Posição atual do jogador no labirinto.
+        janela (bool): Se True, imprime só a parte do labirinto ao redor do
+            jogador que cabe no terminal.
+        margem (int): Margem, em células, entre o jogador e a borda da janela.
     """
-    for i, linha in enumerate(labirinto):
-        linha_colorida = Text()
-        for j, celula in enumerate(linha):
-            if (i, j) == tuple(pos_jogador):
-                linha_colorida.append("😎", style="bold cyan")  # personagem
-            elif celula == "#":
-                linha_colorida.append("██", style="grey61")  # parede
-            elif celula == ".":
-                linha_colorida.append("  ")  # caminho vazio
-            elif celula == "S":
-                linha_colorida.append("S ", style="bold green")  # início
-            elif celula == "F":
-                linha_colorida.append("F ", style="bold red")  # fim
-            elif celula == "*":
-                linha_colorida.append("• ", style="yellow")  # parte da solução
-            else:
-                linha_colorida.append(f"{celula} ")
-        console.print(linha_colorida)
+    if janela:
+        altura, largura = tamanho_janela(console, labirinto)
+        camera = Camera(margem)
+        camera.seguir(pos_jogador or (0, 0), altura, largura, len(labirinto), len(labirinto[0]))
+        if pos_jogador is not None:
+            pos_jogador = tuple(pos_jogador)
+        quadro = quadro_janela(labirinto, pos_jogador, camera.topo, camera.esquerda, altura, largura)
+    else:
+        quadro = cache_linhas.quadro(labirinto, pos_jogador)
+    console.print(quadro)
     console.print()  # linha em branco
 
 import random
 
-def gerar_labirinto_aleatorio(linhas, colunas):
+def gerar_labirinto_aleatorio(linhas, colunas, semente=None):
     """
     Gera um labirinto aleatório usando algoritmo de escavação com pilha.
 
     Args:
         linhas (int): Número de linhas do labirinto.
         colunas (int): Número de colunas do labirinto.
+        semente (int, opcional): Semente do gerador. Cada chamada usa seu
+            próprio `random.Random`, sem tocar no estado global do `random`.
 
     Returns:
-        list: Labirinto representado como uma matriz.
+        MazeGrid: Labirinto compacto, indexável como uma matriz.
     """
-    lab = [['#' for _ in range(colunas)] for _ in range(linhas)]
+    if linhas < 3 or colunas < 3:
+        raise ValueError("Labirinto pequeno demais.")
+    aleatorio = random.Random(semente)
+    lab = MazeGrid(linhas, colunas)
+    dados = lab.dados
 
     def dentro_do_labirinto(x, y):
         return 0 < x < linhas-1 and 0 < y < colunas-1
 
     stack = [(1, 1)]
-    lab[1][1] = ' '
+    dados[1 * colunas + 1] = LIVRE
 
     while stack:
         x, y = stack[-1]
         direcoes = [(0, 2), (0, -2), (2, 0), (-2, 0)]
-        random.shuffle(direcoes)
+        aleatorio.shuffle(direcoes)
         for dx, dy in direcoes:
             nx, ny = x + dx, y + dy
-            if dentro_do_labirinto(nx, ny) and lab[nx][ny] == '#':
-                lab[nx][ny] = ' '
-                lab[x + dx // 2][y + dy // 2] = ' '  # quebra a parede entre as células
+            if dentro_do_labirinto(nx, ny) and dados[nx * colunas + ny] == PAREDE:
+                dados[nx * colunas + ny] = LIVRE
+                dados[(x + dx // 2) * colunas + y + dy // 2] = LIVRE  # quebra a parede entre as células
                 stack.append((nx, ny))
                 break
         else:
             stack.pop()
 
-    lab[1][1] = ' '
-    lab[linhas - 2][colunas - 2] = 'F'
+    dados[1 * colunas + 1] = LIVRE
+    # Última célula escavada; com dimensões pares, (linhas - 2, colunas - 2) é parede
+    dados[(2 * ((linhas - 1) // 2) - 1) * colunas + 2 * ((colunas - 1) // 2) - 1] = SAIDA
+    return lab
+
+
+
+def gerar_labirinto_arvore_binaria(linhas, colunas, semente=None):
+    """
+    Gera um labirinto perfeito com o algoritmo de árvore binária, linha a linha.
+
+    Cada célula abre a passagem para o norte ou para o leste. As escolhas de
+    uma linha inteira são sorteadas de uma vez e gravadas com fatias do
+    `bytearray`, sem laço Python por célula, o que permite gerar labirintos
+    de 10.000x10.000 em poucos segundos. Os corredores tendem a seguir a
+    diagonal para o canto superior direito.
+
+    Args:
+        linhas (int): Número de linhas do labirinto.
+        colunas (int): Número de colunas do labirinto.
+        semente (int, opcional): Semente do gerador.
+
+    Returns:
+        MazeGrid: Labirinto compacto, indexável como uma matriz.
+    """
+    aleatorio = random.Random(semente)
+    lab = MazeGrid(linhas, colunas)
+    dados = lab.dados
+    celulas_linha = (linhas - 1) // 2
+    celulas_coluna = (colunas - 1) // 2
+    if celulas_linha < 1 or celulas_coluna < 1:
+        raise ValueError("Labirinto pequeno demais.")
+
+    fim_celulas = 2 * celulas_coluna  # posição após a última célula da linha
+    celulas = bytes([LIVRE]) * celulas_coluna
+    so_leste = bytes([LIVRE]) * celulas_coluna
+
+    for r in range(celulas_linha):
+        y = 2 * r + 1
+        if r == 0:
+            leste = so_leste  # a primeira linha só pode abrir para o leste
+        else:
+            leste = aleatorio.randbytes(celulas_coluna).translate(_SORTEIO_LESTE)
+        norte = bytearray(leste.translate(_INVERTER))
+        norte[-1] = LIVRE  # a última coluna só pode abrir para o norte
+
+        inicio = y * colunas
+        dados[inicio + 1:inicio + fim_celulas:2] = celulas
+        dados[inicio + 2:inicio + fim_celulas - 1:2] = leste[:-1]
+        if r > 0:
+            acima = inicio - colunas
+            dados[acima + 1:acima + fim_celulas:2] = norte
+
+    dados[1 * colunas + 1] = LIVRE
+    # A saída fica na última célula; com dimensões pares, (linhas - 2, colunas - 2) é parede
+    dados[(2 * celulas_linha - 1) * colunas + 2 * celulas_coluna - 1] = SAIDA
     return lab
 
 
+def gerar_linhas_eller(linhas, colunas, semente=None):
+    """
+    Gera um labirinto perfeito linha a linha, com o algoritmo de Eller.
+
+    Cada linha é entregue assim que fica pronta, e o estado guardado entre
+    elas é só o conjunto de cada célula da linha atual, então a memória é
+    proporcional à largura, não à altura: dá para gravar um labirinto de
+    1.000.000 de linhas direto num arquivo ou num socket.
+
+    Args:
+        linhas (int): Número de linhas do labirinto.
+        colunas (int): Número de colunas do labirinto.
+        semente (int, opcional): Semente do gerador.
+
+    Yields:
+        bytes: Códigos das células de cada linha, de cima para baixo. A
+        saída fica na última célula, em (linhas - 2, colunas - 2) quando as
+        dimensões são ímpares.
+    """
+    aleatorio = random.Random(semente)
+    celulas_linha = (linhas - 1) // 2
+    celulas_coluna = (colunas - 1) // 2
+    if celulas_linha < 1 or celulas_coluna < 1:
+        raise ValueError("Labirinto pequeno demais.")
+
+    parede = bytes(colunas)  # PAREDE == 0
+    celulas = bytes([LIVRE]) * celulas_coluna
+    conjuntos = list(range(celulas_coluna))
+    proximo = celulas_coluna
+    yield parede
+
+    for r in range(celulas_linha):
+        ultima = r == celulas_linha - 1
+        linha = bytearray(colunas)
+        linha[1:2 * celulas_coluna:2] = celulas
+
+        # Junta vizinhos de conjuntos diferentes; na última linha, todos
+        pais = {}
+
+        def raiz(conjunto):
+            while conjunto in pais:
+                conjunto = pais[conjunto]
+            return conjunto
+
+        sorteio = aleatorio.randbytes(celulas_coluna)
+        for c in range(celulas_coluna - 1):
+            a, b = raiz(conjuntos[c]), raiz(conjuntos[c + 1])
+            if a != b and (ultima or sorteio[c] < 128):
+                pais[b] = a
+                linha[2 * c + 2] = LIVRE
+        conjuntos = [raiz(conjunto) for conjunto in conjuntos]
+
+        if ultima:
+            linha[2 * celulas_coluna - 1] = SAIDA
+            yield bytes(linha)
+            break
+
+        # Cada conjunto desce por pelo menos uma célula; as demais ganham conjuntos novos
+        abaixo = bytearray(colunas)
+        membros = {}
+        for c, conjunto in enumerate(conjuntos):
+            membros.setdefault(conjunto, []).append(c)
+        sorteio = aleatorio.randbytes(celulas_coluna)
+        for grupo in membros.values():
+            descem = [c for c in grupo if sorteio[c] < 128] or [aleatorio.choice(grupo)]
+            for c in descem:
+                abaixo[2 * c + 1] = LIVRE
+        for c in range(celulas_coluna):
+            if not abaixo[2 * c + 1]:
+                conjuntos[c] = proximo
+                proximo += 1
+
+        yield bytes(linha)
+        yield bytes(abaixo)
+
+    for _ in range(linhas - 2 * celulas_linha):
+        yield parede  # borda inferior (e uma linha extra quando a altura é par)
+
+
+def gerar_labirinto_eller(linhas, colunas, semente=None):
+    """
+    Gera um labirinto inteiro em memória com o algoritmo de Eller.
+
+    Args:
+        linhas (int): Número de linhas do labirinto.
+        colunas (int): Número de colunas do labirinto.
+        semente (int, opcional): Semente do gerador.
+
+    Returns:
+        MazeGrid: Labirinto compacto, indexável como uma matriz.
+    """
+    dados = bytearray().join(gerar_linhas_eller(linhas, colunas, semente))
+    return MazeGrid(linhas, colunas, dados)
+
+
+# Código de célula -> símbolo do formato de texto, para `bytes.translate`
+_PARA_TEXTO = bytes(ord(SIMBOLOS[b]) if b < len(SIMBOLOS) else ord('?') for b in range(256))
+
+
+def escrever_linhas_texto(linhas_geradas, saida):
+    """
+    Grava linhas de códigos no formato de texto, uma linha do labirinto por linha.
+
+    Cada célula vira o seu símbolo ('#', ' ', 'S', 'F' ou '*'); o arquivo
+    pode ser lido de volta com `ler_labirinto_texto` e exibido com
+    `imprimir_labirinto`.
+
+    Args:
+        linhas_geradas (Iterable[bytes]): Linhas, por exemplo de `gerar_linhas_eller`.
+        saida (BinaryIO): Arquivo ou fluxo aberto em modo binário.
+    """
+    for codigos in linhas_geradas:
+        saida.write(codigos.translate(_PARA_TEXTO) + b"\n")
+
+
+def escrever_linhas_binario(linhas_geradas, caminho, linhas, colunas, semente=None):
+    """
+    Grava linhas de códigos no formato binário compactado de `arquivo_labirinto`.
+
+    Args:
+        linhas_geradas (Iterable[bytes]): Linhas, por exemplo de `gerar_linhas_eller`.
+        caminho (str): Arquivo de destino.
+        linhas (int): Número de linhas do labirinto.
+        colunas (int): Número de colunas do labirinto.
+        semente (int, opcional): Semente com que o labirinto foi gerado.
+    """
+    with EscritorBinario(caminho, linhas, colunas, semente=semente) as escritor:
+        for codigos in linhas_geradas:
+            escritor.escrever_linha(codigos)
+
+
+def ler_labirinto_texto(caminho):
+    """
+    Lê um labirinto gravado no formato de texto.
+
+    Args:
+        caminho (str): Arquivo com uma linha do labirinto por linha de texto.
+
+    Returns:
+        MazeGrid: Labirinto lido.
+    """
+    with open(caminho, encoding="utf-8") as f:
+        return MazeGrid.from_lists([list(linha.rstrip("\n")) for linha in f])
+
+
+def abrir_labirinto(caminho):
+    """
+    Abre um arquivo de labirinto no formato binário ou de texto.
+
+    Args:
+        caminho (str): Arquivo gravado por `salvar_labirinto` ou `escrever_linhas_texto`.
+
+    Returns:
+        LabirintoMapeado | MazeGrid: O binário é mapeado em memória; o texto é lido inteiro.
+    """
+    if eh_arquivo_binario(caminho):
+        return carregar_labirinto(caminho)
+    return ler_labirinto_texto(caminho)
+
+
+# Tabelas para `bytes.translate`: sorteio 50% leste/norte e inversão da escolha
+_SORTEIO_LESTE = bytes(LIVRE if b < 128 else PAREDE for b in range(256))
+_INVERTER = bytes(LIVRE if b == PAREDE else PAREDE for b in range(256))
+
+GERADORES = {
+    'escavacao': gerar_labirinto_aleatorio,
+    'arvore-binaria': gerar_labirinto_arvore_binaria,
+    'eller': gerar_labirinto_eller,
+}
+
+
+# Labirinto e caminho da animação de exemplo das instruções
+LABIRINTO_EXEMPLO = [
+    ['#', '#', '#', '#', '#', '#', '#', '#', '#', '#'],
+    ['#', ' ', ' ', '#', ' ', ' ', ' ', '#', '#', '#'],
+    ['#', '#', ' ', '#', ' ', '#', ' ', ' ', ' ', '#'],
+    ['#', '#', ' ', ' ', ' ', '#', '#', '#', ' ', '#'],
+    ['#', '#', '#', '#', '#', '#', ' ', ' ', ' ', '#'],
+    ['#', ' ', ' ', ' ', ' ', ' ', ' ', '#', ' ', '#'],
+    ['#', ' ', ' ', '#', '#', '#', '#', '#', ' ', '#'],
+    ['#', '#', ' ', '#', ' ', ' ', ' ', ' ', '#', '#'],
+    ['#', '#', ' ', ' ', ' ', '#', '#', ' ', 'F', '#'],
+    ['#', '#', '#', '#', '#', '#', '#', '#', '#', '#'],
+]
+
+CAMINHO_EXEMPLO = [(1,1), (1,2), (2,2), (3,2), (3,3), (3,4), (2,4), (1,4), (1,5), (1,6),
+                   (2,6), (2,7), (2,8), (3,8), (4,8), (4,7), (4,6), (5,6), (5,5), (5,4),
+                   (5,3), (5,2), (6,2), (7,2), (8,2), (8,3),(8,4), (7,4), (7,5), (7,6),
+                   (7,7), (8,7), (8,8)]
+
+INTERVALO_EXEMPLO = 1  # segundos entre os quadros da animação
+
 
 def animar_exemplo_labirinto():
     """
@@ -112,30 +412,24 @@ def animar_exemplo_labirinto():
 
     Exibe o labirinto no terminal com movimento progressivo até o fim.
     """
-    labirinto_exemplo = [
-        ['#', '#', '#', '#', '#', '#', '#', '#', '#', '#'],
-        ['#', ' ', ' ', '#', ' ', ' ', ' ', '#', '#', '#'],
-        ['#', '#', ' ', '#', ' ', '#', ' ', ' ', ' ', '#'],
-        ['#', '#', ' ', ' ', ' ', '#', '#', '#', ' ', '#'],
-        ['#', '#', '#', '#', '#', '#', ' ', ' ', ' ', '#'],
-        ['#', ' ', ' ', ' ', ' ', ' ', ' ', '#', ' ', '#'],
-        ['#', ' ', ' ', '#', '#', '#', '#', '#', ' ', '#'],
-        ['#', '#', ' ', '#', ' ', ' ', ' ', ' ', '#', '#'],
-        ['#', '#', ' ', ' ', ' ', '#', '#', ' ', 'F', '#'],
-        ['#', '#', '#', '#', '#', '#', '#', '#', '#', '#'],
-        
-    ]
-
-    caminho = [(1,1), (1,2), (2,2), (3,2), (3,3), (3,4), (2,4), (1,4), (1,5), (1,6),
-               (2,6), (2,7), (2,8), (3,8), (4,8), (4,7), (4,6), (5,6), (5,5), (5,4),
-               (5,3), (5,2), (6,2), (7,2), (8,2), (8,3),(8,4), (7,4), (7,5), (7,6),
-               (7,7), (8,7), (8,8)]
-
-    for pos in caminho:
-        i, j = pos
-        mostrar_labirinto_exemplo(labirinto_exemplo, (i, j))
-        time.sleep(1)
-        os.system('cls' if os.name == 'nt' else 'clear')
+    for pos in CAMINHO_EXEMPLO:
+        mostrar_labirinto_exemplo(LABIRINTO_EXEMPLO, pos)
+        time.sleep(INTERVALO_EXEMPLO)
+        console.clear()  # limpa a tela sem criar um novo processo
+
+    console.print("\n[green]Este é um exemplo de como seu personagem se moverá até a saída (F)![/green]\n")
+
+
+async def animar_exemplo_labirinto_async():
+    """
+    Como `animar_exemplo_labirinto`, mas como tarefa do laço de eventos.
+
+    Cancelar a tarefa interrompe a animação entre dois quadros.
+    """
+    for pos in CAMINHO_EXEMPLO:
+        mostrar_labirinto_exemplo(LABIRINTO_EXEMPLO, pos)
+        await asyncio.sleep(INTERVALO_EXEMPLO)
+        console.clear()
 
     console.print("\n[green]Este é um exemplo de como seu personagem se moverá até a saída (F)![/green]\n")
 
@@ -143,27 +437,9 @@ def animar_exemplo_labirinto():
 def mostrar_labirinto_exemplo(lab, posicao):
     """
     Exibe um frame do labirinto com o personagem na posição atual.
-    
+
     Args:
         lab (list): Estrutura do labirinto como lista de listas.
         posicao (tuple): Posição (linha, coluna) do personagem.
     """
-    for i, linha in enumerate(lab):
-        linha_exibida = Text()
-        for j, celula in enumerate(linha):
-            if (i, j) == tuple(posicao):
-                linha_exibida.append("😎", style="bold cyan")  # personagem
-            elif celula == "#":
-                linha_exibida.append("██", style="grey61")  # parede
-            elif celula == ".":
-                linha_exibida.append("  ")  # caminho vazio
-            elif celula == "S":
-                linha_exibida.append("S ", style="bold green")  # início
-            elif celula == "F":
-                linha_exibida.append("F ", style="bold red")  # fim
-            elif celula == "*":
-                linha_exibida.append("• ", style="yellow")  # parte da solução
-            else:
-                linha_exibida.append(f"{celula} ")
-        console.print(linha_exibida)
-    console.print()  # linha em branco
\ No newline at end of file
+    imprimir_labirinto(lab, posicao)
@@ -0,0 +1,123 @@
+# partida
+"""
+Módulo com o estado de uma partida, independente do terminal.
+
+Uma `Partida` guarda o labirinto, a posição, a pontuação e os contadores
+de um jogador. `Partida.mover` é uma transição de estado pura: não imprime
+nada nem toca sons, apenas devolve os eventos ocorridos. Assim, muitas
+partidas podem ser simuladas no mesmo processo (bots, servidores, testes).
+"""
+from enum import Enum
+
+# Pontuação inicial de cada nível de dificuldade
+PONTUACAO_INICIAL = {
+    "facil": 500,
+    "medio": 1000,
+    "dificil": 1600,
+    "super-dificil": 2500,
+    "max-dificil": 3000,
+}
+PONTUACAO_PADRAO = 500
+
+# Pontos perdidos a cada movimento
+CUSTO_MOVIMENTO = 10
+
+# Direção -> deslocamento (linha, coluna)
+DESLOCAMENTOS = {
+    "up": (-1, 0),
+    "down": (1, 0),
+    "left": (0, -1),
+    "right": (0, 1),
+}
+
+
+class Evento(Enum):
+    """Eventos que podem resultar de um movimento."""
+
+    MOVEU = "moveu"
+    BLOQUEADO = "bloqueado"
+    VENCEU = "venceu"
+
+
+def pontuacao_inicial(dificuldade):
+    """
+    Retorna a pontuação com que o jogador começa em cada dificuldade.
+
+    Args:
+        dificuldade (str): Um dos níveis ('facil', 'medio', 'dificil',
+                           'super-dificil', 'max-dificil').
+
+    Returns:
+        int: Pontuação inicial (500 para dificuldades desconhecidas).
+    """
+    return PONTUACAO_INICIAL.get(dificuldade, PONTUACAO_PADRAO)
+
+
+class Partida:
+    """
+    Estado de uma partida: labirinto, posição, pontuação e contadores.
+
+    Args:
+        labirinto (MazeGrid | list[list[str]]): Estrutura do labirinto.
+        dificuldade (str): Nível de dificuldade, usado na pontuação inicial.
+        inicio (tuple): Posição inicial do jogador.
+        semente (int, opcional): Semente com que o labirinto foi gerado, se conhecida.
+    """
+
+    __slots__ = ("labirinto", "dificuldade", "semente", "linha", "coluna", "pontuacao", "movimentos", "fim_jogo")
+
+    def __init__(self, labirinto, dificuldade="facil", inicio=(1, 1), semente=None):
+        self.labirinto = labirinto
+        self.dificuldade = dificuldade
+        self.semente = semente
+        self.linha, self.coluna = inicio
+        self.pontuacao = pontuacao_inicial(dificuldade)
+        self.movimentos = 0
+        self.fim_jogo = False
+
+    @property
+    def posicao(self):
+        """tuple: Posição atual (linha, coluna) do jogador."""
+        return self.linha, self.coluna
+
+    def pontuar(self):
+        """Atualiza a pontuação e incrementa o número de movimentos do jogador."""
+        self.pontuacao -= CUSTO_MOVIMENTO
+        self.movimentos += 1
+
+    def mover(self, direcao):
+        """
+        Tenta mover o jogador e atualiza o estado da partida.
+
+        Args:
+            direcao (str): Direção do movimento ('up', 'down', 'left', 'right').
+
+        Returns:
+            tuple: Eventos ocorridos: (MOVEU,), (MOVEU, VENCEU) ou (BLOQUEADO,).
+            Depois do fim da partida, nenhum evento é gerado.
+        """
+        if self.fim_jogo:
+            return ()
+        try:
+            di, dj = DESLOCAMENTOS[direcao]
+        except KeyError:
+            raise ValueError("Direção inválida.") from None
+
+        lab = self.labirinto
+        i, j = self.linha + di, self.coluna + dj
+        if not (0 <= i < len(lab) and 0 <= j < len(lab[0])):
+            return (Evento.BLOQUEADO,)
+        celula = lab[i][j]
+        if celula == "#":
+            return (Evento.BLOQUEADO,)
+
+        self.linha, self.coluna = i, j
+        self.pontuar()
+        if celula == "F":
+            self.fim_jogo = True
+            return (Evento.MOVEU, Evento.VENCEU)
+        return (Evento.MOVEU,)
+
+    def encerrar(self):
+        """Marca a partida como encerrada; novos movimentos são ignorados."""
+        self.fim_jogo = True
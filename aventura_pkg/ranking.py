@@ -0,0 +1,278 @@
+# ranking
+"""
+Módulo com o ranking de pontuação, guardado num banco SQLite.
+
+Cada partida vencida vira uma linha da tabela `resultados`. Os índices
+atendem às consultas do jogo sem percorrer a tabela:
+
+- (dificuldade, pontuacao) para os melhores de cada dificuldade;
+- (semente, movimentos) para os caminhos mais curtos de um mesmo labirinto;
+- (nome, dificuldade, pontuacao) para o melhor resultado de um jogador.
+
+A posição de uma pontuação vem da tabela `contagens`, mantida por um
+gatilho, com quantos resultados há de cada (dificuldade, pontuacao).
+Como as pontuações são poucas e discretas (múltiplos de `CUSTO_MOVIMENTO`),
+a consulta soma no máximo algumas centenas de linhas, e não milhões.
+
+`registrar` só enfileira o resultado; uma thread própria grava os
+pedidos pendentes em lotes, numa transação por lote, de modo que o fim
+de uma partida nunca espera o disco. Uma falha de disco apenas deixa o
+resultado fora do ranking.
+"""
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+from .cache_disco import pasta_dados
+
+ARQUIVO_PADRAO = "ranking.sqlite3"
+
+# Resultados gravados, no máximo, em cada transação da thread de gravação
+LOTE_MAXIMO = 1000
+
+# Cache de páginas de cada conexão; os três índices recebem chaves fora de ordem
+CACHE_KIB = 32 * 1024
+
+# Maior semente que cabe num inteiro do SQLite; sementes maiores ficam sem registro
+MAIOR_SEMENTE = 2 ** 63 - 1
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS resultados (
+    id INTEGER PRIMARY KEY,
+    nome TEXT NOT NULL,
+    dificuldade TEXT NOT NULL,
+    pontuacao INTEGER NOT NULL,
+    movimentos INTEGER NOT NULL,
+    semente INTEGER,
+    data REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS resultados_dificuldade_pontuacao
+    ON resultados (dificuldade, pontuacao DESC);
+CREATE INDEX IF NOT EXISTS resultados_semente_movimentos
+    ON resultados (semente, movimentos);
+CREATE INDEX IF NOT EXISTS resultados_nome_dificuldade_pontuacao
+    ON resultados (nome, dificuldade, pontuacao);
+
+CREATE TABLE IF NOT EXISTS contagens (
+    dificuldade TEXT NOT NULL,
+    pontuacao INTEGER NOT NULL,
+    quantidade INTEGER NOT NULL,
+    PRIMARY KEY (dificuldade, pontuacao)
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS contar_resultado AFTER INSERT ON resultados
+BEGIN
+    INSERT INTO contagens (dificuldade, pontuacao, quantidade)
+    VALUES (NEW.dificuldade, NEW.pontuacao, 1)
+    ON CONFLICT (dificuldade, pontuacao) DO UPDATE SET quantidade = quantidade + 1;
+END;
+"""
+
+_INSERIR = ("INSERT INTO resultados (nome, dificuldade, pontuacao, movimentos, semente, data) "
+            "VALUES (?, ?, ?, ?, ?, ?)")
+
+
+class Ranking:
+    """
+    Ranking persistente de partidas vencidas.
+
+    As consultas usam uma conexão do próprio chamador; as gravações de
+    `registrar` ficam com a thread de gravação. O banco usa o modo WAL,
+    então as consultas não esperam as gravações em andamento.
+
+    Args:
+        caminho (str, opcional): Arquivo do banco; por padrão,
+            `ranking.sqlite3` na pasta de dados do usuário.
+    """
+
+    def __init__(self, caminho=None):
+        self.caminho = caminho
+        self._fila = queue.SimpleQueue()
+        self._thread = None
+        self._trava = threading.Lock()
+        self._consultas = None
+
+    def _conectar(self):
+        """Abre uma conexão com o banco, criando as tabelas se preciso."""
+        caminho = self.caminho or os.path.join(pasta_dados(), ARQUIVO_PADRAO)
+        # `abrir` pode criar a conexão das consultas numa thread auxiliar; cada uma é usada por uma thread por vez
+        conexao = sqlite3.connect(caminho, check_same_thread=False)
+        conexao.execute("PRAGMA journal_mode = WAL")
+        conexao.execute("PRAGMA synchronous = NORMAL")  # no modo WAL, seguro contra falhas do processo
+        conexao.execute(f"PRAGMA cache_size = -{CACHE_KIB}")
+        with conexao:
+            conexao.executescript(_ESQUEMA)
+        return conexao
+
+    def _conexao(self):
+        """Retorna a conexão usada nas consultas, aberta na primeira consulta."""
+        if self._consultas is None:
+            self._consultas = self._conectar()
+        return self._consultas
+
+    def abrir(self):
+        """
+        Abre a conexão das consultas, criando o banco e as tabelas se preciso.
+
+        Criar o banco grava no disco; chame em `asyncio.to_thread` antes da
+        partida para que a primeira consulta ao fim dela não espere o disco.
+        """
+        self._conexao()
+
+    @staticmethod
+    def _linha(nome, dificuldade, pontuacao, movimentos, semente=None, data=None):
+        """Monta a linha de `resultados` de uma partida vencida."""
+        if semente is not None and not 0 <= semente <= MAIOR_SEMENTE:
+            semente = None
+        return (nome, dificuldade, pontuacao, movimentos, semente, time.time() if data is None else data)
+
+    def registrar(self, nome, dificuldade, pontuacao, movimentos, semente=None):
+        """
+        Pede para guardar o resultado de uma partida vencida, sem bloquear quem chamou.
+
+        Args:
+            nome (str): Nome do jogador.
+            dificuldade (str): Nível de dificuldade da partida.
+            pontuacao (int): Pontuação final.
+            movimentos (int): Número de movimentos até a saída.
+            semente (int, opcional): Semente do labirinto, se conhecida.
+        """
+        linha = self._linha(nome, dificuldade, pontuacao, movimentos, semente)
+        with self._trava:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._executar, name="ranking", daemon=True)
+                self._thread.start()
+        self._fila.put(linha)
+
+    def _executar(self):
+        """Laço da thread de gravação: grava os pedidos pendentes em lotes."""
+        try:
+            conexao = self._conectar()
+        except (sqlite3.Error, OSError):
+            conexao = None  # Sem banco (ou sem pasta de dados), os resultados são descartados
+        parar = False
+        while not parar:
+            lote = []
+            linha = self._fila.get()
+            while linha is not None:
+                lote.append(linha)
+                if len(lote) >= LOTE_MAXIMO:
+                    break
+                try:
+                    linha = self._fila.get_nowait()
+                except queue.Empty:
+                    break
+            parar = linha is None
+            if lote and conexao is not None:
+                try:
+                    with conexao:
+                        conexao.executemany(_INSERIR, lote)
+                except sqlite3.Error:
+                    pass
+        if conexao is not None:
+            conexao.close()
+
+    def registrar_lote(self, resultados):
+        """
+        Guarda muitos resultados de uma vez, numa única transação, esperando a gravação.
+
+        Args:
+            resultados (Iterable[tuple]): Tuplas (nome, dificuldade, pontuacao,
+                movimentos, semente, data); `data` em segundos desde a época.
+        """
+        conexao = self._conexao()
+        with conexao:
+            conexao.executemany(_INSERIR, (self._linha(*resultado) for resultado in resultados))
+
+    def encerrar(self):
+        """Termina a thread de gravação depois de gravar os pedidos pendentes."""
+        with self._trava:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._fila.put(None)
+            thread.join()
+
+    def fechar(self):
+        """Grava os pedidos pendentes e fecha as conexões com o banco."""
+        self.encerrar()
+        if self._consultas is not None:
+            self._consultas.close()
+            self._consultas = None
+
+    def melhores(self, dificuldade, k=10):
+        """
+        Retorna os melhores resultados de uma dificuldade.
+
+        Args:
+            dificuldade (str): Nível de dificuldade.
+            k (int): Quantos resultados retornar.
+
+        Returns:
+            list[tuple]: (nome, pontuacao, movimentos, semente), da maior para a
+            menor pontuação; empates ficam na ordem em que foram registrados.
+        """
+        return self._conexao().execute(
+            "SELECT nome, pontuacao, movimentos, semente FROM resultados "
+            "WHERE dificuldade = ? ORDER BY pontuacao DESC, id LIMIT ?",
+            (dificuldade, k),
+        ).fetchall()
+
+    def mais_curtos(self, semente, k=10):
+        """
+        Retorna os resultados com menos movimentos num mesmo labirinto.
+
+        Args:
+            semente (int): Semente do labirinto.
+            k (int): Quantos resultados retornar.
+
+        Returns:
+            list[tuple]: (nome, dificuldade, movimentos, pontuacao), do menor
+            para o maior número de movimentos.
+        """
+        return self._conexao().execute(
+            "SELECT nome, dificuldade, movimentos, pontuacao FROM resultados "
+            "WHERE semente = ? ORDER BY movimentos, id LIMIT ?",
+            (semente, k),
+        ).fetchall()
+
+    def posicao(self, dificuldade, pontuacao):
+        """
+        Calcula a posição que uma pontuação ocupa no ranking de uma dificuldade.
+
+        Returns:
+            int: 1 mais o número de resultados com pontuação maior; empates
+            dividem a mesma posição.
+        """
+        (acima,) = self._conexao().execute(
+            "SELECT COALESCE(SUM(quantidade), 0) FROM contagens WHERE dificuldade = ? AND pontuacao > ?",
+            (dificuldade, pontuacao),
+        ).fetchone()
+        return acima + 1
+
+    def posicao_jogador(self, nome, dificuldade):
+        """
+        Retorna o melhor resultado de um jogador numa dificuldade e a sua posição.
+
+        Returns:
+            tuple: (pontuacao, posicao), ou None se o jogador não tem resultados.
+        """
+        (melhor,) = self._conexao().execute(
+            "SELECT MAX(pontuacao) FROM resultados WHERE nome = ? AND dificuldade = ?",
+            (nome, dificuldade),
+        ).fetchone()
+        if melhor is None:
+            return None
+        return melhor, self.posicao(dificuldade, melhor)
+
+    def total(self, dificuldade=None):
+        """Retorna quantos resultados há no ranking, em geral ou numa dificuldade."""
+        if dificuldade is None:
+            consulta, parametros = "SELECT COALESCE(SUM(quantidade), 0) FROM contagens", ()
+        else:
+            consulta = "SELECT COALESCE(SUM(quantidade), 0) FROM contagens WHERE dificuldade = ?"
+            parametros = (dificuldade,)
+        return self._conexao().execute(consulta, parametros).fetchone()[0]
+
+
+ranking = Ranking()
@@ -0,0 +1,330 @@
+# renderizador
+"""
+Módulo responsável por desenhar o labirinto de forma incremental no terminal.
+
+O renderizador guarda o último quadro desenhado e, a cada movimento,
+reescreve apenas as células e linhas de placar que mudaram, posicionando
+o cursor diretamente sobre elas. O custo por tecla deixa de depender do
+tamanho do labirinto.
+
+Também mantém um cache de linhas já estilizadas, usado para montar
+quadros completos reaproveitando tudo, exceto a linha do jogador, e uma
+câmera que mostra só a parte do labirinto que cabe no terminal.
+"""
+from rich.console import Console
+from rich.control import Control, ControlType
+from rich.text import Text
+
+from aventura_pkg.grade import MazeGrid
+
+# Glifo e estilo de cada tipo de célula (cada célula ocupa duas colunas)
+GLIFOS = {
+    "#": ("██", "grey61"),  # parede
+    ".": ("  ", ""),  # caminho vazio
+    "S": ("S ", "bold green"),  # início
+    "F": ("F ", "bold red"),  # fim
+    "*": ("• ", "yellow"),  # parte da solução
+}
+GLIFO_JOGADOR = ("😎", "bold cyan")  # personagem
+
+
+def glifo_celula(celula):
+    """
+    Retorna o texto e o estilo usados para desenhar uma célula.
+
+    Args:
+        celula (str): Símbolo da célula no labirinto.
+
+    Returns:
+        tuple: (texto de duas colunas, estilo do Rich).
+    """
+    return GLIFOS.get(celula) or (f"{celula} ", "")
+
+
+class CacheLinhas:
+    """
+    Cache de linhas do labirinto já convertidas em `Text` estilizado.
+
+    As entradas são indexadas por (id do labirinto, índice da linha) e
+    guardam também o conteúdo da linha, de modo que uma linha alterada
+    (por exemplo, ao marcar a solução) é detectada e estilizada de novo.
+
+    Args:
+        max_labirintos (int): Quantos labirintos diferentes manter no cache.
+    """
+
+    def __init__(self, max_labirintos=4):
+        self.max_labirintos = max_labirintos
+        # id do labirinto -> (labirinto, {índice da linha: (conteúdo, Text)})
+        self._labirintos = {}
+
+    def linha(self, labirinto, i):
+        """
+        Retorna a linha `i` estilizada, sem o jogador.
+
+        Args:
+            labirinto (MazeGrid | list[list[str]]): Estrutura do labirinto.
+            i (int): Índice da linha.
+
+        Returns:
+            Text: Linha pronta para impressão. Não deve ser modificada.
+        """
+        entrada = self._labirintos.get(id(labirinto))
+        if entrada is None or entrada[0] is not labirinto:
+            if len(self._labirintos) >= self.max_labirintos:
+                del self._labirintos[next(iter(self._labirintos))]  # descarta o mais antigo
+            # Guarda a referência para que o id não seja reutilizado por outro labirinto
+            entrada = (labirinto, {})
+            self._labirintos[id(labirinto)] = entrada
+        linhas = entrada[1]
+
+        if isinstance(labirinto, MazeGrid):
+            conteudo = labirinto.linha_bytes(i)
+        else:
+            conteudo = ''.join(labirinto[i])
+        em_cache = linhas.get(i)
+        if em_cache is not None and em_cache[0] == conteudo:
+            return em_cache[1]
+
+        texto = Text()
+        for celula in labirinto[i]:
+            texto.append(*glifo_celula(celula))
+        linhas[i] = (conteudo, texto)
+        return texto
+
+    def linha_com_jogador(self, labirinto, i, pos_jogador):
+        """
+        Retorna a linha `i` estilizada, com o jogador desenhado se estiver nela.
+
+        Args:
+            labirinto (MazeGrid | list[list[str]]): Estrutura do labirinto.
+            i (int): Índice da linha.
+            pos_jogador (tuple, opcional): Posição atual do jogador.
+
+        Returns:
+            Text: Linha pronta para impressão.
+        """
+        texto = self.linha(labirinto, i)
+        if pos_jogador is None or pos_jogador[0] != i:
+            return texto
+        j = pos_jogador[1]
+        return texto[:2 * j] + Text(*GLIFO_JOGADOR) + texto[2 * j + 2:]
+
+    def quadro(self, labirinto, pos_jogador=None):
+        """
+        Monta o labirinto inteiro, reaproveitando as linhas em cache.
+
+        Args:
+            labirinto (MazeGrid | list[list[str]]): Estrutura do labirinto.
+            pos_jogador (list | tuple, opcional): Posição atual do jogador.
+
+        Returns:
+            Text: Quadro com uma linha do labirinto por linha de texto.
+        """
+        if pos_jogador is not None:
+            pos_jogador = tuple(pos_jogador)
+        return Text("\n").join(
+            self.linha_com_jogador(labirinto, i, pos_jogador) for i in range(len(labirinto))
+        )
+
+
+cache_linhas = CacheLinhas()
+
+# Linhas do terminal deixadas livres abaixo do labirinto (linha em branco e mensagens)
+LINHAS_RESERVADAS = 2
+
+
+def quadro_janela(labirinto, pos_jogador, topo, esquerda, altura, largura):
+    """
+    Monta apenas a janela visível do labirinto.
+
+    O custo depende do tamanho da janela, não do labirinto inteiro.
+
+    Args:
+        labirinto (MazeGrid | list[list[str]]): Estrutura do labirinto.
+        pos_jogador (tuple, opcional): Posição atual do jogador.
+        topo (int): Primeira linha visível.
+        esquerda (int): Primeira coluna visível.
+        altura (int): Quantidade de linhas visíveis.
+        largura (int): Quantidade de colunas visíveis.
+
+    Returns:
+        Text: Janela com uma linha do labirinto por linha de texto.
+    """
+    if topo == 0 and esquerda == 0 and altura >= len(labirinto) and largura >= len(labirinto[0]):
+        return cache_linhas.quadro(labirinto, pos_jogador)
+
+    linhas = []
+    for i in range(topo, topo + altura):
+        linha = labirinto[i]
+        texto = Text()
+        for j in range(esquerda, esquerda + largura):
+            if pos_jogador is not None and (i, j) == pos_jogador:
+                texto.append(*GLIFO_JOGADOR)
+            else:
+                texto.append(*glifo_celula(linha[j]))
+        linhas.append(texto)
+    return Text("\n").join(linhas)
+
+
+class Camera:
+    """
+    Janela de visualização que acompanha o jogador em labirintos maiores que o terminal.
+
+    A câmera só se desloca quando o jogador chega a menos de `margem`
+    células da borda da janela.
+
+    Args:
+        margem (int): Distância mínima, em células, entre o jogador e a borda da janela.
+    """
+
+    def __init__(self, margem=3):
+        self.margem = margem
+        self.topo = 0
+        self.esquerda = 0
+
+    def seguir(self, pos_jogador, altura, largura, total_linhas, total_colunas):
+        """
+        Reposiciona a câmera para manter o jogador dentro da margem.
+
+        Args:
+            pos_jogador (tuple): Posição atual do jogador.
+            altura (int): Linhas visíveis na janela.
+            largura (int): Colunas visíveis na janela.
+            total_linhas (int): Número de linhas do labirinto.
+            total_colunas (int): Número de colunas do labirinto.
+
+        Returns:
+            bool: True se a câmera se deslocou.
+        """
+        topo = self._ajustar(pos_jogador[0], self.topo, altura, total_linhas)
+        esquerda = self._ajustar(pos_jogador[1], self.esquerda, largura, total_colunas)
+        moveu = (topo, esquerda) != (self.topo, self.esquerda)
+        self.topo, self.esquerda = topo, esquerda
+        return moveu
+
+    def _ajustar(self, posicao, inicio, tamanho, total):
+        """Calcula o início da janela em um eixo."""
+        if tamanho >= total:
+            return 0
+        margem = min(self.margem, (tamanho - 1) // 2)
+        if posicao < inicio + margem:
+            inicio = posicao - margem
+        elif posicao > inicio + tamanho - 1 - margem:
+            inicio = posicao - (tamanho - 1 - margem)
+        return max(0, min(inicio, total - tamanho))
+
+
+def tamanho_janela(console, labirinto, linhas_ocupadas=0):
+    """
+    Calcula quantas linhas e colunas do labirinto cabem no terminal.
+
+    Args:
+        console (Console): Console do Rich que fornece o tamanho do terminal.
+        labirinto (MazeGrid | list[list[str]]): Estrutura do labirinto.
+        linhas_ocupadas (int): Linhas do terminal já usadas acima do labirinto.
+
+    Returns:
+        tuple: (altura, largura) da janela, em células.
+    """
+    largura_terminal, altura_terminal = console.size
+    altura = max(1, altura_terminal - linhas_ocupadas - LINHAS_RESERVADAS)
+    largura = max(1, largura_terminal // 2)  # cada célula ocupa duas colunas
+    return min(altura, len(labirinto)), min(largura, len(labirinto[0]))
+
+
+class RenderizadorDiferencial:
+    """
+    Desenha o labirinto e o placar, redesenhando só o que mudou entre quadros.
+
+    Enquanto uma partida está em andamento, as células do labirinto são
+    consideradas fixas; apenas a posição do jogador e as linhas do placar
+    são comparadas com o quadro anterior. Chame `invalidar()` sempre que o
+    labirinto for alterado ou a tela for limpa por outro código.
+
+    Labirintos maiores que o terminal são exibidos por uma `Camera`; quando
+    ela se desloca, apenas a janela visível é redesenhada.
+
+    Args:
+        console (Console, opcional): Console do Rich usado para escrever.
+        margem (int): Margem, em células, antes de a câmera acompanhar o jogador.
+    """
+
+    def __init__(self, console=None, margem=3):
+        self.console = console or Console()
+        self.camera = Camera(margem)
+        self.invalidar()
+
+    def invalidar(self):
+        """Descarta o quadro anterior, forçando um redesenho completo no próximo quadro."""
+        self._labirinto = None
+        self._pos_jogador = None
+        self._placar = []
+        self._janela = None
+
+    def desenhar(self, labirinto, pos_jogador, placar=()):
+        """
+        Desenha um quadro, completo ou apenas com as diferenças.
+
+        Args:
+            labirinto (MazeGrid | list[list[str]]): Estrutura do labirinto.
+            pos_jogador (list | tuple): Posição atual do jogador.
+            placar (list[str]): Linhas de texto (com marcação do Rich) exibidas acima do labirinto.
+        """
+        pos_jogador = tuple(pos_jogador)
+        placar = list(placar)
+
+        janela = tamanho_janela(self.console, labirinto, len(placar))
+        camera_moveu = self.camera.seguir(pos_jogador, *janela, len(labirinto), len(labirinto[0]))
+
+        if (
+            labirinto is not self._labirinto
+            or len(placar) != len(self._placar)
+            or janela != self._janela
+            or camera_moveu
+            or not self.console.is_terminal
+        ):
+            self._desenhar_completo(labirinto, pos_jogador, placar, janela)
+        else:
+            self._desenhar_diferencas(labirinto, pos_jogador, placar, janela)
+
+        self._labirinto = labirinto
+        self._pos_jogador = pos_jogador
+        self._placar = placar
+        self._janela = janela
+
+    def _desenhar_completo(self, labirinto, pos_jogador, placar, janela):
+        """Limpa a tela e desenha o placar e a janela visível do labirinto."""
+        self.console.control(Control.clear(), Control.home())
+        for linha in placar:
+            self.console.print(linha)
+        self.console.print(quadro_janela(
+            labirinto, pos_jogador, self.camera.topo, self.camera.esquerda, *janela
+        ))
+        self.console.print()  # linha em branco
+
+    def _desenhar_diferencas(self, labirinto, pos_jogador, placar, janela):
+        """Reescreve apenas as linhas de placar e as células que mudaram."""
+        for y, (antiga, nova) in enumerate(zip(self._placar, placar)):
+            if antiga != nova:
+                self.console.control(
+                    Control.move_to(0, y),
+                    Control((ControlType.ERASE_IN_LINE, 2)),
+                )
+                self.console.print(nova, end="")
+
+        if pos_jogador != self._pos_jogador:
+            i, j = self._pos_jogador
+            self._escrever_celula(len(placar), i, j, glifo_celula(labirinto[i][j]))
+            i, j = pos_jogador
+            self._escrever_celula(len(placar), i, j, GLIFO_JOGADOR)
+
+        # Deixa o cursor abaixo do quadro para as mensagens seguintes
+        self.console.control(Control.move_to(0, len(placar) + janela[0] + 1))
+
+    def _escrever_celula(self, deslocamento, i, j, glifo):
+        """Posiciona o cursor sobre a célula (i, j), relativa à câmera, e escreve o glifo."""
+        y = deslocamento + i - self.camera.topo
+        x = 2 * (j - self.camera.esquerda)
+        self.console.control(Control.move_to(x, y))
+        self.console.print(Text(*glifo), end="")
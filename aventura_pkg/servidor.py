@@ -0,0 +1,216 @@
+# servidor
+"""
+Módulo com o servidor de partidas em rede.
+
+Um único laço de eventos do asyncio atende todas as conexões TCP, sem
+uma thread por jogador. Cada conexão joga uma `Partida` por vez; as
+partidas da mesma dificuldade e semente compartilham o labirinto, que
+nunca é alterado por elas. Por padrão o servidor só aceita conexões
+locais (127.0.0.1).
+
+O protocolo é de texto, uma mensagem por linha:
+
+    NOVA <dificuldade> [semente]  ->  SESSAO <id> <semente> <linhas> <colunas> <linha> <coluna> <pontuacao>
+    MAPA                          ->  MAPA <linhas> <colunas>, seguida das linhas do labirinto
+    <movimentos>                  ->  o que mudou depois de aplicar todos
+    SAIR                          ->  fecha a conexão
+
+Os movimentos são as letras u, d, l e r (cima, baixo, esquerda e direita),
+uma ou várias na mesma linha. A resposta traz só o que mudou:
+
+    B                                         nenhum movimento foi possível
+    M <linha> <coluna> <pontuacao>            nova posição e pontuação
+    V <linha> <coluna> <pontuacao> <movimentos>  chegou à saída; a partida terminou
+    ERRO <mensagem>
+"""
+import asyncio
+import itertools
+from functools import lru_cache
+
+from .labirinto import criar_labirinto, nova_semente
+from .partida import PONTUACAO_INICIAL, Partida
+
+HOST_PADRAO = "127.0.0.1"
+PORTA_PADRAO = 8765
+
+# Tamanho máximo de uma mensagem, em bytes
+LIMITE_LINHA = 4096
+# Conexões aguardando aceitação na fila do sistema
+FILA_CONEXOES = 4096
+
+# Letra do protocolo -> direção de `Partida.mover`
+LETRAS = {"u": "up", "d": "down", "l": "left", "r": "right"}
+
+
+@lru_cache(maxsize=256)
+def labirinto_compartilhado(dificuldade, algoritmo, semente, usar_cache=False):
+    """
+    Gera o labirinto de uma semente uma única vez para todas as sessões.
+
+    Args:
+        usar_cache (bool): Se True, o labirinto também passa pelo cache em disco.
+
+    Returns:
+        MazeGrid: Labirinto compartilhado; as sessões não o alteram.
+    """
+    return criar_labirinto(dificuldade, algoritmo, semente, usar_cache)
+
+
+def _erro(mensagem):
+    """Monta a resposta de erro do protocolo."""
+    return f"ERRO {mensagem}\n".encode("utf-8")
+
+
+class ServidorJogo:
+    """
+    Servidor TCP que hospeda muitas partidas no mesmo laço de eventos.
+
+    Args:
+        host (str): Endereço em que o servidor escuta.
+        porta (int): Porta TCP; 0 escolhe uma porta livre, disponível em
+            `porta` depois de `iniciar()`.
+        algoritmo (str): Algoritmo de geração dos labirintos.
+        usar_cache (bool): Se True, os labirintos também passam pelo cache em
+            disco; por padrão, só pelo cache em memória do servidor.
+    """
+
+    def __init__(self, host=HOST_PADRAO, porta=PORTA_PADRAO, algoritmo="escavacao", usar_cache=False):
+        self.host = host
+        self.porta = porta
+        self.algoritmo = algoritmo
+        self.usar_cache = usar_cache
+        self.sessoes = {}  # id da sessão -> Partida em andamento
+        self.movimentos = 0  # movimentos recebidos desde o início
+        self._ids = itertools.count(1)
+        self._servidor = None
+
+    async def iniciar(self):
+        """Abre a porta e começa a aceitar conexões."""
+        self._servidor = await asyncio.start_server(
+            self._atender, self.host, self.porta, limit=LIMITE_LINHA, backlog=FILA_CONEXOES,
+        )
+        self.porta = self._servidor.sockets[0].getsockname()[1]
+
+    async def servir(self):
+        """Atende conexões até a tarefa ser cancelada."""
+        if self._servidor is None:
+            await self.iniciar()
+        async with self._servidor:
+            await self._servidor.serve_forever()
+
+    async def _atender(self, leitor, escritor):
+        """Lê as mensagens de uma conexão e responde a cada uma, na ordem."""
+        sessao = None
+        try:
+            while True:
+                try:
+                    linha = await leitor.readline()
+                except ValueError:  # mensagem maior que LIMITE_LINHA
+                    escritor.write(_erro("Mensagem longa demais."))
+                    break
+                if not linha:
+                    break
+                resposta, sessao = self.responder(linha.decode("utf-8", "replace").strip(), sessao)
+                if resposta is None:
+                    break
+                escritor.write(resposta)
+                await escritor.drain()
+        except ConnectionError:
+            pass  # o cliente desconectou no meio de uma resposta
+        finally:
+            self.sessoes.pop(sessao, None)
+            escritor.close()
+
+    def responder(self, mensagem, sessao):
+        """
+        Interpreta uma mensagem do protocolo.
+
+        Args:
+            mensagem (str): Linha recebida, sem a quebra de linha.
+            sessao (int | None): Sessão em andamento na conexão.
+
+        Returns:
+            tuple: (resposta, sessao). `resposta` são os bytes a enviar, ou
+            None para fechar a conexão; `sessao` é a sessão da conexão depois
+            da mensagem.
+        """
+        partida = self.sessoes.get(sessao)
+        if mensagem and mensagem.isalpha() and mensagem.islower():
+            return self._mover(partida, mensagem), sessao
+
+        comando, *parametros = mensagem.split() or [""]
+        if comando == "NOVA":
+            return self._nova(sessao, parametros)
+        if comando == "MAPA":
+            if partida is None:
+                return _erro("Nenhuma partida em andamento; envie NOVA."), sessao
+            lab = partida.labirinto
+            linhas = [f"MAPA {lab.linhas} {lab.colunas}"]
+            linhas.extend("".join(lab[i]) for i in range(lab.linhas))
+            return ("\n".join(linhas) + "\n").encode("utf-8"), sessao
+        if comando == "SAIR":
+            return None, sessao
+        return _erro("Comando desconhecido."), sessao
+
+    def _nova(self, sessao, parametros):
+        """Começa uma nova partida na conexão, substituindo a anterior."""
+        if not 1 <= len(parametros) <= 2 or parametros[0] not in PONTUACAO_INICIAL:
+            return _erro("Use NOVA <dificuldade> [semente]."), sessao
+        dificuldade = parametros[0]
+        try:
+            semente = int(parametros[1]) if len(parametros) == 2 else nova_semente()
+        except ValueError:
+            return _erro("A semente deve ser um número inteiro."), sessao
+        if semente < 0:
+            return _erro("A semente deve ser um número inteiro."), sessao
+
+        self.sessoes.pop(sessao, None)
+        sessao = next(self._ids)
+        lab = labirinto_compartilhado(dificuldade, self.algoritmo, semente, self.usar_cache)
+        partida = Partida(lab, dificuldade, semente=semente)
+        self.sessoes[sessao] = partida
+        resposta = (f"SESSAO {sessao} {semente} {lab.linhas} {lab.colunas} "
+                    f"{partida.linha} {partida.coluna} {partida.pontuacao}\n")
+        return resposta.encode("utf-8"), sessao
+
+    def _mover(self, partida, letras):
+        """Aplica uma sequência de movimentos e descreve o que mudou."""
+        if partida is None:
+            return _erro("Nenhuma partida em andamento; envie NOVA.")
+        if partida.fim_jogo:
+            return _erro("A partida terminou; envie NOVA.")
+        if letras.strip("udlr"):
+            return _erro("Movimento inválido; use u, d, l ou r.")
+        movimentos = partida.movimentos
+        for letra in letras:
+            partida.mover(LETRAS[letra])
+            self.movimentos += 1
+            if partida.fim_jogo:
+                return (f"V {partida.linha} {partida.coluna} {partida.pontuacao} "
+                        f"{partida.movimentos}\n").encode("utf-8")
+        if partida.movimentos == movimentos:
+            return b"B\n"
+        return f"M {partida.linha} {partida.coluna} {partida.pontuacao}\n".encode("utf-8")
+
+    def fechar(self):
+        """Para de aceitar conexões."""
+        if self._servidor is not None:
+            self._servidor.close()
+
+
+async def executar_servidor(host=HOST_PADRAO, porta=PORTA_PADRAO, algoritmo="escavacao", ao_iniciar=None):
+    """
+    Inicia um `ServidorJogo` e o mantém atendendo até ser cancelado.
+
+    Args:
+        host (str): Endereço em que o servidor escuta.
+        porta (int): Porta TCP; 0 escolhe uma porta livre.
+        algoritmo (str): Algoritmo de geração dos labirintos.
+        ao_iniciar (Callable[[ServidorJogo], None], opcional): Chamada quando
+            a porta já está aberta, por exemplo para anunciar o endereço.
+    """
+    servidor = ServidorJogo(host, porta, algoritmo)
+    await servidor.iniciar()
+    if ao_iniciar is not None:
+        ao_iniciar(servidor)
+    await servidor.servir()
@@ -0,0 +1,127 @@
+# simulacao
+"""
+Módulo com o motor de simulação sem terminal.
+
+O `MotorLote` avança N sessões de uma só vez sobre um único labirinto
+compartilhado, com as mesmas regras de `Partida.mover` (parede bloqueia,
+'F' encerra a partida, cada movimento custa `CUSTO_MOVIMENTO` pontos).
+Posições, pontuações e contadores ficam em vetores compactos (`array` e
+`bytearray`), indexados pelo número da sessão, o que permite milhões de
+passos por segundo para avaliação de bots e testes de regressão.
+"""
+from array import array
+
+from .grade import MazeGrid, PAREDE, SAIDA
+from .partida import CUSTO_MOVIMENTO, pontuacao_inicial
+
+# Ações aceitas por `MotorLote.passo`, na ordem dos códigos 0 a 3
+ACOES = ("up", "down", "left", "right")
+CODIGOS_ACOES = {nome: codigo for codigo, nome in enumerate(ACOES)}
+
+# Resultado de cada sessão em um passo
+BLOQUEADO = 0
+MOVEU = 1
+VENCEU = 2
+ENCERRADA = 3  # a sessão já tinha terminado e a ação foi ignorada
+
+
+class MotorLote:
+    """
+    Conjunto de sessões sem terminal que avançam juntas sobre o mesmo labirinto.
+
+    Args:
+        labirinto (MazeGrid | list[list[str]]): Estrutura do labirinto, compartilhada por todas as sessões.
+        sessoes (int): Número de sessões simultâneas.
+        dificuldade (str): Nível de dificuldade, usado na pontuação inicial.
+        inicio (tuple): Posição inicial dos jogadores.
+    """
+
+    def __init__(self, labirinto, sessoes, dificuldade="facil", inicio=(1, 1)):
+        if not isinstance(labirinto, MazeGrid):
+            labirinto = MazeGrid.from_lists(labirinto)
+        self.labirinto = labirinto
+        self.sessoes = sessoes
+        self.dificuldade = dificuldade
+        self.origem = inicio[0] * labirinto.colunas + inicio[1]
+        self.reiniciar()
+
+    def reiniciar(self, indices=None):
+        """
+        Coloca sessões de volta no início, com a pontuação inicial.
+
+        Args:
+            indices (Iterable[int], opcional): Sessões a reiniciar; por padrão, todas.
+        """
+        pontuacao = pontuacao_inicial(self.dificuldade)
+        if indices is None:
+            self.posicoes = array("q", [self.origem]) * self.sessoes
+            self.pontuacoes = array("q", [pontuacao]) * self.sessoes
+            self.movimentos = array("q", [0]) * self.sessoes
+            self.terminadas = bytearray(self.sessoes)
+            return
+        for k in indices:
+            self.posicoes[k] = self.origem
+            self.pontuacoes[k] = pontuacao
+            self.movimentos[k] = 0
+            self.terminadas[k] = 0
+
+    def posicao(self, k):
+        """Retorna a posição (linha, coluna) da sessão `k`."""
+        return divmod(self.posicoes[k], self.labirinto.colunas)
+
+    def passo(self, acoes):
+        """
+        Aplica uma ação a cada sessão.
+
+        Args:
+            acoes (Sequence[int]): Um código de `ACOES` por sessão (0=up,
+                1=down, 2=left, 3=right), por exemplo um `bytes` ou `array`.
+
+        Returns:
+            bytearray: Resultado de cada sessão (BLOQUEADO, MOVEU, VENCEU ou ENCERRADA).
+        """
+        if len(acoes) != self.sessoes:
+            raise ValueError("É preciso uma ação por sessão.")
+        if acoes and (min(acoes) < 0 or max(acoes) >= len(ACOES)):
+            raise ValueError("Ação inválida.")
+
+        dados = self.labirinto.dados
+        colunas = self.labirinto.colunas
+        total = len(dados)
+        deslocamentos = (-colunas, colunas, -1, 1)
+        posicoes = self.posicoes
+        pontuacoes = self.pontuacoes
+        movimentos = self.movimentos
+        terminadas = self.terminadas
+        resultados = bytearray(self.sessoes)  # BLOQUEADO == 0
+
+        for k, acao in enumerate(acoes):
+            if terminadas[k]:
+                resultados[k] = ENCERRADA
+                continue
+            p = posicoes[k]
+            q = p + deslocamentos[acao]
+            # Fora do labirinto: acima/abaixo pelo índice, esquerda/direita pela coluna
+            if acao < 2:
+                if not 0 <= q < total:
+                    continue
+            elif (acao == 2 and p % colunas == 0) or (acao == 3 and q % colunas == 0):
+                continue
+            celula = dados[q]
+            if celula == PAREDE:
+                continue
+
+            posicoes[k] = q
+            pontuacoes[k] -= CUSTO_MOVIMENTO
+            movimentos[k] += 1
+            if celula == SAIDA:
+                terminadas[k] = 1
+                resultados[k] = VENCEU
+            else:
+                resultados[k] = MOVEU
+
+        return resultados
+
+    def todas_terminadas(self):
+        """Indica se todas as sessões já chegaram à saída."""
+        return self.terminadas.count(0) == 0
@@ -0,0 +1,230 @@
+# solucionador
+"""
+Módulo responsável por resolver o labirinto.
+
+Oferece busca em largura (caminho mais curto), A* com heurística de
+Manhattan e busca em profundidade iterativa. Cada algoritmo visita uma
+célula no máximo uma vez e guarda apenas um vetor de pais, então o tempo
+e a memória crescem de forma linear com o número de células.
+"""
+from array import array
+from collections import deque
+import heapq
+
+from aventura_pkg.cache_labirintos import cache_labirintos
+from aventura_pkg.grade import MazeGrid, PAREDE, SAIDA
+
+
+def _reconstruir_caminho(pais, fim, colunas):
+    """
+    Reconstrói o caminho do início até `fim` seguindo o vetor de pais.
+
+    Args:
+        pais (array): Vetor com o índice do pai de cada célula visitada.
+        fim (int): Índice linear da célula de chegada.
+        colunas (int): Número de colunas do labirinto.
+
+    Returns:
+        list: Lista de tuplas (linha, coluna) do início até o fim.
+    """
+    caminho = []
+    atual = fim
+    while True:
+        caminho.append(divmod(atual, colunas))
+        if pais[atual] == atual:
+            break
+        atual = pais[atual]
+    caminho.reverse()
+    return caminho
+
+
+def _achatar(labirinto):
+    """
+    Obtém as células do labirinto como um único buffer de bytes.
+
+    Um `MazeGrid` é usado diretamente; uma lista de listas é convertida
+    uma única vez, para que as buscas não indexem duas vezes por vizinho.
+
+    Returns:
+        tuple: (dados, linhas, colunas, byte da parede, byte da saída).
+    """
+    if isinstance(labirinto, MazeGrid):
+        return labirinto.dados, labirinto.linhas, labirinto.colunas, PAREDE, SAIDA
+    linhas = len(labirinto)
+    colunas = len(labirinto[0]) if linhas else 0
+    dados = ''.join(''.join(linha) for linha in labirinto).encode('latin-1', errors='replace')
+    return dados, linhas, colunas, ord('#'), ord('F')
+
+
+def _vizinhos(atual, colunas, total):
+    """Gera os índices das células vizinhas (cima, baixo, esquerda, direita)."""
+    j = atual % colunas
+    if atual >= colunas:
+        yield atual - colunas
+    if atual + colunas < total:
+        yield atual + colunas
+    if j > 0:
+        yield atual - 1
+    if j < colunas - 1:
+        yield atual + 1
+
+
+def _origem(inicio, linhas, colunas, dados, parede):
+    """Retorna o índice linear do início, ou None se for parede ou estiver fora do labirinto."""
+    i, j = inicio
+    if not (0 <= i < linhas and 0 <= j < colunas):
+        return None
+    origem = i * colunas + j
+    return None if dados[origem] == parede else origem
+
+
+def busca_em_largura(labirinto, inicio=(1, 1)):
+    """
+    Resolve o labirinto com busca em largura, encontrando o caminho mais curto.
+
+    Args:
+        labirinto (MazeGrid | list[list[str]]): Estrutura do labirinto.
+        inicio (tuple): Coordenadas iniciais do jogador.
+
+    Returns:
+        list: Lista de tuplas representando o caminho da solução, ou None se não houver solução.
+    """
+    dados, linhas, colunas, parede, saida = _achatar(labirinto)
+    origem = _origem(inicio, linhas, colunas, dados, parede)
+    if origem is None:
+        return None
+
+    total = linhas * colunas
+    pais = array('q', [-1]) * total
+    pais[origem] = origem
+    fila = deque([origem])
+
+    while fila:
+        atual = fila.popleft()
+        if dados[atual] == saida:
+            return _reconstruir_caminho(pais, atual, colunas)
+
+        for vizinho in _vizinhos(atual, colunas, total):
+            if pais[vizinho] == -1 and dados[vizinho] != parede:
+                pais[vizinho] = atual
+                fila.append(vizinho)
+
+    return None  # Sem solução
+
+
+def busca_a_estrela(labirinto, inicio=(1, 1)):
+    """
+    Resolve o labirinto com A*, usando a distância de Manhattan até a saída.
+
+    Args:
+        labirinto (MazeGrid | list[list[str]]): Estrutura do labirinto.
+        inicio (tuple): Coordenadas iniciais do jogador.
+
+    Returns:
+        list: Lista de tuplas representando o caminho da solução, ou None se não houver solução.
+    """
+    dados, linhas, colunas, parede, saida = _achatar(labirinto)
+    origem = _origem(inicio, linhas, colunas, dados, parede)
+    indice_saida = dados.find(saida)
+    if origem is None or indice_saida == -1:
+        return None
+
+    total = linhas * colunas
+    fi, fj = divmod(indice_saida, colunas)
+    pais = array('q', [-1]) * total
+    custo = array('q', [-1]) * total
+    pais[origem] = origem
+    custo[origem] = 0
+    abertos = [(abs(inicio[0] - fi) + abs(inicio[1] - fj), 0, origem)]
+
+    while abertos:
+        _, g, atual = heapq.heappop(abertos)
+        if g > custo[atual]:
+            continue  # Entrada antiga, já existe caminho melhor
+        if dados[atual] == saida:
+            return _reconstruir_caminho(pais, atual, colunas)
+
+        novo_custo = g + 1
+        for vizinho in _vizinhos(atual, colunas, total):
+            if dados[vizinho] != parede and (custo[vizinho] == -1 or novo_custo < custo[vizinho]):
+                custo[vizinho] = novo_custo
+                pais[vizinho] = atual
+                ni, nj = divmod(vizinho, colunas)
+                estimativa = novo_custo + abs(ni - fi) + abs(nj - fj)
+                heapq.heappush(abertos, (estimativa, novo_custo, vizinho))
+
+    return None  # Sem solução
+
+
+def busca_em_profundidade(labirinto, inicio=(1, 1)):
+    """
+    Resolve o labirinto com busca em profundidade iterativa (sem recursão).
+
+    O caminho encontrado não é necessariamente o mais curto.
+
+    Args:
+        labirinto (MazeGrid | list[list[str]]): Estrutura do labirinto.
+        inicio (tuple): Coordenadas iniciais do jogador.
+
+    Returns:
+        list: Lista de tuplas representando o caminho da solução, ou None se não houver solução.
+    """
+    dados, linhas, colunas, parede, saida = _achatar(labirinto)
+    origem = _origem(inicio, linhas, colunas, dados, parede)
+    if origem is None:
+        return None
+
+    total = linhas * colunas
+    pais = array('q', [-1]) * total
+    pais[origem] = origem
+    pilha = [origem]
+
+    while pilha:
+        atual = pilha.pop()
+        if dados[atual] == saida:
+            return _reconstruir_caminho(pais, atual, colunas)
+
+        # Empilha ao contrário para explorar primeiro para cima, como a versão recursiva
+        for vizinho in reversed(list(_vizinhos(atual, colunas, total))):
+            if pais[vizinho] == -1 and dados[vizinho] != parede:
+                pais[vizinho] = atual
+                pilha.append(vizinho)
+
+    return None  # Sem solução
+
+
+ALGORITMOS = {
+    'bfs': busca_em_largura,
+    'a-estrela': busca_a_estrela,
+    'dfs': busca_em_profundidade,
+}
+
+
+def resolver(labirinto, inicio=(1, 1), algoritmo='bfs'):
+    """
+    Resolve o labirinto com o algoritmo escolhido.
+
+    Para um `MazeGrid`, a solução é procurada antes em `cache_labirintos`,
+    pelo conteúdo do labirinto, e guardada lá depois de calculada.
+
+    Args:
+        labirinto (MazeGrid | list[list[str]]): Estrutura do labirinto.
+        inicio (tuple): Coordenadas iniciais do jogador.
+        algoritmo (str): Um de 'bfs', 'a-estrela' ou 'dfs'.
+
+    Returns:
+        list: Lista de tuplas representando o caminho da solução, ou None se não houver solução.
+    """
+    try:
+        funcao = ALGORITMOS[algoritmo]
+    except KeyError:
+        raise ValueError("Algoritmo de solução inválido.") from None
+    inicio = tuple(inicio)
+    if not isinstance(labirinto, MazeGrid):
+        return funcao(labirinto, inicio)
+
+    encontrada, caminho = cache_labirintos.obter_solucao(labirinto, inicio, algoritmo)
+    if not encontrada:
+        caminho = funcao(labirinto, inicio)
+        cache_labirintos.guardar_solucao(labirinto, inicio, algoritmo, caminho)
+    return caminho
@@ -1,21 +1,88 @@
 # utils
 """
 Funções utilitárias: menu, instruções e lógica de início de jogo.
+
+O fluxo do jogo é uma máquina de estados (menu, partida, solução,
+instruções, ranking e saída) conduzida por um único laço em `executar_menu`.
+
+Tudo roda como tarefas de um único laço de eventos do asyncio: as
+respostas do menu, as teclas da partida e os quadros das animações são
+esperados sem bloquear, então a animação das instruções pode ser
+interrompida por uma tecla e gerar ou resolver um labirinto grande não
+congela o laço. Os sons já são apenas enfileirados para a thread de áudio.
 """
 from rich.console import Console
-from aventura_pkg import labirinto, jogador
-from aventura_pkg.labirinto import animar_exemplo_labirinto
+from aventura_pkg import labirinto, jogador, solucionador
+from aventura_pkg.entrada import LeitorLinhas
+from aventura_pkg.labirinto import animar_exemplo_labirinto_async
+from aventura_pkg.ranking import ranking
 from rich.panel import Panel
-import time
+from rich.table import Table
+from rich.text import Text
+from enum import Enum, auto
+import asyncio
+import sqlite3
 
 console = Console()
 
-def exibir_menu(args):
+class Estado(Enum):
+    """Estados do laço principal do jogo."""
+
+    MENU = auto()
+    JOGANDO = auto()
+    SOLUCAO = auto()
+    INSTRUCOES = auto()
+    RANKING = auto()
+    SAIR = auto()
+
+
+# Opção do menu -> próximo estado
+OPCOES_MENU = {
+    '1': Estado.INSTRUCOES,
+    '2': Estado.JOGANDO,
+    '3': Estado.SOLUCAO,
+    '4': Estado.RANKING,
+    '5': Estado.SAIR,
+}
+
+# Tempo para leitura das instruções antes da animação
+TEMPO_LEITURA = 10  # segundos
+
+# Resultados mostrados na tela de ranking
+TAMANHO_RANKING = 10
+
+leitor = LeitorLinhas()
+
+
+def exibir_menu(args, ler=None):
     """
     Exibe o menu principal do jogo e gerencia as opções escolhidas pelo jogador.
 
+    Cria o laço de eventos do jogo e executa `executar_menu` nele até o
+    jogador sair.
+
+    Args:
+        args: Argumentos de linha de comando contendo nome, cor, dificuldade e algoritmo.
+        ler (Callable[[str], Awaitable[str]], opcional): Corrotina usada para ler
+            as respostas do jogador; por padrão, `leitor.ler`.
+    """
+    try:
+        asyncio.run(executar_menu(args, ler or leitor.ler))
+    finally:
+        ranking.encerrar()  # grava as vitórias que ainda estão na fila
+
+
+async def executar_menu(args, ler):
+    """
+    Conduz o jogo pelos estados do menu até o jogador escolher sair.
+
+    O jogo é conduzido por um único laço que passa de um `Estado` para o
+    outro; nenhuma tela chama a seguinte, então a pilha de chamadas e o
+    número de threads não crescem, por mais partidas que sejam jogadas.
+
     Args:
-        args: Argumentos de linha de comando contendo nome, cor e dificuldade.
+        args: Argumentos de linha de comando contendo nome, cor, dificuldade e algoritmo.
+        ler (Callable[[str], Awaitable[str]]): Corrotina usada para ler as respostas do jogador.
     """
     nome = args.name
     cor = args.color
@@ -23,47 +90,157 @@ def exibir_menu(args):
     console.print(f"\n[bold {cor}]Olá {nome}![/bold {cor}]")
     console.print(f"[yellow]Dificuldade atual:[/yellow] {dificuldade}")
 
-    jogador.iniciar_jogador(dificuldade)
-
-    while True:
-        console.print("\n[bold cyan]Menu Principal[/bold cyan]")
-        console.print("1. Instruções")
-        console.print("2. Jogar")
-        console.print("3. Ver solução")
-        console.print("4. Sair")
-
-        opcao = input("Escolha uma opção: ")
-
-        # Verificação se a entrada é válida
-        if opcao not in ['1', '2', '3', '4']:
-            console.print("[red]Opção inválida. Tente novamente.[/red]")
-            continue  # Continua o loop até uma opção válida ser escolhida
-
-        match opcao:
-            case '1':
-                imprimir_instrucoes_animadas()
-            case '2':
-                '''import pygame
-                pygame.init()'''
-                console.print(f"\n{args.name}, vamos jogar!", style=args.color)
-                iniciar_jogo(args)
-            case '3':
-                console.print("Calculando a solução do labirinto...\n", style="yellow")
-                lab = labirinto.criar_labirinto(args.dificuldade)
-                solucao = jogador.mostrar_solucao_recursiva(lab)
-                if solucao:
-                    for passo in solucao:
-                        i, j = passo
-                        lab[i][j] = "*" if lab[i][j] != "F" else "F"
-                    labirinto.imprimir_labirinto(lab, solucao[-1])
-                    console.print(f"\n[green]Caminho encontrado com {len(solucao)} passos.[/green]")
-                else:
-                    console.print("[red]Nenhuma solução encontrada.[/red]")
-            case '4':
-                console.print("Até a próxima! 🖖", style="green")
-                break
-
-def imprimir_instrucoes_animadas():
+    jogador.iniciar_jogador(dificuldade, nome=nome)
+    try:
+        await asyncio.to_thread(ranking.abrir)  # cria o banco agora, e não ao fim da primeira vitória
+    except (sqlite3.Error, OSError):
+        pass  # Sem banco, o jogo segue sem ranking
+
+    acoes = {
+        Estado.MENU: estado_menu,
+        Estado.INSTRUCOES: estado_instrucoes,
+        Estado.JOGANDO: estado_jogando,
+        Estado.SOLUCAO: estado_solucao,
+        Estado.RANKING: estado_ranking,
+    }
+    estado = Estado.MENU
+    while estado is not Estado.SAIR:
+        estado = await acoes[estado](args, ler)
+
+    console.print("Até a próxima! 🖖", style="green")
+
+async def estado_menu(args, ler):
+    """
+    Mostra as opções do menu principal e lê a escolha do jogador.
+
+    Returns:
+        Estado: Próximo estado do jogo.
+    """
+    console.print("\n[bold cyan]Menu Principal[/bold cyan]")
+    console.print("1. Instruções")
+    console.print("2. Jogar")
+    console.print("3. Ver solução")
+    console.print("4. Ranking")
+    console.print("5. Sair")
+
+    opcao = await ler("Escolha uma opção: ")
+
+    # Verificação se a entrada é válida
+    if opcao not in OPCOES_MENU:
+        console.print("[red]Opção inválida. Tente novamente.[/red]")
+        return Estado.MENU
+    return OPCOES_MENU[opcao]
+
+async def estado_instrucoes(args, ler):
+    """
+    Mostra as instruções animadas e volta ao menu.
+
+    A animação e a espera pelo Enter rodam como duas tarefas; a que
+    terminar primeiro cancela a outra, então o Enter pula a animação.
+
+    Returns:
+        Estado: Próximo estado do jogo.
+    """
+    animacao = asyncio.create_task(imprimir_instrucoes_animadas())
+    tecla = asyncio.create_task(ler(""))
+    await asyncio.wait({animacao, tecla}, return_when=asyncio.FIRST_COMPLETED)
+    for tarefa in (animacao, tecla):
+        tarefa.cancel()
+    await asyncio.gather(animacao, tecla, return_exceptions=True)
+    if tecla.cancelled():
+        return Estado.MENU
+    console.clear()
+    console.print("[yellow]Animação interrompida.[/yellow]")
+    return Estado.MENU
+
+async def estado_jogando(args, ler):
+    """
+    Joga uma partida completa e volta ao menu quando ela termina.
+
+    Returns:
+        Estado: Próximo estado do jogo.
+    """
+    console.print(f"\n{args.name}, vamos jogar!", style=args.color)
+    if not await iniciar_jogo(args):
+        return Estado.MENU
+    semente = jogador.partida.semente
+    if semente is not None:
+        console.print(f"[yellow]Semente do labirinto:[/yellow] {semente} (use --seed {semente} para jogá-lo de novo)")
+    await ler("\nPressione Enter para voltar ao menu...")
+    return Estado.MENU
+
+async def estado_solucao(args, ler):
+    """
+    Calcula e mostra a solução do último labirinto jogado.
+
+    Se nenhuma partida foi jogada ainda, resolve o labirinto de `--arquivo`
+    ou o da semente escolhida em `--seed` (ou de uma semente nova). Labirintos
+    lidos de arquivo são resolvidos a partir do início gravado no arquivo.
+
+    Returns:
+        Estado: Próximo estado do jogo.
+    """
+    console.print("Calculando a solução do labirinto...\n", style="yellow")
+    arquivo = getattr(args, 'arquivo', None)
+    if jogador.partida is not None:
+        original = jogador.partida.labirinto
+    elif arquivo:
+        original = await abrir_arquivo(arquivo)
+        if original is None:
+            return Estado.MENU
+    else:
+        original = await asyncio.to_thread(labirinto.criar_labirinto, args.dificuldade, args.algoritmo,
+                                           escolher_semente(args))
+    inicio = getattr(original, 'inicio', (1, 1))
+    lab = await asyncio.to_thread(original.copy)  # a cópia recebe as marcas da solução
+    solucao = await asyncio.to_thread(solucionador.resolver, lab, inicio)
+    if solucao:
+        for passo in solucao:
+            i, j = passo
+            lab[i][j] = "*" if lab[i][j] != "F" else "F"
+        # Só a parte que cabe no terminal, centrada na saída: labirintos de arquivo podem ter milhões de células
+        labirinto.imprimir_labirinto(lab, solucao[-1], janela=True, margem=max(len(lab), len(lab[0])))
+        console.print(f"\n[green]Caminho encontrado com {len(solucao)} passos.[/green]")
+    else:
+        console.print("[red]Nenhuma solução encontrada.[/red]")
+    return Estado.MENU
+
+async def estado_ranking(args, ler):
+    """
+    Mostra os melhores resultados da dificuldade atual e a posição do jogador.
+
+    Returns:
+        Estado: Próximo estado do jogo.
+    """
+    dificuldade = args.dificuldade
+    try:
+        melhores = ranking.melhores(dificuldade, TAMANHO_RANKING)
+        do_jogador = ranking.posicao_jogador(args.name, dificuldade)
+    except (sqlite3.Error, OSError) as e:
+        console.print(f"[red]Não foi possível ler o ranking: {e}[/red]")
+        return Estado.MENU
+
+    if not melhores:
+        console.print(f"[yellow]Nenhuma vitória registrada em {dificuldade} ainda.[/yellow]")
+        return Estado.MENU
+
+    tabela = Table(title=f"🏆 Ranking ({dificuldade})", title_style="bold magenta")
+    for coluna in ("Posição", "Jogador", "Pontuação", "Movimentos", "Semente"):
+        tabela.add_column(coluna, justify="left" if coluna == "Jogador" else "right")
+    posicao = 0
+    anterior = None
+    for k, (nome, pontos, movimentos, semente) in enumerate(melhores, start=1):
+        if pontos != anterior:
+            posicao, anterior = k, pontos  # empates dividem a posição
+        tabela.add_row(f"{posicao}º", Text(nome), str(pontos), str(movimentos),
+                       "-" if semente is None else str(semente))
+    console.print(tabela)
+    if do_jogador is not None:
+        pontos, posicao = do_jogador
+        console.print(f"[cyan]Seu melhor resultado:[/cyan] {pontos} pontos, {posicao}º lugar")
+    return Estado.MENU
+
+async def imprimir_instrucoes_animadas():
     """
     Exibe as instruções do jogo junto com uma animação de movimentação no labirinto.
     """
@@ -78,35 +255,69 @@ def imprimir_instrucoes_animadas():
     console.clear()
     console.print(Panel(instrucoes, title="📜 Instruções", border_style="magenta"))
 
-    time.sleep(10)  # Tempo para leitura das instruções
+    console.print("[dim]Pressione Enter para voltar ao menu.[/dim]")
+
+    await asyncio.sleep(TEMPO_LEITURA)
 
     console.print("\n[bold blue]Exemplo de movimentação:[/bold blue]")
-    animar_exemplo_labirinto()
+    await animar_exemplo_labirinto_async()
 
 
-def iniciar_jogo(args):
+def escolher_semente(args):
     """
-    Inicia o jogo com o labirinto gerado e configura a lógica de retorno ao menu após o fim do jogo.
+    Retorna a semente do próximo labirinto: a de `--seed` ou uma nova.
 
     Args:
-        args: Argumentos de linha de comando contendo nome, cor e dificuldade.
+        args: Argumentos de linha de comando, com o atributo opcional `seed`.
+
+    Returns:
+        int: Semente a usar na geração.
+    """
+    semente = getattr(args, 'seed', None)
+    return labirinto.nova_semente() if semente is None else semente
+
+
+async def abrir_arquivo(arquivo):
     """
-    from . import labirinto, jogador
+    Abre o labirinto de `--arquivo` fora do laço de eventos.
 
-    def voltar_ao_menu():
-        """
-        Função interna para retornar ao menu principal após o fim do jogo.
-        """
-        input("\nPressione Enter para voltar ao menu...")
-        exibir_menu(args)  # Volta ao menu principal
+    Returns:
+        LabirintoMapeado | MazeGrid: O labirinto, ou None se o arquivo não
+        existe ou não é um labirinto válido (o erro é mostrado na tela).
+    """
+    try:
+        return await asyncio.to_thread(labirinto.abrir_labirinto, arquivo)
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Não foi possível abrir o labirinto {arquivo}: {e}[/red]")
+        return None
 
-    jogador.voltar_menu_callback = voltar_ao_menu  # Define o callback de retorno ao menu
 
-    print(f"\n{args.name}, vamos jogar!")
-    lab = labirinto.criar_labirinto(args.dificuldade)
-    jogador.iniciar_jogador(args.dificuldade)
-    labirinto.imprimir_labirinto(lab, jogador.jogador_pos)
+async def iniciar_jogo(args):
+    """
+    Inicia o jogo com o labirinto gerado e aguarda até a partida terminar.
 
-    jogador.aguardar_movimento(lab)
+    A semente usada fica registrada na partida (`jogador.partida.semente`).
+    Com `--arquivo`, o labirinto é lido do arquivo (binário ou de texto) em vez de gerado.
 
+    Args:
+        args: Argumentos de linha de comando contendo nome, cor, dificuldade,
+            algoritmo, semente e, opcionalmente, o arquivo do labirinto.
+
+    Returns:
+        bool: True se a partida foi jogada; False se o arquivo não pôde ser aberto.
+    """
+    arquivo = getattr(args, 'arquivo', None)
+    if arquivo:
+        lab = await abrir_arquivo(arquivo)
+        if lab is None:
+            return False
+        jogador.iniciar_jogador(args.dificuldade, lab, getattr(lab, 'semente', None), getattr(lab, 'inicio', (1, 1)),
+                                ranqueada=False)
+    else:
+        semente = escolher_semente(args)
+        lab = await asyncio.to_thread(labirinto.criar_labirinto, args.dificuldade, args.algoritmo, semente)
+        jogador.iniciar_jogador(args.dificuldade, lab, semente)
+    labirinto.imprimir_labirinto(lab, jogador.jogador_pos, janela=True)
 
+    await jogador.aguardar_movimento_async(lab)  # retorna quando a partida termina
+    return True
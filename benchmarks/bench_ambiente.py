@@ -0,0 +1,68 @@
+# bench_ambiente
+"""
+Mede a vazão de passos do `AmbienteVetorizado` para vários tamanhos de lote.
+
+Também confere, com ações aleatórias, que o ambiente vetorizado devolve as
+mesmas observações e recompensas que K cópias de `AmbienteLabirinto`.
+Execute a partir da raiz do projeto:
+
+    python -m benchmarks.bench_ambiente [passos]
+"""
+import random
+import sys
+import time
+
+from aventura_pkg.ambiente import AmbienteLabirinto, AmbienteVetorizado
+from aventura_pkg.labirinto import criar_labirinto
+
+LOTES = (1, 16, 256, 4096)
+PASSOS = 200
+
+
+def conferir(observacao, k=32, passos=300):
+    """Compara o ambiente vetorizado com K ambientes simples até o primeiro fim de cada episódio."""
+    labirintos = [criar_labirinto("medio") for _ in range(k)]
+    vetorizado = AmbienteVetorizado(k, "medio", observacao=observacao, raio=3)
+    simples = [AmbienteLabirinto("medio", observacao=observacao, raio=3) for _ in range(k)]
+
+    observacoes, _ = vetorizado.reset(labirintos)
+    tamanho = vetorizado.tamanho_observacao
+    ativos = [True] * k
+    for ambiente, lab, indice in zip(simples, labirintos, range(k)):
+        obs, _ = ambiente.reset(lab)
+        assert obs == observacoes[indice * tamanho:(indice + 1) * tamanho]
+
+    for _ in range(passos):
+        acoes = bytes(random.randrange(4) for _ in range(k))
+        observacoes, recompensas, terminados, truncados, _ = vetorizado.step(acoes)
+        for indice, ambiente in enumerate(simples):
+            if not ativos[indice]:
+                continue
+            obs, recompensa, terminado, truncado, _ = ambiente.step(acoes[indice])
+            assert recompensa == recompensas[indice]
+            assert (terminado, truncado) == (bool(terminados[indice]), bool(truncados[indice]))
+            if terminado or truncado:
+                ativos[indice] = False  # o vetorizado recomeça num labirinto novo
+            else:
+                assert obs == observacoes[indice * tamanho:(indice + 1) * tamanho]
+
+
+def main():
+    """Confere os ambientes e imprime a vazão para cada tamanho de lote."""
+    passos = int(sys.argv[1]) if len(sys.argv) > 1 else PASSOS
+    conferir("janela")
+    conferir("grade")
+
+    for k in LOTES:
+        ambiente = AmbienteVetorizado(k, "max-dificil", raio=3)
+        ambiente.reset()
+        lotes = [bytes(random.randrange(4) for _ in range(k)) for _ in range(passos)]
+        inicio = time.perf_counter()
+        for acoes in lotes:
+            ambiente.step(acoes)
+        segundos = time.perf_counter() - inicio
+        print(f"K={k:>5}: {k * passos / segundos:>12,.0f} passos/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+# bench_arquivo_labirinto
+"""
+Mede gravar e abrir um labirinto enorme no formato binário.
+
+Gera um labirinto de árvore binária, grava o arquivo e mede quanto custa
+abri-lo com `mmap`, montar a janela ao redor de um jogador no meio do
+labirinto e fazer movimentos. Execute a partir da raiz do projeto:
+
+    python -m benchmarks.bench_arquivo_labirinto [tamanho]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from aventura_pkg import labirinto
+from aventura_pkg.arquivo_labirinto import carregar_labirinto, salvar_labirinto
+from aventura_pkg.partida import Partida
+from aventura_pkg.renderizador import quadro_janela
+
+TAMANHO = 10_001
+JANELA = (40, 100)  # linhas e colunas visíveis
+
+
+def medir(funcao, *args):
+    """Executa `funcao(*args)` e retorna (resultado, segundos)."""
+    inicio = time.perf_counter()
+    resultado = funcao(*args)
+    return resultado, time.perf_counter() - inicio
+
+
+def main():
+    """Grava o labirinto num arquivo temporário e mede a abertura e o uso."""
+    tamanho = int(sys.argv[1]) if len(sys.argv) > 1 else TAMANHO
+    lab, segundos = medir(labirinto.gerar_labirinto_arvore_binaria, tamanho, tamanho, 1)
+    print(f"geração {tamanho}x{tamanho}: {segundos:.3f}s")
+
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, "labirinto.bin")
+        _, segundos = medir(salvar_labirinto, lab, caminho, (1, 1), 1)
+        print(f"gravação: {segundos:.3f}s, {os.path.getsize(caminho) / 2 ** 20:.1f} MiB")
+
+        mapeado, segundos = medir(carregar_labirinto, caminho)
+        print(f"abertura: {segundos * 1e3:.3f}ms")
+
+        meio = (tamanho // 2) | 1
+        topo, esquerda = meio - JANELA[0] // 2, meio - JANELA[1] // 2
+        _, segundos = medir(quadro_janela, mapeado, (meio, meio), topo, esquerda, *JANELA)
+        print(f"janela {JANELA[0]}x{JANELA[1]} no meio do labirinto: {segundos * 1e3:.1f}ms")
+
+        partida = Partida(mapeado, "facil", (meio, meio))
+        _, segundos = medir(lambda: [partida.mover(d) for d in ("up", "down", "left", "right") * 2500])
+        print(f"10000 movimentos: {segundos * 1e3:.1f}ms")
+
+        for i in range(0, tamanho, max(1, tamanho // 50)):
+            assert mapeado.linha_bytes(i) == lab.linha_bytes(i)
+        mapeado.fechar()
+
+
+if __name__ == '__main__':
+    main()
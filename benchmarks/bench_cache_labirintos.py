@@ -0,0 +1,47 @@
+# bench_cache_labirintos
+"""
+Compara gerar e resolver um labirinto grande com e sem o cache em disco.
+
+A primeira rodada gera e resolve de fato (e preenche o cache); a segunda
+lê o labirinto e a solução do disco. O cache usado fica numa pasta
+temporária. Execute a partir da raiz do projeto:
+
+    python -m benchmarks.bench_cache_labirintos [tamanho] [algoritmo]
+"""
+import sys
+import tempfile
+import time
+
+from aventura_pkg import labirinto, solucionador
+from aventura_pkg.cache_labirintos import cache_labirintos
+
+TAMANHO = 1001
+SEMENTE = 2024
+
+
+def rodada(tamanho, algoritmo):
+    """Gera e resolve o labirinto da semente fixa, devolvendo os tempos de cada etapa."""
+    inicio = time.perf_counter()
+    lab = labirinto.gerar_labirinto(tamanho, tamanho, algoritmo, SEMENTE)
+    gerado = time.perf_counter()
+    caminho = solucionador.resolver(lab)
+    resolvido = time.perf_counter()
+    return lab, caminho, gerado - inicio, resolvido - gerado
+
+
+def main():
+    """Mede as duas rodadas e confere que o cache devolve o mesmo labirinto e caminho."""
+    tamanho = int(sys.argv[1]) if len(sys.argv) > 1 else TAMANHO
+    algoritmo = sys.argv[2] if len(sys.argv) > 2 else 'escavacao'
+
+    with tempfile.TemporaryDirectory() as pasta:
+        cache_labirintos.pasta = pasta
+        lab, caminho, geracao, solucao = rodada(tamanho, algoritmo)
+        print(f"sem cache: geração {geracao:.3f}s, solução {solucao:.3f}s")
+        lab_cache, caminho_cache, geracao, solucao = rodada(tamanho, algoritmo)
+        print(f"com cache: geração {geracao:.3f}s, solução {solucao:.3f}s")
+        assert lab_cache == lab and caminho_cache == caminho
+
+
+if __name__ == '__main__':
+    main()
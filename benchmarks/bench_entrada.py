@@ -0,0 +1,95 @@
+# bench_entrada
+"""
+Simula uma seta segurada (repetição de tecla) e mede quadros e latência.
+
+Uma fonte de comandos falsa envia teclas na taxa de repetição escolhida para o laço
+de `jogador.aguardar_movimento`, num labirinto grande e sem saída por
+perto. Ao final mostra quantos quadros foram desenhados para quantos
+movimentos e quanto tempo o último movimento levou para chegar à tela.
+Execute a partir da raiz do projeto:
+
+    python -m benchmarks.bench_entrada [teclas por segundo] [fps]
+"""
+import asyncio
+import os
+import sys
+import time
+
+from rich.console import Console
+
+from aventura_pkg import entrada, jogador, labirinto
+
+TECLAS_POR_SEGUNDO = 200
+DURACAO = 2.0  # segundos com a tecla segurada
+TAMANHO = 1001
+
+
+class TecladoFalso:
+    """Fonte de comandos falsa: uma tarefa do laço de eventos envia as teclas."""
+
+    def __init__(self, taxa, registro):
+        self.taxa = taxa
+        self.registro = registro
+        self._fila = None
+        self._tarefa = None
+
+    async def _enviar(self):
+        fim = time.monotonic() + DURACAO
+        direcoes = ["down", "up"]  # vai e volta no corredor
+        k = 0
+        while time.monotonic() < fim:
+            self._fila.put_nowait(direcoes[k % 2])
+            self.registro["ultima_tecla"] = time.monotonic()
+            k += 1
+            await asyncio.sleep(1 / self.taxa)
+        await asyncio.sleep(0.5)  # solta a tecla antes de sair
+        self._fila.put_nowait(entrada.SAIR)
+
+    async def ler_comandos_async(self):
+        if self._tarefa is None:
+            self._fila = asyncio.Queue()
+            self._tarefa = asyncio.create_task(self._enviar())
+        comandos = [await self._fila.get()]
+        while not self._fila.empty():
+            comandos.append(self._fila.get_nowait())
+        return comandos
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, rastro):
+        if self._tarefa is not None:
+            self._tarefa.cancel()
+
+
+def main():
+    """Joga com o teclado falso e imprime quadros, movimentos e latência."""
+    taxa = int(sys.argv[1]) if len(sys.argv) > 1 else TECLAS_POR_SEGUNDO
+    fps = int(sys.argv[2]) if len(sys.argv) > 2 else jogador.QUADROS_POR_SEGUNDO
+
+    nulo = open(os.devnull, "w", encoding="utf-8")
+    silencioso = Console(file=nulo, force_terminal=True, width=200, height=60)
+    jogador.console = jogador.renderizador.console = silencioso
+    jogador.configurar_som(False)
+
+    registro = {"quadros": 0}
+    desenhar = jogador.renderizador.desenhar
+
+    def contar(*args, **kwargs):
+        registro["quadros"] += 1
+        registro["ultimo_quadro"] = time.monotonic()
+        desenhar(*args, **kwargs)
+
+    jogador.renderizador.desenhar = contar
+
+    lab = labirinto.gerar_labirinto_arvore_binaria(TAMANHO, TAMANHO, 1)
+    jogador.iniciar_jogador("facil", lab)
+    jogador.aguardar_movimento(lab, fps, TecladoFalso(taxa, registro))
+
+    latencia = registro["ultimo_quadro"] - registro["ultima_tecla"]
+    print(f"{taxa} teclas/s a {fps} fps: {jogador.movimentos} movimentos em {registro['quadros']} quadros; "
+          f"último quadro {latencia * 1e3:.1f}ms depois da última tecla")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+# bench_gerador
+"""
+Mede o tempo de geração dos algoritmos de `aventura_pkg.labirinto`.
+
+Execute a partir da raiz do projeto:
+
+    python -m benchmarks.bench_gerador [tamanho ...]
+"""
+import sys
+import time
+
+from aventura_pkg import labirinto
+
+TAMANHOS = [31, 1001, 2001, 10001]
+
+# Maior tamanho medido para os algoritmos com laço Python por célula
+# (a escavação com pilha leva minutos acima disso)
+LIMITES = {
+    'escavacao': 2001,
+    'eller': 2001,
+}
+
+
+def main():
+    """Gera labirintos de tamanhos crescentes com cada algoritmo e imprime os tempos."""
+    tamanhos = [int(t) for t in sys.argv[1:]] or TAMANHOS
+    print(f"{'tamanho':>13} " + " ".join(f"{nome:>15}" for nome in labirinto.GERADORES))
+    for tamanho in tamanhos:
+        colunas = []
+        for nome, gerar in labirinto.GERADORES.items():
+            if tamanho > LIMITES.get(nome, tamanho):
+                colunas.append(f"{'-':>15}")
+                continue
+            inicio = time.perf_counter()
+            gerar(tamanho, tamanho)
+            colunas.append(f"{time.perf_counter() - inicio:>14.3f}s")
+        print(f"{tamanho:>6}x{tamanho:<6} " + " ".join(colunas))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+# bench_importacao
+"""
+Mede o tempo de importação de `aventura_pkg.jogador` em um processo novo.
+
+Compara a importação atual, com áudio sob demanda, com o trabalho que a
+versão anterior fazia ao importar o módulo (pygame.init(), mixer e
+decodificação dos três MP3). Execute a partir da raiz do projeto:
+
+    python -m benchmarks.bench_importacao [repeticoes]
+"""
+import statistics
+import subprocess
+import sys
+import time
+
+REPETICOES = 5
+
+ANTES = """
+import pygame
+pygame.init()
+pygame.mixer.init()
+for nome in ("passo", "vitoria", "saida"):
+    pygame.mixer.Sound(f"sons/{nome}.mp3")
+import aventura_pkg.jogador
+"""
+
+DEPOIS = "import aventura_pkg.jogador"
+
+
+def medir(codigo, repeticoes):
+    """Executa `codigo` em processos novos e retorna a mediana, em milissegundos."""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        subprocess.run([sys.executable, "-c", codigo], check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    return statistics.median(tempos)
+
+
+def main():
+    """Imprime o tempo de importação antes e depois do áudio sob demanda."""
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else REPETICOES
+    vazio = medir("pass", repeticoes)
+    antes = medir(ANTES, repeticoes)
+    depois = medir(DEPOIS, repeticoes)
+    for rotulo, tempo in [
+        ("Interpretador vazio", vazio),
+        ("Antes (pygame na importação)", antes),
+        ("Depois (áudio sob demanda)", depois),
+    ]:
+        print(f"{rotulo + ':':<30} {tempo:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+# bench_limpar_tela
+"""
+Compara o custo de limpar a tela com `os.system` e com o `Console.clear()` do Rich.
+
+A saída de ambos é descartada para não poluir o terminal. Execute a
+partir da raiz do projeto:
+
+    python -m benchmarks.bench_limpar_tela [quadros]
+"""
+import io
+import os
+import sys
+import time
+
+from rich.console import Console
+
+QUADROS = 200
+
+
+def por_quadro(funcao, quadros):
+    """Executa `funcao` `quadros` vezes e retorna o tempo médio em milissegundos."""
+    inicio = time.perf_counter()
+    for _ in range(quadros):
+        funcao()
+    return (time.perf_counter() - inicio) / quadros * 1000
+
+
+def main():
+    """Mede o custo médio por quadro das duas formas de limpar a tela."""
+    quadros = int(sys.argv[1]) if len(sys.argv) > 1 else QUADROS
+    comando = 'cls > NUL' if os.name == 'nt' else 'clear > /dev/null'
+    console = Console(file=io.StringIO(), force_terminal=True)
+
+    processo = por_quadro(lambda: os.system(comando), quadros)
+    em_processo = por_quadro(console.clear, quadros)
+
+    print(f"os.system('{comando}'): {processo:8.3f} ms/quadro")
+    print(f"Console.clear():{' ' * (len(comando) - 3)}{em_processo:8.3f} ms/quadro")
+    print(f"Ganho: {processo / em_processo:.0f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+# bench_ranking
+"""
+Carrega milhões de resultados sintéticos no ranking e mede as consultas.
+
+Grava os resultados em lotes num banco temporário, mostra o plano de
+cada consulta (para conferir que os índices são usados) e mede a mediana
+e o p99 de cada uma. Por fim, compara o custo de `registrar` para quem
+chama com uma gravação com commit a cada resultado. Execute a partir da
+raiz do projeto:
+
+    python -m benchmarks.bench_ranking [resultados]
+"""
+import itertools
+import os
+import random
+import shutil
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+from aventura_pkg.partida import CUSTO_MOVIMENTO, PONTUACAO_INICIAL
+from aventura_pkg.ranking import Ranking
+
+RESULTADOS = 2_000_000
+LOTE = 100_000
+JOGADORES = 100_000
+SEMENTES = 100_000
+CONSULTAS = 2_000
+REGISTROS = 10_000
+
+
+def resultados_sinteticos(total, semente=0):
+    """Gera (nome, dificuldade, pontuacao, movimentos, semente, data) plausíveis."""
+    sorteio = random.Random(semente)
+    dificuldades = list(PONTUACAO_INICIAL)
+    agora = time.time()
+    for _ in range(total):
+        dificuldade = sorteio.choice(dificuldades)
+        inicial = PONTUACAO_INICIAL[dificuldade]
+        movimentos = sorteio.randint(20, inicial // CUSTO_MOVIMENTO)
+        yield (f"jogador{sorteio.randrange(JOGADORES)}", dificuldade, inicial - movimentos * CUSTO_MOVIMENTO,
+               movimentos, sorteio.randrange(SEMENTES), agora - sorteio.random() * 86400 * 365)
+
+
+def medir(nome, funcao, argumentos):
+    """Executa `funcao` com cada tupla de `argumentos` e imprime mediana e p99, em microssegundos."""
+    tempos = []
+    for args in argumentos:
+        inicio = time.perf_counter()
+        funcao(*args)
+        tempos.append((time.perf_counter() - inicio) * 1e6)
+    quantis = statistics.quantiles(tempos, n=100)
+    print(f"{nome:<18} mediana {quantis[49]:7.1f}µs   p99 {quantis[98]:7.1f}µs")
+
+
+def main():
+    """Carrega os resultados, mede as consultas e o custo de registrar."""
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else RESULTADOS
+    pasta = tempfile.mkdtemp()
+    try:
+        ranking = Ranking(os.path.join(pasta, "ranking.sqlite3"))
+
+        inicio = time.perf_counter()
+        resultados = resultados_sinteticos(total)
+        for _ in range(0, total, LOTE):
+            ranking.registrar_lote(itertools.islice(resultados, LOTE))
+        duracao = time.perf_counter() - inicio
+        print(f"{total:,} resultados carregados em {duracao:.1f}s ({total / duracao:,.0f}/s)\n")
+
+        sorteio = random.Random(1)
+        dificuldades = list(PONTUACAO_INICIAL)
+        conexao = ranking._conexao()
+        consultas = {
+            "melhores": ("SELECT nome, pontuacao, movimentos, semente FROM resultados "
+                         "WHERE dificuldade = ? ORDER BY pontuacao DESC, id LIMIT ?", ("medio", 10)),
+            "mais_curtos": ("SELECT nome, dificuldade, movimentos, pontuacao FROM resultados "
+                            "WHERE semente = ? ORDER BY movimentos, id LIMIT ?", (42, 10)),
+            "posicao": ("SELECT COALESCE(SUM(quantidade), 0) FROM contagens "
+                        "WHERE dificuldade = ? AND pontuacao > ?", ("medio", 500)),
+            "posicao_jogador": ("SELECT MAX(pontuacao) FROM resultados WHERE nome = ? AND dificuldade = ?",
+                                ("jogador7", "medio")),
+        }
+        for nome, (sql, parametros) in consultas.items():
+            plano = "; ".join(linha[-1] for linha in conexao.execute("EXPLAIN QUERY PLAN " + sql, parametros))
+            print(f"{nome:<18} {plano}")
+        print()
+
+        medir("melhores(10)", ranking.melhores,
+              [(sorteio.choice(dificuldades), 10) for _ in range(CONSULTAS)])
+        medir("mais_curtos(10)", ranking.mais_curtos,
+              [(sorteio.randrange(SEMENTES), 10) for _ in range(CONSULTAS)])
+        medir("posicao", ranking.posicao,
+              [(d, sorteio.randrange(0, PONTUACAO_INICIAL[d], CUSTO_MOVIMENTO))
+               for d in (sorteio.choice(dificuldades) for _ in range(CONSULTAS))])
+        medir("posicao_jogador", ranking.posicao_jogador,
+              [(f"jogador{sorteio.randrange(JOGADORES)}", sorteio.choice(dificuldades)) for _ in range(CONSULTAS)])
+        print()
+
+        novos = list(resultados_sinteticos(REGISTROS, semente=2))
+        inicio = time.perf_counter()
+        for nome, dificuldade, pontuacao, movimentos, semente, _ in novos:
+            ranking.registrar(nome, dificuldade, pontuacao, movimentos, semente)
+        chamada = time.perf_counter() - inicio
+        ranking.encerrar()
+        gravacao = time.perf_counter() - inicio
+        print(f"registrar: {chamada / REGISTROS * 1e6:.1f}µs por chamada; "
+              f"{REGISTROS:,} gravados em lotes em {gravacao * 1e3:.0f}ms")
+
+        direta = sqlite3.connect(ranking.caminho)
+        direta.execute("PRAGMA synchronous = NORMAL")  # mesma durabilidade da thread de gravação
+        amostra = novos[:1000]
+        inicio = time.perf_counter()
+        for linha in amostra:
+            with direta:
+                direta.execute("INSERT INTO resultados (nome, dificuldade, pontuacao, movimentos, semente, data) "
+                               "VALUES (?, ?, ?, ?, ?, ?)", linha)
+        duracao = time.perf_counter() - inicio
+        direta.close()
+        print(f"commit a cada resultado: {duracao / len(amostra) * 1e6:.1f}µs por chamada")
+        ranking.fechar()
+    finally:
+        shutil.rmtree(pasta)
+
+
+if __name__ == '__main__':
+    main()
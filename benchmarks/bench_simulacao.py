@@ -0,0 +1,56 @@
+# bench_simulacao
+"""
+Mede quantos passos por segundo o `MotorLote` simula.
+
+Também confere, com ações aleatórias, que o motor em lote chega aos
+mesmos estados que `Partida.mover`. Execute a partir da raiz do projeto:
+
+    python -m benchmarks.bench_simulacao [sessoes] [passos]
+"""
+import random
+import sys
+import time
+
+from aventura_pkg import labirinto
+from aventura_pkg.partida import Partida
+from aventura_pkg.simulacao import ACOES, MotorLote
+
+SESSOES = 10_000
+PASSOS = 200
+
+
+def conferir(lab, sessoes=50, passos=500):
+    """Compara o motor em lote com `Partida` usando as mesmas ações aleatórias."""
+    motor = MotorLote(lab, sessoes, "medio")
+    partidas = [Partida(lab, "medio") for _ in range(sessoes)]
+    for _ in range(passos):
+        acoes = bytes(random.randrange(4) for _ in range(sessoes))
+        motor.passo(acoes)
+        for partida, acao in zip(partidas, acoes):
+            partida.mover(ACOES[acao])
+    for k, partida in enumerate(partidas):
+        assert motor.posicao(k) == partida.posicao
+        assert motor.pontuacoes[k] == partida.pontuacao
+        assert motor.movimentos[k] == partida.movimentos
+        assert bool(motor.terminadas[k]) == partida.fim_jogo
+
+
+def main():
+    """Confere o motor e imprime a vazão de passos simulados."""
+    sessoes = int(sys.argv[1]) if len(sys.argv) > 1 else SESSOES
+    passos = int(sys.argv[2]) if len(sys.argv) > 2 else PASSOS
+
+    lab = labirinto.gerar_labirinto_aleatorio(31, 31)
+    conferir(lab)
+
+    motor = MotorLote(lab, sessoes, "max-dificil")
+    lotes = [bytes(random.randrange(4) for _ in range(sessoes)) for _ in range(passos)]
+    inicio = time.perf_counter()
+    for acoes in lotes:
+        motor.passo(acoes)
+    segundos = time.perf_counter() - inicio
+    print(f"{sessoes} sessões x {passos} passos em {segundos:.2f}s: {sessoes * passos / segundos:,.0f} passos/s")
+
+
+if __name__ == '__main__':
+    main()
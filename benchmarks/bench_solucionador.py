@@ -0,0 +1,44 @@
+# bench_solucionador
+"""
+Mede o tempo de solução dos algoritmos de `aventura_pkg.solucionador`.
+
+O cache em disco de soluções fica desligado, para medir os algoritmos em
+si. Execute a partir da raiz do projeto:
+
+    python -m benchmarks.bench_solucionador
+"""
+import sys
+import time
+
+from aventura_pkg import labirinto, solucionador
+from aventura_pkg.cache_labirintos import cache_labirintos
+
+TAMANHOS = [31, 101, 251, 501, 1001, 2001]
+
+
+def medir(funcao, *args):
+    """Executa `funcao(*args)` e retorna (resultado, segundos)."""
+    inicio = time.perf_counter()
+    resultado = funcao(*args)
+    return resultado, time.perf_counter() - inicio
+
+
+def main():
+    """Gera labirintos de tamanhos crescentes e mede cada algoritmo."""
+    tamanhos = [int(t) for t in sys.argv[1:]] or TAMANHOS
+    cache_labirintos.ativo = False
+    print(f"{'tamanho':>11} {'geração':>9} " + " ".join(f"{nome:>10}" for nome in solucionador.ALGORITMOS) + "  passos")
+    for tamanho in tamanhos:
+        lab, t_geracao = medir(labirinto.gerar_labirinto_aleatorio, tamanho, tamanho)
+        tempos = []
+        passos = None
+        for nome in solucionador.ALGORITMOS:
+            caminho, segundos = medir(solucionador.resolver, lab, (1, 1), nome)
+            tempos.append(segundos)
+            if nome == 'bfs':
+                passos = len(caminho)
+        print(f"{tamanho:>5}x{tamanho:<5} {t_geracao:>8.3f}s " + " ".join(f"{t:>9.3f}s" for t in tempos) + f"  {passos}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+# bench_streaming
+"""
+Gera um labirinto muito alto com `gerar_linhas_eller`, gravando em fluxo.
+
+As linhas vão direto para os escritores de texto e binário, sem montar o
+labirinto em memória; o pico de memória residente (RSS) deve ficar igual
+para 10 mil ou 1 milhão de linhas. Execute a partir da raiz do projeto:
+
+    python -m benchmarks.bench_streaming [linhas] [colunas]
+"""
+import os
+import resource
+import sys
+import tempfile
+import time
+
+from aventura_pkg import labirinto
+from aventura_pkg.arquivo_labirinto import carregar_labirinto
+from aventura_pkg.grade import SAIDA
+
+LINHAS = 1_000_001
+COLUNAS = 21
+
+
+def pico_memoria_mib():
+    """Retorna o pico de memória residente do processo, em MiB (Linux e macOS)."""
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico / 2 ** 20 if sys.platform == 'darwin' else pico / 2 ** 10
+
+
+def main():
+    """Grava o labirinto nos dois formatos e imprime tempo, tamanho e pico de memória."""
+    linhas = int(sys.argv[1]) if len(sys.argv) > 1 else LINHAS
+    colunas = int(sys.argv[2]) if len(sys.argv) > 2 else COLUNAS
+    print(f"pico de memória antes: {pico_memoria_mib():.1f} MiB")
+
+    with tempfile.TemporaryDirectory() as pasta:
+        texto = os.path.join(pasta, "labirinto.txt")
+        inicio = time.perf_counter()
+        with open(texto, "wb") as saida:
+            labirinto.escrever_linhas_texto(labirinto.gerar_linhas_eller(linhas, colunas, 1), saida)
+        print(f"texto: {time.perf_counter() - inicio:.1f}s, {os.path.getsize(texto) / 2 ** 20:.1f} MiB")
+
+        binario = os.path.join(pasta, "labirinto.bin")
+        inicio = time.perf_counter()
+        labirinto.escrever_linhas_binario(labirinto.gerar_linhas_eller(linhas, colunas, 1), binario, linhas, colunas, 1)
+        print(f"binário: {time.perf_counter() - inicio:.1f}s, {os.path.getsize(binario) / 2 ** 20:.1f} MiB")
+
+        with carregar_labirinto(binario) as mapeado:
+            assert mapeado.celula(*mapeado.fim) == SAIDA
+    print(f"pico de memória depois: {pico_memoria_mib():.1f} MiB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+# bench_terminal
+"""
+Joga uma partida completa com `--entrada terminal` num pseudo-terminal.
+
+O jogo roda num processo filho ligado a um pty, sem servidor gráfico. O
+script abre as instruções e as interrompe com Enter, escolhe "Jogar",
+aperta ESC sozinho (a partida deve terminar), joga de novo o mesmo
+labirinto enviando as setas da solução, misturadas a teclas que devem
+ser ignoradas (Ctrl+seta e letras), confere o ranking e sai pelo menu.
+Mostra quanto tempo o primeiro quadro e a vitória levaram para aparecer.
+Execute a partir da raiz do projeto:
+
+    python -m benchmarks.bench_terminal [semente]
+"""
+import os
+import pty
+import select
+import sys
+import tempfile
+import time
+
+from aventura_pkg import labirinto, solucionador
+
+SEMENTE = 42
+LIMITE = 10.0  # segundos de espera por cada tela
+
+SEQUENCIAS = {(-1, 0): b"\x1b[A", (1, 0): b"\x1b[B", (0, 1): b"\x1b[C", (0, -1): b"\x1b[D"}
+RUIDO = b"\x1b[1;5Ax"  # Ctrl+seta para cima e uma letra: nenhum dos dois move o jogador
+
+
+def setas_da_solucao(semente):
+    """Retorna as sequências de escape que levam do início à saída do labirinto fácil."""
+    lab = labirinto.criar_labirinto("facil", "escavacao", semente)
+    caminho = solucionador.resolver(lab)
+    return [SEQUENCIAS[(b[0] - a[0], b[1] - a[1])] for a, b in zip(caminho, caminho[1:])]
+
+
+class Terminal:
+    """Lado de fora do pty: envia teclas e espera textos na tela do jogo."""
+
+    def __init__(self, fd):
+        self.fd = fd
+        self.tela = b""
+
+    def enviar(self, dados):
+        os.write(self.fd, dados)
+
+    def esperar(self, texto):
+        """Lê a saída até `texto` aparecer depois da última espera; retorna o instante em que apareceu."""
+        alvo = texto.encode("utf-8")
+        prazo = time.monotonic() + LIMITE
+        while alvo not in self.tela:
+            restante = prazo - time.monotonic()
+            if restante <= 0 or not select.select([self.fd], [], [], restante)[0]:
+                raise TimeoutError(f"{texto!r} não apareceu na tela.")
+            try:
+                self.tela += os.read(self.fd, 65536)
+            except OSError:  # o jogo terminou
+                raise TimeoutError(f"{texto!r} não apareceu na tela.") from None
+        instante = time.monotonic()
+        self.tela = self.tela[self.tela.index(alvo) + len(alvo):]
+        return instante
+
+    def drenar(self):
+        """Lê a saída até o jogo fechar o terminal."""
+        while True:
+            try:
+                if not os.read(self.fd, 65536):
+                    return
+            except OSError:
+                return
+
+
+def main():
+    """Joga pelo pty e imprime os tempos medidos."""
+    semente = int(sys.argv[1]) if len(sys.argv) > 1 else SEMENTE
+    setas = setas_da_solucao(semente)
+
+    pid, fd = pty.fork()
+    if pid == 0:
+        os.environ["AVENTURA_DADOS"] = tempfile.mkdtemp()  # ranking próprio, descartável
+        os.execvp(sys.executable, [
+            sys.executable, "main.py", "--name", "Robo", "--color", "green",
+            "--dificuldade", "facil", "--sem-som", "--entrada", "terminal", "--seed", str(semente),
+        ])
+
+    terminal = Terminal(fd)
+    terminal.esperar("Escolha uma opção")
+    terminal.enviar(b"1\n")
+    terminal.esperar("Pressione Enter para voltar ao menu")
+    terminal.enviar(b"\n")
+    terminal.esperar("Animação interrompida")
+
+    terminal.esperar("Escolha uma opção")
+    terminal.enviar(b"2\n")
+    terminal.esperar("Pressione ESC para sair")
+    terminal.enviar(b"\x1b")
+    terminal.esperar("Saindo do jogo")
+    terminal.esperar("Pressione Enter")
+    terminal.enviar(b"\n")
+
+    terminal.esperar("Escolha uma opção")
+    terminal.enviar(b"2\n")
+    terminal.esperar("Pressione ESC para sair")
+    inicio = time.monotonic()
+    terminal.enviar(setas[0])
+    terminal.esperar("Numero de movimentos")
+    primeiro_quadro = time.monotonic() - inicio
+    terminal.enviar(RUIDO.join(setas[1:]))
+    vitoria = terminal.esperar("Você venceu") - inicio
+    terminal.esperar("lugar no ranking")
+    terminal.esperar("Pressione Enter")
+    terminal.enviar(b"\n")
+    terminal.esperar("Escolha uma opção")
+    terminal.enviar(b"4\n")
+    terminal.esperar("Seu melhor resultado")
+    terminal.esperar("Escolha uma opção")
+    terminal.enviar(b"5\n")
+    terminal.drenar()
+    _, status = os.waitpid(pid, 0)
+
+    print(f"semente {semente}: {len(setas)} setas; primeiro quadro em {primeiro_quadro * 1e3:.1f}ms, "
+          f"vitória em {vitoria * 1e3:.1f}ms; código de saída {os.waitstatus_to_exitcode(status)}")
+
+
+if __name__ == '__main__':
+    main()
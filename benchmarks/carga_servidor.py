@@ -0,0 +1,160 @@
+# carga_servidor
+"""
+Gerador de carga para o servidor de partidas (`main.py --servir`).
+
+Sobe o servidor num processo separado, numa porta livre de 127.0.0.1, e
+abre milhares de conexões simultâneas a partir de um único laço de
+eventos. Cada conexão joga partidas seguidas: pede um labirinto de uma
+das sementes fixas, envia um movimento por vez pelo caminho da solução
+(calculada aqui a partir da mesma semente) e espera a resposta antes do
+próximo. Ao final, mostra movimentos por segundo e a latência de cada
+movimento (p50 e p99). Execute a partir da raiz do projeto:
+
+    python -m benchmarks.carga_servidor [conexões] [segundos]
+
+Para usar um servidor já em execução, passe `--porta`.
+"""
+import argparse
+import asyncio
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from aventura_pkg import labirinto, solucionador
+
+CONEXOES = 2000
+DURACAO = 10.0  # segundos medidos, depois que todas as conexões estão abertas
+DIFICULDADE = "facil"
+SEMENTES = range(16)
+
+LETRAS = {(-1, 0): "u", (1, 0): "d", (0, -1): "l", (0, 1): "r"}
+
+
+def letras_da_solucao(semente):
+    """Retorna os movimentos, em letras do protocolo, que levam do início à saída."""
+    lab = labirinto.criar_labirinto(DIFICULDADE, "escavacao", semente)
+    caminho = solucionador.resolver(lab)
+    return [LETRAS[(b[0] - a[0], b[1] - a[1])].encode() + b"\n" for a, b in zip(caminho, caminho[1:])]
+
+
+def aumentar_limite_arquivos(necessarios):
+    """Sobe o limite de descritores abertos até o máximo permitido, se preciso."""
+    try:
+        import resource
+    except ImportError:
+        return  # Windows: o limite de sockets é outro
+    atual, maximo = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if atual < necessarios:
+        novo = necessarios if maximo == resource.RLIM_INFINITY else min(necessarios, maximo)
+        resource.setrlimit(resource.RLIMIT_NOFILE, (novo, maximo))
+
+
+def subir_servidor():
+    """Inicia `main.py --servir` numa porta livre; retorna o processo e a porta."""
+    processo = subprocess.Popen(
+        [sys.executable, "main.py", "--servir", "--porta", "0"],
+        stdout=subprocess.PIPE, text=True,
+    )
+    linha = processo.stdout.readline()
+    encontrado = re.search(r":(\d+)", linha)
+    if encontrado is None:
+        processo.kill()
+        raise RuntimeError(f"O servidor não informou a porta: {linha!r}")
+    return processo, int(encontrado.group(1))
+
+
+async def jogador(porta, k, solucoes, liberar, registro):
+    """Uma conexão: joga partidas seguidas até o fim da medição."""
+    leitor, escritor = await asyncio.open_connection("127.0.0.1", porta)
+    registro["abertas"] += 1
+    await liberar.wait()
+    fim = registro["fim"]
+    latencias = registro["latencias"]
+    partida = 0
+    while time.monotonic() < fim:
+        semente = SEMENTES[(k + partida) % len(SEMENTES)]
+        escritor.write(f"NOVA {DIFICULDADE} {semente}\n".encode())
+        resposta = await leitor.readline()
+        if not resposta.startswith(b"SESSAO"):
+            raise RuntimeError(f"Resposta inesperada: {resposta!r}")
+        for movimento in solucoes[semente]:
+            antes = time.perf_counter()
+            escritor.write(movimento)
+            resposta = await leitor.readline()
+            latencias.append(time.perf_counter() - antes)
+            if resposta[:1] not in (b"M", b"V"):
+                raise RuntimeError(f"Resposta inesperada: {resposta!r}")
+        if resposta[:1] != b"V":
+            raise RuntimeError("A solução não terminou na saída.")
+        registro["vitorias"] += 1
+        partida += 1
+    escritor.write(b"SAIR\n")
+    await escritor.drain()
+    escritor.close()
+
+
+async def gerar_carga(porta, conexoes, duracao, solucoes):
+    """
+    Abre as conexões, libera todas juntas e espera o fim da medição.
+
+    Returns:
+        dict: Conexões abertas, vitórias, latências e duração real, em segundos.
+    """
+    registro = {"abertas": 0, "vitorias": 0, "latencias": []}
+    liberar = asyncio.Event()
+    tarefas = [asyncio.create_task(jogador(porta, k, solucoes, liberar, registro))
+               for k in range(conexoes)]
+    while registro["abertas"] < conexoes:
+        await asyncio.sleep(0.05)
+        for tarefa in tarefas:
+            if tarefa.done():
+                tarefa.result()  # propaga um erro de conexão
+
+    comeco = time.monotonic()
+    registro["fim"] = comeco + duracao
+    liberar.set()
+    await asyncio.gather(*tarefas)  # cada conexão termina a partida em andamento
+    registro["duracao"] = time.monotonic() - comeco
+    return registro
+
+
+def main():
+    """Gera a carga e imprime a vazão e a latência medidas."""
+    parser = argparse.ArgumentParser(description="Gerador de carga do servidor de partidas")
+    parser.add_argument("conexoes", type=int, nargs="?", default=CONEXOES)
+    parser.add_argument("segundos", type=float, nargs="?", default=DURACAO)
+    parser.add_argument("--porta", type=int, default=None, help="Porta de um servidor já em execução")
+    args = parser.parse_args()
+
+    solucoes = {semente: letras_da_solucao(semente) for semente in SEMENTES}
+    aumentar_limite_arquivos(args.conexoes + 64)  # o servidor herda o limite
+
+    pasta = tempfile.mkdtemp()
+    os.environ["AVENTURA_CACHE"] = pasta  # o servidor herda; não mexe no cache do usuário
+    processo = None
+    porta = args.porta
+    try:
+        if porta is None:
+            processo, porta = subir_servidor()
+        registro = asyncio.run(gerar_carga(porta, args.conexoes, args.segundos, solucoes))
+    finally:
+        if processo is not None:
+            processo.terminate()
+            processo.wait()
+        shutil.rmtree(pasta)
+
+    latencias = sorted(registro["latencias"])
+    quantis = statistics.quantiles(latencias, n=100)
+    print(f"{args.conexoes} conexões, {registro['duracao']:.1f}s: {len(latencias)} movimentos "
+          f"({len(latencias) / registro['duracao']:,.0f}/s), {registro['vitorias']} partidas vencidas")
+    print(f"latência por movimento: p50 {quantis[49] * 1e3:.2f}ms, p99 {quantis[98] * 1e3:.2f}ms, "
+          f"máxima {latencias[-1] * 1e3:.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
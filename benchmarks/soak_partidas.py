@@ -0,0 +1,101 @@
+# soak_partidas
+"""
+Joga milhares de partidas roteirizadas pelo laço de estados de `utils.executar_menu`.
+
+Cada partida segue a solução do labirinto até a saída, sem teclado e
+com a saída do terminal descartada. Ao final, verifica que a memória
+alocada, a profundidade da pilha e o número de threads não cresceram
+com o número de partidas. Execute a partir da raiz do projeto:
+
+    python -m benchmarks.soak_partidas [partidas]
+"""
+import argparse
+import inspect
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import tracemalloc
+
+from rich.console import Console
+
+from aventura_pkg import jogador, labirinto, solucionador, utils
+from aventura_pkg.ranking import ranking
+
+PARTIDAS = 10_000
+AQUECIMENTO = 1_000
+
+# Crescimento de memória tolerado entre o aquecimento e o fim, em bytes
+TOLERANCIA_MEMORIA = 256 * 1024
+
+DIRECOES = {(-1, 0): "up", (1, 0): "down", (0, -1): "left", (0, 1): "right"}
+
+
+def main():
+    """Executa as partidas e verifica que os recursos ficaram estáveis."""
+    partidas = int(sys.argv[1]) if len(sys.argv) > 1 else PARTIDAS
+    aquecimento = min(AQUECIMENTO, partidas // 2)
+
+    nulo = open(os.devnull, "w", encoding="utf-8")
+    silencioso = Console(file=nulo, force_terminal=True)
+    utils.console = labirinto.console = jogador.console = silencioso
+    jogador.renderizador.console = silencioso
+    jogador.configurar_som(False)
+
+    medidas = {"jogadas": 0, "pilha": set(), "threads": set()}
+
+    async def jogar_roteiro(lab):
+        """Substitui o teclado: percorre a solução do labirinto até a saída."""
+        medidas["pilha"].add(len(inspect.stack(0)))
+        if medidas["jogadas"]:  # a thread do ranking nasce na primeira vitória
+            medidas["threads"].add(threading.active_count())
+        caminho = solucionador.resolver(lab, jogador.jogador_pos)
+        for (i, j), (ni, nj) in zip(caminho, caminho[1:]):
+            jogador.mover(DIRECOES[(ni - i, nj - j)], lab)
+        assert jogador.fim_jogo, "a partida deveria terminar na saída"
+
+        medidas["jogadas"] += 1
+        if medidas["jogadas"] == aquecimento:
+            medidas["memoria_inicial"] = tracemalloc.get_traced_memory()[0]
+
+    jogador.aguardar_movimento_async = jogar_roteiro
+
+    # Menu: '2' (jogar) e Enter ao fim de cada partida; depois '5' (sair)
+    respostas = iter(["2", ""] * partidas + ["5"])
+
+    async def ler(_pergunta=""):
+        return next(respostas)
+
+    args = argparse.Namespace(name="Robo", color="green", dificuldade="facil", algoritmo="escavacao")
+
+    pasta = tempfile.mkdtemp()
+    ranking.caminho = os.path.join(pasta, "ranking.sqlite3")  # não mexe no ranking do usuário
+    os.environ["AVENTURA_CACHE"] = os.path.join(pasta, "cache")  # nem no cache do usuário
+
+    tracemalloc.start()
+    utils.exibir_menu(args, ler=ler)
+    memoria_final = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    vitorias = ranking.total("facil")
+    ranking.fechar()
+    shutil.rmtree(pasta)
+
+    crescimento = memoria_final - medidas["memoria_inicial"]
+    print(f"Partidas: {medidas['jogadas']}")
+    print(f"Profundidades de pilha observadas: {sorted(medidas['pilha'])}")
+    print(f"Threads ativas observadas: {sorted(medidas['threads'])}")
+    print(f"Vitórias no ranking: {vitorias}")
+    print(f"Memória após {aquecimento} partidas: {medidas['memoria_inicial'] / 1024:.1f} KiB")
+    print(f"Memória ao final: {memoria_final / 1024:.1f} KiB (crescimento {crescimento / 1024:+.1f} KiB)")
+
+    assert medidas["jogadas"] == partidas
+    assert vitorias == partidas, "alguma vitória não chegou ao ranking"
+    assert len(medidas["pilha"]) == 1, "a pilha cresceu entre partidas"
+    assert len(medidas["threads"]) == 1, "o número de threads cresceu entre partidas"
+    assert crescimento < TOLERANCIA_MEMORIA, "a memória cresceu entre partidas"
+    print("OK")
+
+
+if __name__ == '__main__':
+    main()
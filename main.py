@@ -1,17 +1,120 @@
 # main
 import argparse
+import asyncio
+import sys
 from rich.console import Console
-from aventura_pkg import utils, jogador
-from aventura_pkg.exportar_docstrings import exportar_docstrings_html
+from aventura_pkg import utils, jogador, labirinto
+from aventura_pkg.exportar_docstrings import TRADUTORES, exportar_docstrings_html
+from aventura_pkg.servidor import HOST_PADRAO, PORTA_PADRAO, executar_servidor
 
 console = Console()
 
-# Exporta as docstrings automaticamente ao iniciar o jogo
-try:
-    exportar_docstrings_html("aventura_pkg", "aventura_pkg.html")
-    console.print("[green]📄 Documentação atualizada com sucesso: [bold]aventura_pkg.html[/bold][/green]\n")
-except Exception as e:
-    console.print(f"[red]❌ Erro ao gerar documentação: {e}[/red]\n")
+# Menor lado de um labirinto: uma célula livre cercada de paredes
+MENOR_DIMENSAO = 3
+
+
+def inteiro_positivo(texto):
+    """
+    Converte um argumento que precisa ser um inteiro maior que zero, como `--fps`.
+
+    Raises:
+        argparse.ArgumentTypeError: Se o valor não for um inteiro positivo.
+    """
+    try:
+        valor = int(texto)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"valor inteiro inválido: {texto!r}") from None
+    if valor <= 0:
+        raise argparse.ArgumentTypeError("o valor deve ser maior que zero")
+    return valor
+
+
+def dimensao_labirinto(texto):
+    """
+    Converte o valor de `--tamanho` ou `--linhas`, recusando labirintos pequenos demais.
+
+    Raises:
+        argparse.ArgumentTypeError: Se o valor não for um inteiro >= MENOR_DIMENSAO.
+    """
+    try:
+        valor = int(texto)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"valor inteiro inválido: {texto!r}") from None
+    if valor < MENOR_DIMENSAO:
+        raise argparse.ArgumentTypeError(f"o labirinto precisa de pelo menos {MENOR_DIMENSAO} linhas e colunas")
+    return valor
+
+
+def gerar_documentacao(tradutor='google'):
+    """
+    Exporta as docstrings do pacote para `aventura_pkg.html`.
+
+    As traduções ficam em cache no disco, então só docstrings novas ou
+    alteradas dependem da rede, e só os módulos alterados desde a última
+    exportação são regenerados.
+
+    Args:
+        tradutor (str): Backend de tradução ('google' ou 'local', sem rede).
+    """
+    try:
+        exportar_docstrings_html("aventura_pkg", "aventura_pkg.html", incremental=True,
+                                 tradutor=TRADUTORES[tradutor]())
+        console.print("[green]📄 Documentação atualizada com sucesso: [bold]aventura_pkg.html[/bold][/green]\n")
+    except Exception as e:
+        console.print(f"[red]❌ Erro ao gerar documentação: {e}[/red]\n")
+
+
+def gerar_arquivo_labirinto(caminho, linhas, colunas, algoritmo='escavacao', semente=None, formato='binario'):
+    """
+    Gera um labirinto e o grava no formato binário ou de texto do jogo.
+
+    Com o algoritmo 'eller', as linhas são gravadas à medida que são
+    geradas, sem montar o labirinto em memória.
+
+    Args:
+        caminho (str): Arquivo de destino; '-' grava o texto na saída padrão.
+        linhas (int): Número de linhas do labirinto.
+        colunas (int): Número de colunas do labirinto.
+        algoritmo (str): Algoritmo de geração.
+        semente (int, opcional): Semente do gerador; por padrão, uma nova.
+        formato (str): 'binario' ou 'texto'.
+    """
+    if semente is None:
+        semente = labirinto.nova_semente()
+    if algoritmo == 'eller':
+        linhas_geradas = labirinto.gerar_linhas_eller(linhas, colunas, semente)
+    else:
+        lab = labirinto.gerar_labirinto(linhas, colunas, algoritmo, semente)
+        linhas_geradas = (lab.linha_bytes(i) for i in range(linhas))
+
+    if formato == 'binario':
+        labirinto.escrever_linhas_binario(linhas_geradas, caminho, linhas, colunas, semente)
+    elif caminho == '-':
+        labirinto.escrever_linhas_texto(linhas_geradas, sys.stdout.buffer)
+        return
+    else:
+        with open(caminho, 'wb') as saida:
+            labirinto.escrever_linhas_texto(linhas_geradas, saida)
+    console.print(f"[green]🧱 Labirinto {linhas}x{colunas} (semente {semente}) salvo em [bold]{caminho}[/bold][/green]\n")
+
+
+def servir_partidas(host, porta, algoritmo='escavacao'):
+    """
+    Hospeda partidas em rede até o processo ser interrompido (Ctrl+C).
+
+    Args:
+        host (str): Endereço em que o servidor escuta.
+        porta (int): Porta TCP; 0 escolhe uma porta livre.
+        algoritmo (str): Algoritmo de geração dos labirintos.
+    """
+    def anunciar(servidor):
+        console.print(f"[green]🌐 Servidor ouvindo em {servidor.host}:{servidor.porta}[/green]")
+        sys.stdout.flush()
+
+    try:
+        asyncio.run(executar_servidor(host, porta, algoritmo, anunciar))
+    except KeyboardInterrupt:
+        console.print("[yellow]Servidor encerrado.[/yellow]")
 
 
 def obter_dados_do_jogador():
@@ -66,10 +169,54 @@ def main():
     ], help='Nível de dificuldade')
     parser.add_argument('--som', dest='som', action='store_true', help='Ativa o som do jogo')
     parser.add_argument('--sem-som', dest='som', action='store_false', help='Desativa o som do jogo')
+    parser.add_argument('--algoritmo', type=str, default='escavacao', choices=[
+        'escavacao', 'arvore-binaria', 'eller'
+    ], help='Algoritmo de geração do labirinto')
+    parser.add_argument('--fps', type=inteiro_positivo, default=jogador.QUADROS_POR_SEGUNDO,
+                        help='Quadros por segundo, no máximo, desenhados durante a partida')
+    parser.add_argument('--entrada', type=str, default='pynput', choices=['pynput', 'terminal'],
+                        help="Fonte do teclado: 'pynput' (teclado do sistema) ou 'terminal' (entrada padrão, funciona por SSH)")
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Semente do labirinto; a mesma semente gera sempre o mesmo labirinto')
+    parser.add_argument('--arquivo', type=str, default=None,
+                        help='Joga o labirinto gravado neste arquivo (binário ou de texto)')
+    parser.add_argument('--gerar-arquivo', type=str, metavar='ARQUIVO', default=None,
+                        help='Gera um labirinto de --tamanho células, grava neste arquivo e sai')
+    parser.add_argument('--tamanho', type=dimensao_labirinto, default=1001,
+                        help='Linhas e colunas do labirinto gerado por --gerar-arquivo')
+    parser.add_argument('--linhas', type=dimensao_labirinto, default=None,
+                        help='Linhas do labirinto gerado por --gerar-arquivo (padrão: --tamanho)')
+    parser.add_argument('--formato', type=str, default='binario', choices=['binario', 'texto'],
+                        help='Formato do arquivo gerado por --gerar-arquivo')
+    parser.add_argument('--servir', action='store_true',
+                        help='Hospeda partidas em rede (protocolo de texto sobre TCP) em vez de jogar no terminal')
+    parser.add_argument('--host', type=str, default=HOST_PADRAO,
+                        help='Endereço em que --servir escuta (padrão: só conexões locais)')
+    parser.add_argument('--porta', type=int, default=PORTA_PADRAO,
+                        help='Porta TCP de --servir (0 escolhe uma porta livre)')
+    parser.add_argument('--gerar-docs', action='store_true', help='Gera a documentação HTML do pacote e sai')
+    parser.add_argument('--tradutor', type=str, default='google', choices=list(TRADUTORES),
+                        help='Backend de tradução usado por --gerar-docs')
     parser.set_defaults(som=True)
 
     args = parser.parse_args()
 
+    if args.gerar_docs:
+        gerar_documentacao(args.tradutor)
+        return
+
+    if args.servir:
+        servir_partidas(args.host, args.porta, args.algoritmo)
+        return
+
+    if args.gerar_arquivo:
+        gerar_arquivo_labirinto(args.gerar_arquivo, args.linhas or args.tamanho, args.tamanho,
+                                args.algoritmo, args.seed, args.formato)
+        return
+
+    if args.entrada == 'terminal' and not (sys.stdin and sys.stdin.isatty()):
+        parser.error("--entrada terminal exige que a entrada padrão seja um terminal")
+
     # Se não passou nada, entra no modo interativo
     if not (args.name and args.color and args.dificuldade):
         nome, cor, dificuldade, som_ativo = obter_dados_do_jogador()
@@ -80,6 +227,8 @@ def main():
 
     # Configura som globalmente
     jogador.configurar_som(args.som)
+    jogador.configurar_quadros(args.fps)
+    jogador.configurar_entrada(args.entrada)
     console.print(f"\n🌟 Bem-vindo(a), [bold {args.color}]{args.name}[/bold {args.color}]! Prepare-se para a aventura!", style=args.color)
 
     utils.exibir_menu(args)